@@ -1,22 +1,17 @@
 import os
+import hmac
+import json
 import logging
-logging.basicConfig(level=logging.DEBUG)
-from flask import Flask, render_template, redirect, url_for, flash, request, session
-from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+import sys
+import click
+from flask import Flask, render_template, redirect, url_for, flash, request, session, jsonify, Response, stream_with_context, g, abort, make_response
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from extensions import db
+
 # Set up logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Create SQLAlchemy Base
-class Base(DeclarativeBase):
-    pass
-
-# Initialize SQLAlchemy
-db = SQLAlchemy(model_class=Base)
-
 # Create Flask app
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev_secret_key")
@@ -29,20 +24,56 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_pre_ping": True,
 }
 
-# Initialize the app with the extension
+# The HTTP export of every stored profile is off unless an admin token is configured
+app.config["EXPORT_API_TOKEN"] = os.environ.get("EXPORT_API_TOKEN")
+
+# Initialize the app with the extension; tables are created by `flask init-db`, not at import
 db.init_app(app)
+import models  # noqa: F401
 
-with app.app_context():
-    # Import models
-    import models  # noqa: F401
-    
-    # Create tables
-    db.create_all()
+# Load the catalog on each process's first request, then rebuild it in the background when the
+# database or CATALOG_SOURCE_FILE changes
+from catalog_reloader import CatalogReloader, warm_catalog
+catalog_reloader = CatalogReloader(app, interval=int(os.environ.get("CATALOG_RELOAD_INTERVAL", "30")),
+                                   source_file=os.environ.get("CATALOG_SOURCE_FILE"))
+
+# Keep session data server-side; the cookie only carries an opaque session id
+from server_session import create_session_interface
+app.session_interface = create_session_interface(app, os.environ.get("SESSION_BACKEND", "database"))
 
 # Import routes and forms
-from forms import CareerForm, ComparisonForm, QuestionnaireForm
-from recommendation_engine import get_career_recommendations, get_career_roadmap, compare_careers
-from career_data import get_career_details, get_all_careers
+from forms import CareerForm, ComparisonForm, MultiComparisonForm, QuestionnaireForm, TransitionPathForm
+from recommendation_engine import MAX_COMPARED_CAREERS, get_career_roadmap, compare_careers, compare_many
+from result_cache import get_cached_recommendations, recommendation_cache
+from transition_planner import plan_career_transition
+from what_if import what_if_recommendations
+from batch import parse_profiles_csv, parse_profiles_json, recommend_batch
+from similarity import SIMILAR_CAREERS_K, similar_careers
+from career_search import SEARCH_RESULT_LIMIT, search_careers
+from career_filters import parse_filters
+from result_links import RESULT_MAX_AGE, decode_result_token, result_etag, result_url
+from export import EXPORT_FORMATS, export_recommendations, resume_export_file
+from catalog import catalog_registry, get_catalog, pin_catalog, release_catalog
+from catalog_store import bump_catalog_revision, load_source_file, seed_catalog
+from onet_import import import_onet
+from career_data import get_career_details
+from fragment_cache import career_fragment, fragment_cache, fragment_slot, skill_match_layers
+
+# Career panels in result.html are rendered once per career and served from the fragment cache
+app.jinja_env.globals.update(career_fragment=career_fragment, fragment_slot=fragment_slot,
+                             skill_match_layers=skill_match_layers)
+
+@app.before_request
+def pin_request_catalog():
+    # Serve the whole request from one catalog snapshot
+    catalog_reloader.ensure_started()
+    g.catalog_token = pin_catalog()
+
+@app.teardown_request
+def release_request_catalog(exception=None):
+    token = g.pop('catalog_token', None)
+    if token is not None:
+        release_catalog(token)
 
 # Route for home page
 @app.route('/')
@@ -71,20 +102,24 @@ def roadmap():
         years_experience = experience_map.get(experience_level, 0)
         
         # Basic validation
-        if career and experience_level and education and skills:
+        if career and not form.career.validate(form):
+            flash(form.career.errors[0], 'danger')
+        elif career and experience_level and education and skills:
             # Store in session for use in results page
-            session['selected_career'] = career
-            session['experience_level'] = experience_level
-            session['education_level'] = education
-            session['skills'] = skills
-            session['experience_years'] = years_experience
+            session['roadmap'] = {
+                'career': career,
+                'experience_level': experience_level,
+                'education_level': education,
+                'skills': skills,
+                'experience_years': years_experience,
+            }
             
             # Go directly to results page
             return redirect(url_for('roadmap_result'))
         else:
             flash('Please fill out all required fields', 'danger')
     
-    return render_template('roadmap.html', form=form, careers=get_all_careers())
+    return render_template('roadmap.html', form=form)
 
 # Routes for career comparison tool
 @app.route('/comparison', methods=['GET', 'POST'])
@@ -92,19 +127,102 @@ def comparison():
     form = ComparisonForm()
     
     if form.validate_on_submit():
-        career1 = form.career1.data
-        career2 = form.career2.data
-        session['career1'] = career1
-        session['career2'] = career2
-        
-        # Set default empty values for skills and education
-        session['skills'] = []
-        session['education_level'] = ''
-        session['experience_years'] = 0
+        # Comparisons start from empty skills and education
+        session['comparison'] = {
+            'career1': form.career1.data,
+            'career2': form.career2.data,
+            'skills': [],
+            'education_level': '',
+            'experience_years': 0,
+        }
         
         return redirect(url_for('comparison_result'))
+    elif form.is_submitted():
+        flash('Please choose both careers from the suggestions', 'danger')
     
-    return render_template('comparison.html', form=form, careers=get_all_careers())
+    return render_template('comparison.html', form=form)
+
+@app.route('/multi_comparison', methods=['GET', 'POST'])
+def multi_comparison():
+    form = MultiComparisonForm()
+    
+    if form.validate_on_submit():
+        careers = list(dict.fromkeys(career for career in form.careers.data if career))
+        if 2 <= len(careers) <= MAX_COMPARED_CAREERS:
+            # Comparisons start from empty skills and education
+            session['multi_comparison'] = {
+                'careers': careers,
+                'skills': [],
+                'education_level': '',
+                'experience_years': 0,
+            }
+            
+            return redirect(url_for('multi_comparison_result'))
+        flash(f'Please select between 2 and {MAX_COMPARED_CAREERS} careers to compare', 'danger')
+    
+    return render_template('multi_comparison.html', form=form, max_careers=MAX_COMPARED_CAREERS)
+
+@app.route('/api/compare')
+def compare_api():
+    # N-way comparison matrix as JSON, e.g. /api/compare?career=Nurse&career=Teacher&skill=writing
+    careers = list(dict.fromkeys(request.args.getlist('career')))
+    skills = request.args.getlist('skill')
+    education = request.args.get('education', '')
+    experience = request.args.get('experience_years', 0, type=int)
+    
+    if not 1 <= len(careers) <= MAX_COMPARED_CAREERS:
+        return jsonify({"error": f"Provide between 1 and {MAX_COMPARED_CAREERS} careers"}), 400
+    catalog = get_catalog()
+    unknown = [career for career in careers if career not in catalog]
+    if unknown:
+        return jsonify({"error": "Unknown career", "careers": unknown}), 404
+    
+    return jsonify(compare_many(careers, skills, education, experience))
+
+@app.route('/api/similar_careers')
+def similar_careers_api():
+    # Nearest careers by description, skills and environment, e.g. /api/similar_careers?career=Nurse
+    career = request.args.get('career', '')
+    limit = request.args.get('limit', 5, type=int)
+    
+    similar = similar_careers(career, limit=min(max(1, limit), SIMILAR_CAREERS_K))
+    if similar is None:
+        return jsonify({"error": "Unknown career", "career": career}), 404
+    return jsonify({"career": career, "similar_careers": similar})
+
+@app.route('/api/careers/search')
+def career_search_api():
+    # Typeahead suggestions for the career fields, e.g. /api/careers/search?q=data+sci
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', SEARCH_RESULT_LIMIT, type=int)
+    return jsonify({"query": query, "results": search_careers(query, limit=limit)})
+
+# Routes for career transition planner
+@app.route('/transition_path', methods=['GET', 'POST'])
+def transition_path():
+    form = TransitionPathForm()
+    
+    if form.validate_on_submit():
+        session['transition_path'] = {
+            'current_career': form.current_career.data,
+            'target_career': form.target_career.data,
+        }
+        
+        return redirect(url_for('transition_path_result'))
+    elif form.is_submitted():
+        flash('Please choose both careers from the suggestions', 'danger')
+    
+    return render_template('transition_path.html', form=form)
+
+@app.route('/api/transition_path')
+def transition_path_api():
+    # Cheapest multi-step path between two careers as JSON
+    current_career = request.args.get('from', '')
+    target_career = request.args.get('to', '')
+    plan = plan_career_transition(current_career, target_career)
+    if not plan['found']:
+        return jsonify({"error": "Unknown career", **plan}), 404
+    return jsonify(plan)
 
 # Routes for career recommendation system
 @app.route('/recommendation', methods=['GET', 'POST'])
@@ -118,12 +236,14 @@ def questionnaire():
     form = QuestionnaireForm()
     
     if form.validate_on_submit():
-        session['interests'] = form.interests.data
-        session['skills'] = form.skills.data
-        session['values'] = form.values.data
-        session['personality'] = form.personality.data
-        session['education'] = form.education.data
-        session['work_environment'] = form.work_environment.data
+        session['questionnaire'] = {
+            'interests': form.interests.data,
+            'skills': form.skills.data,
+            'values': form.values.data,
+            'personality': form.personality.data,
+            'education': form.education.data,
+            'work_environment': form.work_environment.data,
+        }
         
         return redirect(url_for('recommendation_result'))
     
@@ -133,15 +253,13 @@ def questionnaire():
 
 
 
-# Routes for results
-@app.route('/roadmap_result')
-def roadmap_result():
-    # Get data from session
-    career = session.get('selected_career')
-    experience_level = session.get('experience_level')
-    skills = session.get('skills', [])
-    education = session.get('education_level', '')
-    experience = session.get('experience_years', 0)
+# Result pages, rendered from a tool's answers held in the session or in a result link
+def render_roadmap_result(answers):
+    career = answers.get('career')
+    experience_level = answers.get('experience_level')
+    skills = answers.get('skills', [])
+    education = answers.get('education_level', '')
+    experience = answers.get('experience_years', 0)
     
     # Check if we have the necessary data
     if not career or not experience_level:
@@ -164,20 +282,19 @@ def roadmap_result():
                               result_type='roadmap',
                               career=career,
                               career_details=career_details,
-                              roadmap=roadmap)
+                              roadmap=roadmap,
+                              share_url=result_url('roadmap', answers))
     except Exception as e:
         app.logger.error(f"Error generating roadmap: {str(e)}")
         flash(f'Error generating roadmap: {str(e)}', 'danger')
         return redirect(url_for('roadmap'))
 
-@app.route('/comparison_result')
-def comparison_result():
-    # Get data from session
-    career1 = session.get('career1')
-    career2 = session.get('career2')
-    skills = session.get('skills', [])
-    education = session.get('education_level', '')
-    experience = session.get('experience_years', 0)
+def render_comparison_result(answers):
+    career1 = answers.get('career1')
+    career2 = answers.get('career2')
+    skills = answers.get('skills', [])
+    education = answers.get('education_level', '')
+    experience = answers.get('experience_years', 0)
     
     # Get career comparisons
     career1_details = get_career_details(career1)
@@ -190,31 +307,340 @@ def comparison_result():
                           career2=career2,
                           career1_details=career1_details,
                           career2_details=career2_details,
-                          comparison=comparison)
+                          comparison=comparison,
+                          share_url=result_url('comparison', answers))
 
-@app.route('/recommendation_result')
-def recommendation_result():
-    # Get questionnaire data from session
-    interests = session.get('interests', [])
-    skills = session.get('skills', [])
-    values = session.get('values', [])
-    personality = session.get('personality', '')
-    education = session.get('education', '')
-    work_environment = session.get('work_environment', [])
-    
-    # Get recommendations
-    recommendations = get_career_recommendations(
+def render_multi_comparison_result(answers):
+    careers = answers.get('careers', [])
+    skills = answers.get('skills', [])
+    education = answers.get('education_level', '')
+    experience = answers.get('experience_years', 0)
+    
+    if len(careers) < 2:
+        flash('Please select at least two careers to compare.', 'danger')
+        return redirect(url_for('multi_comparison'))
+    
+    comparison = compare_many(careers, skills, education, experience)
+    
+    return render_template('result.html',
+                          result_type='multi_comparison',
+                          comparison=comparison,
+                          share_url=result_url('multi_comparison', answers))
+
+def render_transition_path_result(answers):
+    current_career = answers.get('current_career')
+    target_career = answers.get('target_career')
+    
+    if not current_career or not target_career:
+        flash('Please select your current and target careers.', 'danger')
+        return redirect(url_for('transition_path'))
+    
+    plan = plan_career_transition(current_career, target_career)
+    
+    return render_template('result.html',
+                          result_type='transition_path',
+                          current_career=current_career,
+                          target_career=target_career,
+                          plan=plan,
+                          share_url=result_url('transition_path', answers))
+
+def render_recommendation_result(answers, shared=False):
+    interests = answers.get('interests', [])
+    skills = answers.get('skills', [])
+    values = answers.get('values', [])
+    personality = answers.get('personality', '')
+    education = answers.get('education', '')
+    work_environment = answers.get('work_environment', [])
+    
+    # Get recommendations, reusing cached results for identical answers
+    recommendations = get_cached_recommendations(
         interests, skills, values, personality, 
-        education, work_environment
+        education, work_environment, filters=answers.get('filters')
     )
     
+    # The what-if explorer works on the visitor's own questionnaire, so shared links leave it out
     return render_template('result.html',
                           result_type='recommendation',
-                          recommendations=recommendations)
+                          recommendations=recommendations,
+                          user_skills=skills,
+                          what_if_form=None if shared else QuestionnaireForm(),
+                          share_url=result_url('recommendation', answers))
+
+# Routes for results
+@app.route('/roadmap_result')
+def roadmap_result():
+    # Get the roadmap answers from session
+    return render_roadmap_result(session.get('roadmap', {}))
 
+@app.route('/comparison_result')
+def comparison_result():
+    # Get the comparison answers from session
+    return render_comparison_result(session.get('comparison', {}))
+
+@app.route('/multi_comparison_result')
+def multi_comparison_result():
+    # Get the multi-comparison answers from session
+    return render_multi_comparison_result(session.get('multi_comparison', {}))
+
+@app.route('/transition_path_result')
+def transition_path_result():
+    # Get the transition answers from session
+    return render_transition_path_result(session.get('transition_path', {}))
+
+@app.route('/recommendation_result')
+def recommendation_result():
+    # Get questionnaire data from session
+    answers = dict(session.get('questionnaire', {}))
+    
+    # Optional hard filters, e.g. ?min_salary=100000&min_growth=10&max_education=bachelor
+    try:
+        answers['filters'] = parse_filters(request.args.get('min_salary'), request.args.get('min_growth'),
+                                           request.args.get('max_education'))
+    except ValueError as e:
+        flash(str(e), 'danger')
+    
+    return render_recommendation_result(answers)
+
+@app.route('/results/<tool>/<token>')
+def shared_result(tool, token):
+    # Stateless result page: the inputs come from the signed token, so browsers and shared caches can reuse it
+    try:
+        answers = decode_result_token(tool, token)
+    except ValueError:
+        abort(404)
+    
+    etag = result_etag(tool, token, get_catalog())
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = make_response(SHARED_RESULT_PAGES[tool](answers))
+        if response.status_code != 200:
+            return response
+    
+    response.set_etag(etag)
+    if session.modified:
+        # Pending flash messages were rendered into this copy, so it must not be shared
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    else:
+        # Nothing from the visitor's session was rendered, so the copy can be shared whatever cookie they send;
+        # public responses never set the session cookie (see ServerSessionInterface.save_session)
+        session.accessed = False
+        response.cache_control.public = True
+        response.cache_control.max_age = RESULT_MAX_AGE
+    return response
+
+SHARED_RESULT_PAGES = {
+    'roadmap': render_roadmap_result,
+    'comparison': render_comparison_result,
+    'multi_comparison': render_multi_comparison_result,
+    'transition_path': render_transition_path_result,
+    'recommendation': lambda answers: render_recommendation_result(answers, shared=True),
+}
+
+@app.route('/api/recommendations')
+def recommendations_api():
+    # Recommendations as JSON, e.g. /api/recommendations?interest=technology&skill=math&min_salary=100000
+    try:
+        filters = parse_filters(request.args.get('min_salary'), request.args.get('min_growth'),
+                                request.args.get('max_education'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    recommendations = get_cached_recommendations(
+        request.args.getlist('interest'), request.args.getlist('skill'), request.args.getlist('value'),
+        request.args.get('personality', ''), request.args.get('education', ''),
+        request.args.getlist('work_environment'),
+        limit=min(max(1, request.args.get('limit', 5, type=int)), 25), filters=filters
+    )
+    return jsonify({"recommendations": recommendations})
+
+@app.route('/api/what_if', methods=['POST'])
+def what_if():
+    # Re-rank the questionnaire results with what-if changes applied
+    payload = request.get_json(silent=True) or {}
+    changes = payload.get('changes', [])
+    if not isinstance(changes, list):
+        return jsonify({"error": "changes must be a list"}), 400
+    
+    answers = session.get('questionnaire', {})
+    try:
+        result = what_if_recommendations(
+            answers.get('interests', []), answers.get('skills', []), answers.get('values', []),
+            answers.get('personality', ''), answers.get('education', ''), answers.get('work_environment', []),
+            changes
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    return jsonify(result)
+
+@app.route('/api/batch_recommendations', methods=['POST'])
+def batch_recommendations():
+    # Score a cohort of profiles uploaded as JSON or CSV; results stream back as NDJSON
+    limit = request.args.get('limit', 5, type=int)
+    upload = request.files.get('file')
+    
+    try:
+        if upload is not None:
+            profiles = parse_profiles_csv(upload.read().decode('utf-8-sig'))
+        elif request.mimetype == 'text/csv':
+            profiles = parse_profiles_csv(request.get_data(as_text=True))
+        else:
+            profiles = parse_profiles_json(request.get_json(silent=True))
+        results = recommend_batch(profiles, limit=max(1, limit))
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+    
+    def generate():
+        for result in results:
+            yield json.dumps(result) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def is_export_admin():
+    """Whether the request carries the configured export token as a bearer token"""
+    token = app.config.get("EXPORT_API_TOKEN")
+    header = request.headers.get('Authorization', '')
+    return bool(token) and header.startswith('Bearer ') and hmac.compare_digest(header[len('Bearer '):], token)
+
+@app.route('/export/recommendations')
+def export_recommendations_route():
+    # Stream recommendations for every stored profile; resume with ?after_id=<last profile_id>
+    # Admin only: the route does not exist unless EXPORT_API_TOKEN is set
+    if not app.config.get("EXPORT_API_TOKEN"):
+        abort(404)
+    if not is_export_admin():
+        return jsonify({"error": "Export requires an admin token"}), 401
+    
+    export_format = request.args.get('format', 'ndjson')
+    after_id = request.args.get('after_id', 0, type=int)
+    limit = request.args.get('limit', 5, type=int)
+    
+    try:
+        chunks = export_recommendations(export_format, after_id=after_id, limit=max(1, limit),
+                                        header=after_id == 0)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = Response(stream_with_context(chunks), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename=recommendations.{export_format}'
+    return response
+
+@app.cli.command('export-recommendations')
+@click.option('--format', 'export_format', type=click.Choice(EXPORT_FORMATS), default='ndjson')
+@click.option('--output', type=click.Path(dir_okay=False), help='File to write; defaults to stdout')
+@click.option('--after-id', type=int, default=0, help='Only export profiles with a greater id')
+@click.option('--resume', is_flag=True, help='Append to --output after the last profile it contains')
+@click.option('--limit', type=int, default=5, help='Recommendations per profile')
+def export_recommendations_command(export_format, output, after_id, resume, limit):
+    """Export recommendations for all stored user profiles."""
+    # Commands skip before_request, so load the catalog the servers would score against
+    catalog_reloader.check(warm=False)
+    if resume:
+        if not output:
+            raise click.UsageError('--resume needs --output')
+        after_id = max(after_id, resume_export_file(output, export_format))
+        logger.info(f"Resuming export after profile {after_id}")
+    
+    append = resume and after_id > 0
+    chunks = export_recommendations(export_format, after_id=after_id, limit=limit, header=not append)
+    handle = open(output, 'a' if append else 'w', newline='') if output else sys.stdout
+    try:
+        for chunk in chunks:
+            handle.write(chunk)
+    finally:
+        if output:
+            handle.close()
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create any missing database tables."""
+    init_db()
+    click.echo("Database tables are up to date")
+
+@app.cli.command('seed-catalog')
+@click.option('--file', 'path', type=click.Path(exists=True, dir_okay=False),
+              help='JSON or CSV file of careers; defaults to the built-in career data')
+@click.option('--batch-size', type=int, default=500, help='Careers per transaction')
+def seed_catalog_command(path, batch_size):
+    """Upsert the career catalog into the database."""
+    source = load_source_file(path) if path else None
+    written = seed_catalog(source, batch_size=batch_size)
+    click.echo(f"Seeded {written} careers")
+
+@app.cli.command('import-onet')
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--chunk-size', type=int, default=200, help='Occupations per transaction')
+def import_onet_command(directory, chunk_size):
+    """Import an O*NET database directory into the career tables."""
+    try:
+        counts = import_onet(directory, chunk_size=chunk_size)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    for name, rows in counts.items():
+        click.echo(f"Imported {rows} {name} rows")
+
+@app.cli.command('reload-catalog')
+def reload_catalog_command():
+    """Tell running servers to rebuild the career catalog from the database."""
+    revision = bump_catalog_revision()
+    click.echo(f"Catalog revision is now {revision}; servers reload within {catalog_reloader.interval}s")
+
+@app.route('/api/cache_stats')
+def cache_stats():
+    # Expose result and fragment cache counters and the catalog they are keyed on for monitoring
+    catalog = get_catalog()
+    return jsonify({
+        "catalog": {"version": catalog.version, "generation": catalog.generation, "careers": len(catalog)},
+        "recommendations": recommendation_cache.stats(),
+        "fragments": fragment_cache.stats(),
+    })
+
+
+def init_db():
+    """Create any missing tables; run once per deploy (`flask init-db`) rather than on every start"""
+    with app.app_context():
+        db.create_all()
+
+def configure_logging():
+    """Set up root logging once per process; LOG_LEVEL overrides the DEBUG default"""
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "DEBUG").upper())
+
+def preload_app():
+    """
+    Do the work of the first request ahead of time, for a pre-fork hook.
+
+    Loads the catalog, builds its indexes and compiles the page templates, so
+    forked workers start warm and share the memory instead of each building
+    their own copy.
+    """
+    catalog_reloader.check(warm=False)
+    warm_catalog(catalog_registry.current())
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        app.jinja_env.get_template(name)
+    
+    # Connections opened while loading must not be shared with forked workers
+    with app.app_context():
+        db.engine.dispose()
 
+def create_app(preload=False):
+    """
+    Return the app ready to serve.
 
+    Importing this module only builds the app and its routes, and nothing
+    touches the database until the first request loads the catalog. Tables are
+    created by `flask init-db`, never here, whatever the database.
 
+    Args:
+        preload: Load the catalog and build its indexes now instead of on the first request
+    """
+    configure_logging()
+    if preload:
+        preload_app()
+    return app
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    init_db()
+    create_app().run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,200 @@
+# Batch module - recommendations for whole cohorts of questionnaire answers
+#
+# Counselors upload a cohort as CSV or JSON and every profile is scored against
+# the catalog in one call. Small batches run in-process; large ones are split
+# into chunks and spread over a pool of spawned worker processes. Each worker
+# rebuilds the catalog and its scoring indexes once when it starts and keeps
+# them for the life of the pool. Workers are spawned rather than forked, so
+# they never inherit a web worker's threads, locks, listening socket or
+# database connections. Results are yielded as chunks complete so they can be
+# streamed.
+
+import atexit
+import csv
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from catalog import get_catalog
+from course_catalog import get_course_catalog
+from recommendation_engine import get_career_recommendations
+from scoring import get_scoring_index
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+PROFILE_FIELDS = ["interests", "skills", "values", "personality", "education", "work_environment"]
+LIST_PROFILE_FIELDS = ["interests", "skills", "values", "work_environment"]
+CSV_LIST_SEPARATOR = ";"
+
+MAX_BATCH_PROFILES = 10000
+POOL_MIN_PROFILES = 200         # Smaller batches are not worth shipping to worker processes
+# Each web worker gets its own pool, so by default the CPUs are split between them
+POOL_WORKERS = (int(os.environ.get("BATCH_POOL_WORKERS", "0"))
+                or max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_CONCURRENCY", "1"))))
+CHUNKS_PER_WORKER = 4
+
+def _split_list(value):
+    """Turn a CSV cell or JSON value into a list of answers"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    raise ValueError(f"Expected a list or a {CSV_LIST_SEPARATOR!r}-separated string, got {type(value).__name__}")
+
+def normalize_profile(raw):
+    """
+    Validate one uploaded profile.
+
+    Args:
+        raw: Mapping with the questionnaire fields; list fields may be lists or
+            semicolon-separated strings, and an optional "id" is passed through
+
+    Returns:
+        Dictionary with "id" and the questionnaire fields
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Each profile must be an object")
+    profile = {"id": raw.get("id")}
+    for field in PROFILE_FIELDS:
+        if field in LIST_PROFILE_FIELDS:
+            profile[field] = _split_list(raw.get(field))
+        else:
+            profile[field] = str(raw.get(field) or "").strip()
+    return profile
+
+def parse_profiles_csv(text):
+    """Parse a CSV upload with a header row naming the questionnaire fields"""
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [field for field in PROFILE_FIELDS if field not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+    return [normalize_profile(row) for row in reader]
+
+def parse_profiles_json(data):
+    """Parse a JSON upload: a list of profiles or an object with a "profiles" list"""
+    if isinstance(data, dict):
+        data = data.get("profiles")
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of profiles")
+    return [normalize_profile(item) for item in data]
+
+def _recommend_profile(catalog, index, profile, limit):
+    """Batch result for one profile"""
+    recommendations = get_career_recommendations(
+        profile["interests"], profile["skills"], profile["values"], profile["personality"],
+        profile["education"], profile["work_environment"], limit=limit, catalog=catalog)
+    return {
+        "index": index,
+        "id": profile["id"],
+        "recommendations": [
+            {
+                "career": recommendation["career"],
+                "score": recommendation["score"],
+                "match_reasons": recommendation["match_reasons"],
+                "course_recommendations": recommendation["course_recommendations"],
+            }
+            for recommendation in recommendations
+        ],
+    }
+
+# Catalog rebuilt by each pool worker when it starts
+_worker_catalog = None
+
+def _recommend_chunk(chunk, limit):
+    """Score a chunk of (index, profile) pairs inside a worker process"""
+    catalog = _worker_catalog if _worker_catalog is not None else get_catalog()
+    return [_recommend_profile(catalog, index, profile, limit) for index, profile in chunk]
+
+def _warm(catalog):
+    """Build the catalog indexes batch scoring reads"""
+    get_scoring_index(catalog)
+    get_course_catalog(catalog)
+
+def _init_worker(catalog):
+    """Pool worker initializer: keep the catalog it was sent, with its indexes built"""
+    global _worker_catalog
+    _warm(catalog)
+    _worker_catalog = catalog
+
+_pool = None
+_pool_catalog = None
+_pool_lock = threading.Lock()
+
+def get_pool(catalog, workers=None):
+    """
+    Return the process pool for a catalog, creating it on first use.
+
+    Workers are spawned with the catalog's source and build their own copy
+    once. A pool is kept for the most recent catalog only, and is shut down
+    when the process exits.
+    """
+    global _pool, _pool_catalog
+    with _pool_lock:
+        if _pool is not None and _pool_catalog is catalog:
+            return _pool
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=workers or POOL_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                                    initializer=_init_worker, initargs=(catalog,))
+        _pool_catalog = catalog
+        logger.debug(f"Started batch pool with {_pool._max_workers} workers for catalog {catalog.version}")
+        return _pool
+
+def shutdown_pool():
+    """Stop the batch worker processes"""
+    global _pool, _pool_catalog
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
+        _pool_catalog = None
+
+atexit.register(shutdown_pool)
+
+def _iter_batch(profiles, limit, catalog, pool):
+    """Yield batch results, in-process or from the pool's chunks as they finish"""
+    if pool is None:
+        for index, profile in enumerate(profiles):
+            yield _recommend_profile(catalog, index, profile, limit)
+        return
+
+    indexed = list(enumerate(profiles))
+    chunk_size = max(1, -(-len(indexed) // (pool._max_workers * CHUNKS_PER_WORKER)))
+    futures = [pool.submit(_recommend_chunk, indexed[start:start + chunk_size], limit)
+               for start in range(0, len(indexed), chunk_size)]
+    for future in as_completed(futures):
+        yield from future.result()
+
+def recommend_batch(profiles, limit=5, catalog=None, use_pool=None, workers=None):
+    """
+    Recommend careers for many profiles.
+
+    Args:
+        profiles: List of profiles from normalize_profile()
+        limit: Recommendations per profile
+        catalog: Catalog to score against; defaults to the process-wide catalog
+        use_pool: Force (True) or skip (False) the process pool; by default
+            batches of POOL_MIN_PROFILES or more use it
+        workers: Worker processes when a new pool is started
+
+    Returns:
+        Iterator of dictionaries with the profile's index in the batch, its id
+        and its recommendations; with a pool they arrive in completion order
+        rather than batch order
+
+    Raises:
+        ValueError: If the batch has more than MAX_BATCH_PROFILES profiles
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    if len(profiles) > MAX_BATCH_PROFILES:
+        raise ValueError(f"At most {MAX_BATCH_PROFILES} profiles can be scored in one batch")
+    if use_pool is None:
+        use_pool = len(profiles) >= POOL_MIN_PROFILES
+    pool = get_pool(catalog, workers) if use_pool else None
+    return _iter_batch(profiles, limit, catalog, pool)
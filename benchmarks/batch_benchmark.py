@@ -0,0 +1,44 @@
+"""
+Benchmark batch recommendation throughput on synthetic catalogs.
+
+Scores the same cohort in-process and on the spawned process pool and reports
+profiles per second for each. Run from the repository root:
+
+    python -m benchmarks.batch_benchmark [--sizes 20,1000,10000] [--profiles 2000]
+"""
+
+import argparse
+import os
+import time
+
+from batch import recommend_batch, shutdown_pool
+from benchmarks.synthetic_catalog import build_synthetic_catalog, generate_profiles
+
+def throughput(catalog, profiles, limit, use_pool, workers):
+    """Return profiles scored per second"""
+    start = time.perf_counter()
+    count = sum(1 for _ in recommend_batch(profiles, limit=limit, catalog=catalog,
+                                           use_pool=use_pool, workers=workers))
+    return count / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="20,1000,10000", help="Comma-separated catalog sizes")
+    parser.add_argument("--profiles", type=int, default=2000, help="Profiles per batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Pool worker processes")
+    parser.add_argument("--limit", type=int, default=5, help="Recommendations per profile")
+    args = parser.parse_args()
+
+    profiles = [{"id": index, **profile} for index, profile in enumerate(generate_profiles(args.profiles, seed=1))]
+    print(f"{'careers':>8} {'inline/s':>10} {'pool/s':>10} {'speedup':>8}   ({args.workers} workers)")
+    for size in (int(size) for size in args.sizes.split(",")):
+        catalog = build_synthetic_catalog(size)
+        inline = throughput(catalog, profiles, args.limit, use_pool=False, workers=args.workers)
+        # The first pool batch spawns and warms the workers; time a second one
+        throughput(catalog, profiles[:args.workers], args.limit, use_pool=True, workers=args.workers)
+        pooled = throughput(catalog, profiles, args.limit, use_pool=True, workers=args.workers)
+        print(f"{size:>8} {inline:>10.0f} {pooled:>10.0f} {pooled / inline:>7.1f}x")
+        shutdown_pool()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark the rendered-fragment cache on result pages.
+
+Renders the recommendation page (five career cards) and the comparison page
+for a stream of visitors with different answers, once with the fragment cache
+disabled and once with it enabled, and prints the median page latency and the
+cache's own counters. Run from the repository root:
+
+    python -m benchmarks.fragment_benchmark [--visitors 300]
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import time
+
+from app import app
+from career_data import get_all_careers, get_career_details
+from fragment_cache import fragment_cache
+from result_links import encode_result_token
+
+INTERESTS = ["technology", "science", "healthcare", "business", "arts", "education", "engineering"]
+VALUES = ["salary", "work_life_balance", "helping_others", "creativity", "stability"]
+PERSONALITIES = ["analytical", "creative", "social", "practical"]
+
+def visitor_pages(count, seed=0):
+    """Result page URLs for a stream of visitors, alternating recommendation and comparison"""
+    rng = random.Random(seed)
+    careers = get_all_careers()
+    skills = sorted({skill.lower() for career in careers for skill in get_career_details(career)["required_skills"]})
+    urls = []
+    with app.test_request_context():
+        for number in range(count):
+            visitor_skills = rng.sample(skills, 4)
+            if number % 2:
+                career1, career2 = rng.sample(careers, 2)
+                answers = {"career1": career1, "career2": career2, "skills": visitor_skills}
+                urls.append(f"/results/comparison/{encode_result_token('comparison', answers)}")
+            else:
+                answers = {"interests": rng.sample(INTERESTS, 2), "skills": visitor_skills,
+                           "values": rng.sample(VALUES, 1), "personality": rng.choice(PERSONALITIES),
+                           "education": "bachelor", "work_environment": []}
+                urls.append(f"/results/recommendation/{encode_result_token('recommendation', answers)}")
+    return urls
+
+def time_pages(client, urls):
+    """Return per-page latencies in milliseconds, keyed by result type"""
+    latencies = {}
+    for url in urls:
+        start = time.perf_counter()
+        response = client.get(url)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, url
+        latencies.setdefault(url.split("/")[2], []).append(elapsed)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--visitors", type=int, default=300, help="Result pages rendered per run")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    client = app.test_client()
+    urls = visitor_pages(args.visitors)
+    time_pages(client, urls[:10])          # Warm templates and catalog indexes
+
+    max_bytes = fragment_cache.max_bytes
+    fragment_cache.max_bytes = 0
+    uncached = time_pages(client, urls)
+    fragment_cache.max_bytes = max_bytes
+    fragment_cache.clear()
+    cached = time_pages(client, urls)
+
+    print(f"{'page':>16} {'uncached ms':>12} {'cached ms':>10} {'saved ms':>9}")
+    for page in sorted(cached):
+        before, after = statistics.median(uncached[page]), statistics.median(cached[page])
+        print(f"{page:>16} {before:>12.2f} {after:>10.2f} {before - after:>9.2f}")
+
+    stats = fragment_cache.stats()
+    print(f"\n{stats['entries']} panels, {stats['size'] / 1024:.0f} KiB, {stats['evictions']} evictions")
+    for name, panel in stats["panels"].items():
+        print(f"{name:>20}: {panel['hits']} hits, {panel['misses']} misses, "
+              f"{panel['avg_render_ms']:.3f} ms per render, {panel['saved_ms']:.0f} ms saved")
+
+if __name__ == "__main__":
+    main()
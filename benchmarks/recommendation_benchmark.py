@@ -0,0 +1,55 @@
+"""
+Benchmark lazy vs eager materialization in get_career_recommendations.
+
+Eager mode builds reasons, skill gaps, courses and details for every career
+before cutting the ranking to `limit`; lazy mode only builds them for the
+returned careers. Generated careers carry specialty skills outside the
+built-in vocabulary (one in ten careers introduces a new one by default), so
+large catalogs also have a large skill ontology and wide skill bitsets. Run
+from the repository root:
+
+    python -m benchmarks.recommendation_benchmark [--sizes 20,1000,10000,50000]
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.synthetic_catalog import build_synthetic_catalog, generate_profiles
+from recommendation_engine import get_career_recommendations
+
+def time_requests(catalog, profiles, limit, lazy):
+    """Return per-request latencies in milliseconds"""
+    latencies = []
+    for profile in profiles:
+        start = time.perf_counter()
+        get_career_recommendations(limit=limit, lazy=lazy, catalog=catalog, **profile)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="20,1000,10000,50000",
+                        help="Comma-separated catalog sizes")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per size and mode")
+    parser.add_argument("--limit", type=int, default=5, help="Recommendations per request")
+    parser.add_argument("--specialty-ratio", type=float, default=0.1,
+                        help="Distinct specialty skills per generated career")
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.requests, seed=1)
+    print(f"{'careers':>8} {'skills':>8} {'eager ms':>10} {'lazy ms':>10} {'saved ms':>10} {'speedup':>8}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        catalog = build_synthetic_catalog(size, specialty_skills=int(size * args.specialty_ratio))
+        # Warm the catalog's derived indexes so they are not timed
+        get_career_recommendations(limit=args.limit, catalog=catalog, **profiles[0])
+
+        # Eager runs get fewer requests on large catalogs to bound the runtime
+        eager_profiles = profiles[:max(3, args.requests * 1000 // max(size, 1000))]
+        eager = statistics.median(time_requests(catalog, eager_profiles, args.limit, lazy=False))
+        lazy = statistics.median(time_requests(catalog, profiles, args.limit, lazy=True))
+        print(f"{size:>8} {len(catalog.ontology):>8} {eager:>10.2f} {lazy:>10.2f} {eager - lazy:>10.2f} "
+              f"{eager / lazy:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark typeahead career search on synthetic catalogs.
+
+Times the one-off search index build, then prefix queries (each prefix of a
+career name, as typed) and misspelled queries that take the fuzzy trigram
+path. Run from the repository root:
+
+    python -m benchmarks.search_benchmark [--sizes 20,1000,10000,50000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.synthetic_catalog import build_synthetic_catalog
+from career_search import get_search_index, search_careers
+
+def misspell(text, rng):
+    """Drop one letter from a word of at least four letters"""
+    words = text.split()
+    long_words = [index for index, word in enumerate(words) if len(word) >= 4]
+    if not long_words:
+        return text
+    index = rng.choice(long_words)
+    position = rng.randrange(1, len(words[index]))
+    words[index] = words[index][:position] + words[index][position + 1:]
+    return " ".join(words)
+
+def time_queries(catalog, queries):
+    """Return per-query latencies in milliseconds"""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        search_careers(query, catalog=catalog)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="20,1000,10000,50000", help="Comma-separated catalog sizes")
+    parser.add_argument("--queries", type=int, default=200, help="Career names typed per size")
+    args = parser.parse_args()
+
+    print(f"{'careers':>8} {'entries':>8} {'build ms':>10} {'prefix ms':>10} {'prefix p99':>11} {'fuzzy ms':>9} {'fuzzy p99':>10}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        catalog = build_synthetic_catalog(size)
+        start = time.perf_counter()
+        index = get_search_index(catalog)
+        build = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(size)
+        names = [rng.choice(catalog.names).rsplit(" ", 1)[0] for _ in range(args.queries)]
+        prefix = time_queries(catalog, [name[:length] for name in names for length in range(1, len(name) + 1)])
+        fuzzy = time_queries(catalog, [misspell(name, rng) for name in names])
+        print(f"{size:>8} {len(index.entries):>8} {build:>10.1f} {statistics.median(prefix):>10.3f} "
+              f"{sorted(prefix)[int(len(prefix) * 0.99) - 1]:>11.3f} {statistics.median(fuzzy):>9.3f} "
+              f"{sorted(fuzzy)[int(len(fuzzy) * 0.99) - 1]:>10.3f}")
+
+if __name__ == "__main__":
+    main()
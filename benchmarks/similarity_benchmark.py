@@ -0,0 +1,64 @@
+"""
+Benchmark the similar-careers index on synthetic catalogs.
+
+Times the one-off neighbour table build, per-career lookups, and the index of
+a reloaded catalog in which a few careers' skills changed, derived from the previous
+index versus built from scratch. Run from the repository root:
+
+    python -m benchmarks.similarity_benchmark [--sizes 20,1000,10000] [--changes 5]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.synthetic_catalog import generate_career_data
+from career_data import DEFAULT_CAREER_DETAILS
+from catalog import build_catalog
+from similarity import SimilarityIndex, similar_careers
+
+def changed_catalog(data, changes, seed):
+    """The catalog after `changes` careers had one required skill replaced"""
+    rng = random.Random(seed)
+    skill_pool = sorted({skill for details in data.values() for skill in details["required_skills"]})
+    updated = dict(data)
+    for name in rng.sample(sorted(data), min(changes, len(data))):
+        skills = list(data[name]["required_skills"])
+        skills[rng.randrange(len(skills))] = rng.choice(skill_pool)
+        updated[name] = dict(data[name], required_skills=skills)
+    return build_catalog(updated, DEFAULT_CAREER_DETAILS)
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="20,1000,10000", help="Comma-separated catalog sizes")
+    parser.add_argument("--queries", type=int, default=1000, help="Lookups per size")
+    parser.add_argument("--changes", type=int, default=5, help="Careers changed in the reloaded catalog")
+    args = parser.parse_args()
+
+    print(f"{'careers':>8} {'build ms':>10} {'lookup us':>10} {'rebuild ms':>11} {'update ms':>10} {'rows':>6}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        data = generate_career_data(size)
+        catalog = build_catalog(data, DEFAULT_CAREER_DETAILS)
+        index, build = timed(SimilarityIndex, catalog)
+        catalog.derived("similarity", lambda _: index)
+
+        rng = random.Random(size)
+        names = [rng.choice(catalog.names) for _ in range(args.queries)]
+        start = time.perf_counter()
+        for name in names:
+            similar_careers(name, catalog=catalog)
+        lookup = (time.perf_counter() - start) / len(names) * 1e6
+
+        reloaded = changed_catalog(data, args.changes, seed=size)
+        _, rebuild = timed(SimilarityIndex, reloaded, idf=index.idf)
+        updated, update = timed(SimilarityIndex, reloaded, previous=index)
+        rows = sum(new is not old for new, old in zip(updated.neighbours, index.neighbours))
+        print(f"{size:>8} {build:>10.1f} {lookup:>10.1f} {rebuild:>11.1f} {update:>10.1f} {rows:>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark cold start: time from a fresh interpreter to the first response.
+
+Each run starts a new Python process that imports the WSGI entry point
+(main.py) and requests the given pages once, as an autoscaled instance does
+when it wakes up. Prints the median import, first-response and total times,
+then an import-time breakdown by top-level package from a run under
+`python -X importtime`. Exits with status 1 when the median total is over
+the budget. Run from the repository root:
+
+    python -m benchmarks.startup_benchmark [--runs 5] [--budget 1000] [--paths /,/recommendation]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# Runs in the child process; prints its timings as JSON on the last line
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from main import app
+imported = time.perf_counter()
+client = app.test_client()
+for path in sys.argv[1:]:
+    response = client.get(path)
+    assert response.status_code < 400, (path, response.status_code)
+responded = time.perf_counter()
+print(json.dumps({"import": imported - start, "first_response": responded - imported}))
+"""
+
+def run_child(paths, importtime=False):
+    """Start one cold process; returns its timings and, with importtime, its stderr"""
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", CHILD_SCRIPT] + paths
+    env = dict(os.environ, LOG_LEVEL=os.environ.get("LOG_LEVEL", "WARNING"), CATALOG_RELOAD_INTERVAL="0")
+    result = subprocess.run(command, capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+def import_breakdown(stderr):
+    """Self import time in milliseconds per top-level package, from -X importtime output"""
+    totals = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to time")
+    parser.add_argument("--budget", type=float, default=1000, help="Time-to-first-response budget in milliseconds")
+    parser.add_argument("--paths", default="/,/recommendation", help="Comma-separated pages requested after import")
+    parser.add_argument("--top", type=int, default=15, help="Packages shown in the import breakdown")
+    args = parser.parse_args()
+    paths = args.paths.split(",")
+
+    runs = [run_child(paths)[0] for _ in range(args.runs)]
+    imported = statistics.median(run["import"] for run in runs) * 1000
+    responded = statistics.median(run["first_response"] for run in runs) * 1000
+    total = statistics.median(run["import"] + run["first_response"] for run in runs) * 1000
+    print(f"{'import ms':>10} {'first response ms':>18} {'total ms':>9} {'budget ms':>10}")
+    print(f"{imported:>10.0f} {responded:>18.0f} {total:>9.0f} {args.budget:>10.0f}")
+
+    _, stderr = run_child(paths, importtime=True)
+    breakdown = import_breakdown(stderr)
+    print(f"\nImport time by package ({sum(ms for _, ms in breakdown):.0f} ms under -X importtime)")
+    for name, ms in breakdown[:args.top]:
+        print(f"{name:>24} {ms:>8.1f} ms")
+
+    if total > args.budget:
+        print(f"\nOver budget by {total - args.budget:.0f} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Synthetic catalog generator for benchmarks
+#
+# Scales the built-in careers up to an arbitrary size by recombining their
+# descriptions, skills, education requirements and environments, so benchmark
+# catalogs keep realistic match rates for questionnaire answers. Careers can
+# also get specialty skills outside the built-in vocabulary, so the skill
+# ontology grows with the catalog the way an imported dataset makes it grow.
+
+import random
+
+from career_data import CAREER_DATA, DEFAULT_CAREER_DETAILS
+from catalog import build_catalog
+
+def generate_career_data(size, seed=0, specialty_skills=0):
+    """
+    Generate a career data mapping in the CAREER_DATA format.
+
+    Args:
+        size: Number of careers to generate
+        seed: Seed for the generator, so runs are reproducible
+        specialty_skills: Number of distinct skills outside the built-in
+            vocabulary; each career gets one of them in addition to its
+            recombined skills
+
+    Returns:
+        Dictionary of career name to details
+    """
+    rng = random.Random(seed)
+    names = sorted(CAREER_DATA)
+    templates = [CAREER_DATA[name] for name in names]
+    skill_pool = sorted({skill for details in templates for skill in details["required_skills"]})
+    specialties = [f"Specialty Skill {number:05d}" for number in range(specialty_skills)]
+    careers = {}
+    for number in range(size):
+        template = templates[number % len(templates)]
+        careers[f"{names[number % len(names)]} {number:05d}"] = {
+            "description": rng.choice(templates)["description"],
+            "required_education": rng.choice(templates)["required_education"],
+            "required_skills": rng.sample(skill_pool, len(template["required_skills"])) + (
+                [specialties[rng.randrange(len(specialties))]] if specialties else []),
+            "salary_range": rng.choice(templates)["salary_range"],
+            "job_outlook": rng.choice(templates)["job_outlook"],
+            "work_environment": rng.choice(templates)["work_environment"],
+            "related_careers": list(template["related_careers"]),
+            "resources": list(template["resources"]),
+        }
+
+    # Point related careers at generated careers so the transition graph is connected
+    related_rng = random.Random(f"{seed}-related")
+    generated = list(careers)
+    for details in careers.values():
+        details["related_careers"] = related_rng.sample(generated, min(len(generated), len(details["related_careers"])))
+    return careers
+
+def build_synthetic_catalog(size, seed=0, specialty_skills=0):
+    """Build a CareerCatalog of the given size from generated career data"""
+    return build_catalog(generate_career_data(size, seed, specialty_skills), DEFAULT_CAREER_DETAILS)
+
+# Questionnaire answers used to generate benchmark profiles
+INTERESTS = ["technology", "science", "creative", "business", "healthcare",
+             "education", "social", "engineering", "writing", "legal"]
+SKILLS = ["analytical", "communication", "technical", "creativity", "management",
+          "math", "research", "interpersonal", "writing", "languages"]
+VALUES = ["worklife", "compensation", "stability", "growth", "autonomy",
+          "impact", "challenge", "recognition", "creativity", "travel"]
+PERSONALITIES = ["analytical", "creative", "practical", "leader", "social", "independent"]
+EDUCATION_LEVELS = ["highschool", "associate", "bachelor", "master", "phd", "trade", "selftaught"]
+WORK_ENVIRONMENTS = ["office", "remote", "outdoors", "travel", "startup", "corporate", "flexible", "creative"]
+
+def generate_profiles(count, seed=0):
+    """Generate questionnaire answer dictionaries shaped like QuestionnaireForm data"""
+    rng = random.Random(seed)
+    return [{
+        "interests": rng.sample(INTERESTS, rng.randint(1, 3)),
+        "skills": rng.sample(SKILLS, rng.randint(1, 4)),
+        "values": rng.sample(VALUES, rng.randint(1, 3)),
+        "personality": rng.choice(PERSONALITIES),
+        "education": rng.choice(EDUCATION_LEVELS),
+        "work_environment": rng.sample(WORK_ENVIRONMENTS, rng.randint(1, 3)),
+    } for _ in range(count)]
@@ -0,0 +1,51 @@
+"""
+Benchmark transition path queries on synthetic catalogs.
+
+Times the one-off transition graph build, then cold and cached path queries
+between random pairs of careers. Run from the repository root:
+
+    python -m benchmarks.transition_benchmark [--sizes 20,1000,10000,50000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.synthetic_catalog import build_synthetic_catalog
+from transition_planner import get_transition_graph, plan_career_transition
+
+def time_queries(catalog, pairs):
+    """Return per-query latencies in milliseconds"""
+    latencies = []
+    for current_career, target_career in pairs:
+        start = time.perf_counter()
+        plan_career_transition(current_career, target_career, catalog=catalog)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="20,1000,10000,50000",
+                        help="Comma-separated catalog sizes")
+    parser.add_argument("--queries", type=int, default=200, help="Career pairs per size")
+    args = parser.parse_args()
+
+    print(f"{'careers':>8} {'edges':>8} {'build ms':>10} {'cold ms':>9} {'cold p99':>9} {'cached ms':>10} {'avg steps':>10}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        catalog = build_synthetic_catalog(size)
+        start = time.perf_counter()
+        graph = get_transition_graph(catalog)
+        build = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(size)
+        pairs = [(rng.choice(catalog.names), rng.choice(catalog.names)) for _ in range(args.queries)]
+        cold = time_queries(catalog, pairs)
+        cached = time_queries(catalog, pairs)
+        steps = statistics.mean(len(plan_career_transition(*pair, catalog=catalog)["steps"]) for pair in pairs)
+        p99 = sorted(cold)[int(len(cold) * 0.99) - 1]
+        print(f"{size:>8} {len(graph.targets):>8} {build:>10.1f} {statistics.median(cold):>9.3f} "
+              f"{p99:>9.3f} {statistics.median(cached):>10.3f} {steps:>10.2f}")
+
+if __name__ == "__main__":
+    main()
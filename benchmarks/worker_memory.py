@@ -0,0 +1,150 @@
+"""
+Measure per-worker memory under gunicorn with and without the pre-fork preload.
+
+Serves a synthetic catalog from a temporary career file and, for each worker
+count, starts gunicorn twice: once with gunicorn.conf.py as shipped (the
+master loads the catalog and its indexes, then forks) and once with every
+worker loading and indexing its own copy. After a burst of API traffic it
+reads each worker's RSS, PSS and private memory from /proc (Linux only).
+PSS splits shared pages between the processes using them, so the total PSS
+is the memory the whole server really costs. Run from the repository root:
+
+    python -m benchmarks.worker_memory [--careers 3000] [--workers 4,16]
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from benchmarks.synthetic_catalog import generate_career_data
+
+# Baseline config: no preload, each worker builds everything after it is forked
+PER_WORKER_CONFIG = """
+import os
+
+preload_app = False
+
+def post_worker_init(worker):
+    from app import preload_app
+    preload_app()
+    open(os.path.join(os.environ["WORKER_READY_DIR"], str(os.getpid())), "w").close()
+"""
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def worker_pids(master_pid):
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as handle:
+        return [int(pid) for pid in handle.read().split()]
+
+def memory_kb(pid):
+    """Rss, Pss and private memory of a process in kB, from smaps_rollup"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as handle:
+        for line in handle:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {"rss": fields["Rss"], "pss": fields["Pss"],
+            "private": fields["Private_Clean"] + fields["Private_Dirty"]}
+
+def api_paths(careers, count, seed=0):
+    """A mix of API requests touching every catalog index"""
+    rng = random.Random(seed)
+    quote = urllib.parse.quote
+    paths = []
+    for _ in range(count):
+        first, second = rng.sample(careers, 2)
+        paths += [
+            "/api/recommendations?interest=technology&skill=communication&value=salary&personality=analytical",
+            f"/api/careers/search?q={quote(first[:rng.randint(2, 8)])}",
+            f"/api/similar_careers?career={quote(first)}",
+            f"/api/transition_path?from={quote(first)}&to={quote(second)}",
+            f"/api/compare?career={quote(first)}&career={quote(second)}",
+        ]
+    return paths
+
+def wait_until_serving(url, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            urllib.request.urlopen(url, timeout=5).read()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError("gunicorn did not start in time")
+
+def measure(config, workers, env, paths, timeout, ready_dir=None):
+    """Start gunicorn, send the traffic and return per-process memory"""
+    port = free_port()
+    command = [sys.executable, "-m", "gunicorn", "--config", config, "--workers", str(workers),
+               "--bind", f"127.0.0.1:{port}", "--timeout", str(int(timeout)), "main:app"]
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f"http://127.0.0.1:{port}"
+        wait_until_serving(base + "/", process, timeout)
+        # Without preload each worker loads on its own; wait until every one is done
+        while len(worker_pids(process.pid)) < workers or (ready_dir and len(os.listdir(ready_dir)) < workers):
+            time.sleep(0.5)
+        for path in paths:
+            try:
+                urllib.request.urlopen(base + path, timeout=timeout).read()
+            except urllib.error.HTTPError:
+                pass
+        return memory_kb(process.pid), [memory_kb(pid) for pid in worker_pids(process.pid)]
+    finally:
+        process.terminate()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--careers", type=int, default=3000, help="Synthetic catalog size")
+    parser.add_argument("--workers", default="4,16", help="Comma-separated worker counts")
+    parser.add_argument("--requests", type=int, default=40, help="Rounds of API requests sent before measuring")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for the server")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "careers.json")
+        data = generate_career_data(args.careers)
+        with open(source, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        per_worker_config = os.path.join(directory, "per_worker.conf.py")
+        with open(per_worker_config, "w") as handle:
+            handle.write(PER_WORKER_CONFIG)
+
+        env = dict(os.environ, CATALOG_SOURCE_FILE=source, CATALOG_RELOAD_INTERVAL="0", SESSION_BACKEND="memory",
+                   DATABASE_URL=f"sqlite:///{os.path.join(directory, 'memory.db')}", LOG_LEVEL="WARNING",
+                   PRELOAD_APP="1")
+        paths = api_paths(sorted(data), args.requests)
+        # The app never creates tables itself; create them the way a deploy does before starting gunicorn
+        subprocess.run([sys.executable, "-m", "flask", "--app", "main", "init-db"], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+
+        print(f"{args.careers} careers, {len(paths)} requests per run; memory in MB")
+        print(f"{'workers':>7} {'mode':>10} {'worker rss':>11} {'worker pss':>11} {'private':>8} {'total pss':>10}")
+        for workers in (int(count) for count in args.workers.split(",")):
+            for mode, config in (("per-worker", per_worker_config), ("preload", "gunicorn.conf.py")):
+                ready_dir = tempfile.mkdtemp(dir=directory) if mode == "per-worker" else None
+                master, children = measure(config, workers, dict(env, WORKER_READY_DIR=ready_dir or ""), paths,
+                                           args.timeout, ready_dir)
+                average = {key: sum(child[key] for child in children) / len(children) / 1024 for key in master}
+                total = (master["pss"] + sum(child["pss"] for child in children)) / 1024
+                print(f"{workers:>7} {mode:>10} {average['rss']:>11.1f} {average['pss']:>11.1f} "
+                      f"{average['private']:>8.1f} {total:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Career filters module - hard salary, growth and education filters via sorted range indexes
+#
+# Each numeric career field (top of the salary range, projected growth,
+# education tier) is kept as a sorted column of (value, career id). A filter
+# such as "salary of at least $100,000" is a bisect into its column, and
+# several filters are intersected starting from the smallest match, so
+# recommendation requests can restrict the catalog before any scoring happens.
+
+import bisect
+import logging
+import math
+from array import array
+from collections import namedtuple
+
+from catalog import EDUCATION_TIERS, get_catalog
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Questionnaire education answers mapped to the highest catalog education tier they reach
+EDUCATION_ANSWER_TIERS = {
+    "highschool": 0,
+    "associate": 1,
+    "bachelor": 2,
+    "master": 3,
+    "phd": 4,
+    "trade": 1,
+    "selftaught": 0,
+}
+
+CareerFilters = namedtuple("CareerFilters", [
+    "min_salary",          # Careers whose salary range reaches at least this many dollars
+    "min_growth",          # Careers with at least this projected growth percentage
+    "max_education",       # Careers requiring at most this EDUCATION_TIERS index
+])
+
+class SortedColumn:
+    """One numeric career field sorted by value, for range queries"""
+
+    def __init__(self, values):
+        pairs = sorted((value, career_id) for career_id, value in enumerate(values) if value is not None)
+        self.values = array("d", [value for value, _ in pairs])
+        self.career_ids = array("I", [career_id for _, career_id in pairs])
+
+    def range(self, low=None, high=None):
+        """Career ids whose value lies within [low, high]; careers without a value never match"""
+        start = 0 if low is None else bisect.bisect_left(self.values, low)
+        end = len(self.values) if high is None else bisect.bisect_right(self.values, high)
+        return self.career_ids[start:end]
+
+class FilterIndex:
+    """Sorted columns over a catalog's parsed salary, growth and education fields"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.salary_max = SortedColumn([record.salary_max for record in catalog])
+        self.growth_pct = SortedColumn([record.growth_pct for record in catalog])
+        self.education_tier = SortedColumn([record.education_tier for record in catalog])
+
+    def matching(self, filters):
+        """
+        Career ids that pass every filter.
+
+        Returns:
+            Frozenset of career ids, or None when no filter is set
+        """
+        ranges = []
+        if filters.min_salary is not None:
+            ranges.append(self.salary_max.range(low=filters.min_salary))
+        if filters.min_growth is not None:
+            ranges.append(self.growth_pct.range(low=filters.min_growth))
+        if filters.max_education is not None:
+            ranges.append(self.education_tier.range(high=filters.max_education))
+        if not ranges:
+            return None
+        ranges.sort(key=len)
+        allowed = set(ranges[0])
+        for career_ids in ranges[1:]:
+            if not allowed:
+                break
+            allowed.intersection_update(career_ids)
+        return frozenset(allowed)
+
+def get_filter_index(catalog=None):
+    """Return the range filter index of a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("filters", FilterIndex)
+
+def parse_filters(min_salary=None, min_growth=None, max_education=None):
+    """
+    Build CareerFilters from request values.
+
+    Args:
+        min_salary: Dollars, as a number or numeric string
+        min_growth: Growth percentage, as a number or numeric string
+        max_education: A questionnaire education answer or an EDUCATION_TIERS name
+
+    Returns:
+        CareerFilters, or None when every value is empty
+
+    Raises:
+        ValueError: If a value cannot be parsed
+    """
+    def number(value, name):
+        if value is None or value == "":
+            return None
+        try:
+            parsed = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be a number")
+        # NaN compares false both ways, so a bisect would let every career through
+        if math.isnan(parsed):
+            raise ValueError(f"{name} must be a number")
+        return parsed
+
+    education = None
+    if max_education:
+        education = EDUCATION_ANSWER_TIERS.get(max_education)
+        if education is None and max_education in EDUCATION_TIERS:
+            education = EDUCATION_TIERS.index(max_education)
+        if education is None:
+            raise ValueError(f"Unknown education level: {max_education}")
+    filters = CareerFilters(number(min_salary, "min_salary"), number(min_growth, "min_growth"), education)
+    return filters if any(value is not None for value in filters) else None
@@ -0,0 +1,206 @@
+# Career search module - typeahead over career names, roles, related careers and skills
+#
+# Every searchable text (career names, typical role titles, related-career
+# names and required skills) becomes one entry pointing at the careers it
+# belongs to. Typeahead queries are answered from a sorted list of word-start
+# keys, so "sci" finds "Data Scientist" with two bisects; only when that yields
+# too few careers does the search fall back to fuzzy trigram matching, which
+# tolerates typos. Results are ranked per career by match quality and entry kind.
+
+import bisect
+import heapq
+import logging
+import re
+from array import array
+from collections import namedtuple
+
+from catalog import get_catalog
+from roadmaps import ROLE_MAPPINGS
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SEARCH_RESULT_LIMIT = 8
+MAX_SEARCH_RESULTS = 25
+PREFIX_SCAN_LIMIT = 200         # Prefix or fuzzy matches looked at before ranking
+FUZZY_POSTING_BUDGET = 8000     # Posting entries a fuzzy query may scan, rarest trigrams first
+FUZZY_MIN_SIMILARITY = 0.5
+
+# Entry kinds and how strongly a match on each counts towards its careers
+KIND_WEIGHTS = {
+    "career": 1.0,
+    "role": 0.8,
+    "related": 0.6,
+    "skill": 0.5,
+}
+
+SearchEntry = namedtuple("SearchEntry", [
+    "text",                # Display text
+    "kind",                # One of KIND_WEIGHTS
+    "career_ids",          # Tuple of catalog ids the entry leads to
+])
+
+NON_ALPHANUMERIC_PATTERN = re.compile(r"[^a-z0-9]+")
+
+def normalize_query(text):
+    """Lowercase text and reduce it to words separated by single spaces"""
+    return NON_ALPHANUMERIC_PATTERN.sub(" ", (text or "").lower()).strip()
+
+def trigrams(text):
+    """Distinct trigrams of normalized text, padded so word starts count"""
+    padded = f"  {text} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+class CareerSearchIndex:
+    """Prefix and trigram index over the searchable texts of a catalog"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        grouped = {}
+
+        def add(text, kind, career_id):
+            key = (normalize_query(text), kind)
+            if key[0]:
+                grouped.setdefault(key, (text, []))[1].append(career_id)
+
+        for record in catalog:
+            add(record.name, "career", record.id)
+            for roles in ROLE_MAPPINGS.get(record.name, {}).values():
+                for role in roles:
+                    add(role, "role", record.id)
+            for related in record.details.get("related_careers", ()):
+                add(related, "related", record.id)
+            for skill in record.details.get("required_skills", ()):
+                add(skill, "skill", record.id)
+
+        self.entries = []
+        self.normalized = []
+        for (normalized, kind), (text, career_ids) in grouped.items():
+            self.entries.append(SearchEntry(text, kind, tuple(dict.fromkeys(career_ids))))
+            self.normalized.append(normalized)
+
+        # Word-start keys: "data scientist" is keyed as "data scientist" and "scientist"
+        keyed = []
+        for entry_id, normalized in enumerate(self.normalized):
+            start = 0
+            while start != -1:
+                keyed.append((normalized[start:], entry_id))
+                start = normalized.find(" ", start)
+                start = start + 1 if start != -1 else -1
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.key_entries = array("I", [entry_id for _, entry_id in keyed])
+
+        postings = {}
+        for entry_id, normalized in enumerate(self.normalized):
+            for trigram in trigrams(normalized):
+                postings.setdefault(trigram, array("I")).append(entry_id)
+        self.postings = postings
+        logger.debug(f"Built career search index for catalog {catalog.version}: "
+                     f"{len(self.entries)} entries, {len(self.keys)} keys")
+
+    def _prefix_matches(self, query):
+        """Dictionary of entry id to match score for entries with a word starting with the query"""
+        start = bisect.bisect_left(self.keys, query)
+        end = bisect.bisect_left(self.keys, query + "\uffff", start, min(len(self.keys), start + PREFIX_SCAN_LIMIT))
+        matches = {}
+        for position in range(start, end):
+            entry_id = self.key_entries[position]
+            normalized = self.normalized[entry_id]
+            # Whole-text prefixes beat word prefixes; closer lengths beat longer texts
+            score = (1.0 if normalized.startswith(query) else 0.8) * (0.5 + 0.5 * len(query) / len(normalized))
+            matches[entry_id] = max(score, matches.get(entry_id, 0.0))
+        return matches
+
+    def _fuzzy_matches(self, query):
+        """
+        Dictionary of entry id to trigram similarity for entries close to the query.
+
+        Trigrams are scanned rarest first until the posting budget runs out, so
+        very common trigrams are skipped; similarity is the share of scanned
+        trigrams an entry contains, scaled down for entries much longer than
+        the query.
+        """
+        postings = sorted((self.postings[trigram] for trigram in trigrams(query) if trigram in self.postings), key=len)
+        shared = {}
+        scanned = 0
+        budget = FUZZY_POSTING_BUDGET
+        for posting in postings:
+            if len(posting) > budget:
+                break
+            budget -= len(posting)
+            scanned += 1
+            for entry_id in posting:
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+        matches = {}
+        for entry_id, count in shared.items():
+            similarity = count / scanned
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                length = len(self.normalized[entry_id])
+                matches[entry_id] = similarity * (0.5 + 0.5 * min(len(query), length) / max(len(query), length))
+        return matches
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        """
+        Careers matching a typeahead query, best first.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of careers to return
+
+        Returns:
+            List of (career_id, score, entry) with the entry each career matched through
+        """
+        query = normalize_query(query)
+        if not query:
+            return []
+        matches = self._prefix_matches(query)
+        careers = self._rank(matches, limit)
+        if len(careers) < limit and len(query) >= 3:
+            fuzzy = self._fuzzy_matches(query)
+            if len(fuzzy) > PREFIX_SCAN_LIMIT:
+                kept = heapq.nlargest(PREFIX_SCAN_LIMIT, fuzzy,
+                                      key=lambda entry_id: fuzzy[entry_id] * KIND_WEIGHTS[self.entries[entry_id].kind])
+                fuzzy = {entry_id: fuzzy[entry_id] for entry_id in kept}
+            for entry_id, score in matches.items():
+                fuzzy[entry_id] = max(fuzzy.get(entry_id, 0.0), 1.0 + score)
+            careers = self._rank(fuzzy, limit)
+        return careers
+
+    def _rank(self, matches, limit):
+        """Best match per career across matched entries, limited to the top careers"""
+        best = {}
+        for entry_id, score in matches.items():
+            entry = self.entries[entry_id]
+            weighted = score * KIND_WEIGHTS[entry.kind]
+            # Entries shared by many careers rank them equally, so only the first few can place
+            for career_id in entry.career_ids[:limit]:
+                if weighted > best.get(career_id, (0.0,))[0]:
+                    best[career_id] = (weighted, entry)
+        top = heapq.nlargest(limit, best.items(), key=lambda item: (item[1][0], -item[0]))
+        return [(career_id, score, entry) for career_id, (score, entry) in top]
+
+def get_search_index(catalog=None):
+    """Return the career search index of a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("search", CareerSearchIndex)
+
+def search_careers(query, limit=SEARCH_RESULT_LIMIT, catalog=None):
+    """
+    Typeahead search over career names, role titles, related careers and skills.
+
+    Args:
+        query: Text typed so far
+        limit: Maximum number of careers to return, at most MAX_SEARCH_RESULTS
+        catalog: Catalog to search; defaults to the process-wide catalog
+
+    Returns:
+        List of dictionaries with the career name, the text it matched and the
+        kind of that text ("career", "role", "related" or "skill")
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    limit = min(max(1, limit), MAX_SEARCH_RESULTS)
+    return [
+        {"career": catalog.records[career_id].name, "match": entry.text, "kind": entry.kind}
+        for career_id, _, entry in get_search_index(catalog).search(query, limit)
+    ]
@@ -0,0 +1,351 @@
+# Career catalog module - compiles the raw career data into a frozen, read-only index
+#
+# The index is built once per process and shared by every request; under
+# gunicorn it is built once in the master and shared by the forked workers.
+# Records keep precomputed lowercase text and parsed salary bounds so the
+# recommendation engine never has to re-derive them per call, in slots with
+# interned text so a large catalog stays compact. The catalog registry serves one
+# snapshot at a time and swaps in rebuilt ones atomically; each request pins the
+# snapshot it started with. Skill ids come from the snapshot's own skill
+# ontology, so they are only comparable within one catalog.
+
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from skill_ontology import SKILL_ONTOLOGY, SkillOntology
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SALARY_FIGURE_PATTERN = re.compile(r"\$\s*(\d[\d,]*)")
+GROWTH_RATE_PATTERN = re.compile(r"(-?\d+(?:\.\d+)?)\s*%")
+
+# Education tiers in ascending order; a requirement's tier is the first keyword
+# found, checked in the order of EDUCATION_TIER_KEYWORDS
+EDUCATION_TIERS = ["highschool", "associate", "bachelor", "master", "phd"]
+EDUCATION_TIER_KEYWORDS = [
+    ("bachelor", 2),
+    ("associate", 1),
+    ("master", 3),
+    ("phd", 4),
+    ("doctorate", 4),
+]
+
+# Detail fields of a career, in the get_career_details() order
+DETAIL_FIELDS = ("description", "required_education", "required_skills", "salary_range",
+                 "job_outlook", "work_environment", "related_careers", "resources")
+_MISSING = object()
+
+class CareerDetails(Mapping):
+    """
+    Read-only details of one career in the get_career_details() format.
+
+    Fields are kept in slots rather than a dict per career, and their text is
+    interned, so skill names, education and environment texts that repeat
+    across careers are stored once. A large catalog then holds far fewer
+    objects, and forked workers touch fewer of the pages they share.
+    """
+
+    __slots__ = DETAIL_FIELDS + ("_extra",)
+
+    def __init__(self, details):
+        """
+        Args:
+            details: Mapping of a career's details; fields it lacks stay missing
+        """
+        extra = {}
+        for key, value in details.items():
+            value = _freeze(value)
+            if key in DETAIL_FIELDS:
+                object.__setattr__(self, key, value)
+            else:
+                extra[key] = value
+        object.__setattr__(self, "_extra", MappingProxyType(extra) if extra else None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Career details are read-only")
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in DETAIL_FIELDS:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __iter__(self):
+        for field in DETAIL_FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (CareerDetails, (dict(self),))
+
+    def __repr__(self):
+        return f"CareerDetails({dict(self)!r})"
+
+class CareerRecord:
+    """A career with its precomputed lookup forms"""
+
+    __slots__ = (
+        "id",                  # Position in the catalog's sorted name order
+        "name",
+        "details",             # CareerDetails in the get_career_details() format
+        "description_lower",
+        "skills_lower",        # Tuple of lowercase required skills, in catalog order
+        "skill_ids",           # Catalog ontology id of each required skill, in catalog order
+        "skill_mask",          # Bitset of the skill ids
+        "education_lower",
+        "environment_lower",
+        "outlook_lower",
+        "salary_min",          # Parsed salary bounds in dollars, None if not parseable
+        "salary_max",
+        "growth_pct",          # Projected job growth percentage, None if not parseable
+        "education_tier",      # Index into EDUCATION_TIERS of the required education
+    )
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields[field])
+
+    def __repr__(self):
+        return f"CareerRecord(id={self.id!r}, name={self.name!r})"
+
+def parse_salary_range(salary_range):
+    """
+    Parse a salary string such as "$70,000 - $150,000+" into numeric bounds.
+
+    Returns:
+        Tuple (min, max) in dollars; a bound is None when it cannot be parsed
+    """
+    figures = [int(figure.replace(",", "")) for figure in SALARY_FIGURE_PATTERN.findall(salary_range or "")]
+    if not figures:
+        return None, None
+    return figures[0], figures[-1]
+
+def parse_growth_rate(job_outlook):
+    """
+    Parse the projected growth from an outlook such as "Faster than average (13% growth by 2030)".
+
+    Returns:
+        Growth percentage as a float, None when no percentage is given
+    """
+    match = GROWTH_RATE_PATTERN.search(job_outlook or "")
+    return float(match.group(1)) if match else None
+
+def education_tier(required_education):
+    """Index into EDUCATION_TIERS of a required-education text; high school when none is named"""
+    required_education = (required_education or "").lower()
+    for keyword, tier in EDUCATION_TIER_KEYWORDS:
+        if keyword in required_education:
+            return tier
+    return 0
+
+def _freeze(value):
+    """Return an immutable copy of a career data value, with its text interned"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+def _make_record(career_id, name, details, ontology):
+    """Build a CareerRecord with its precomputed lookup forms, registering unknown skills in the ontology"""
+    frozen = CareerDetails(details)
+    skills = frozen.get("required_skills", ())
+    skill_ids = tuple(ontology.skill_id(skill) for skill in skills)
+    salary_min, salary_max = parse_salary_range(frozen.get("salary_range", ""))
+    return CareerRecord(
+        id=career_id,
+        name=sys.intern(name),
+        details=frozen,
+        description_lower=sys.intern(frozen.get("description", "").lower()),
+        skills_lower=tuple(sys.intern(skill.lower()) for skill in skills),
+        skill_ids=skill_ids,
+        skill_mask=ontology.career_mask(skill_ids),
+        education_lower=sys.intern(frozen.get("required_education", "").lower()),
+        environment_lower=sys.intern(frozen.get("work_environment", "").lower()),
+        outlook_lower=sys.intern(frozen.get("job_outlook", "").lower()),
+        salary_min=salary_min,
+        salary_max=salary_max,
+        growth_pct=parse_growth_rate(frozen.get("job_outlook", "")),
+        education_tier=education_tier(frozen.get("required_education", "")),
+    )
+
+def _thaw(value):
+    """Return a plain, picklable copy of a frozen career data value"""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+def _restore_catalog(source, default_details, generation):
+    """Rebuild a pickled CareerCatalog from its source"""
+    catalog = CareerCatalog(source, default_details)
+    catalog.generation = generation
+    return catalog
+
+def _source_version(source):
+    """Content hash of the catalog source, used to tag caches built from it"""
+    payload = json.dumps(source, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+class CareerCatalog:
+    """Immutable index of all careers, ordered by name"""
+
+    def __init__(self, source, default_details):
+        self.names = tuple(map(sys.intern, sorted(source)))
+        self.ontology = SkillOntology(SKILL_ONTOLOGY)  # Canonical skills plus those this catalog registers
+        self.records = tuple(_make_record(career_id, name, source[name], self.ontology)
+                             for career_id, name in enumerate(self.names))
+        self.version = _source_version(source)
+        self.generation = 0                # Set when the catalog registry publishes it
+        self._by_name = MappingProxyType({record.name: record for record in self.records})
+        self._default_details = CareerDetails(default_details)
+        self._derived = {}
+        self._derived_lock = threading.RLock()
+
+    def __reduce__(self):
+        # Pickled as its source (e.g. for spawned batch workers); indexes are rebuilt on load
+        source = {record.name: _thaw(record.details) for record in self.records}
+        return _restore_catalog, (source, _thaw(self._default_details), self.generation)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def get(self, name):
+        """Return the CareerRecord for a career, or None if it is not in the catalog"""
+        return self._by_name.get(name)
+
+    def details(self, name):
+        """Return the read-only details mapping for a career, or the default structure"""
+        record = self._by_name.get(name)
+        return record.details if record is not None else self._default_details
+
+    def derived(self, key, builder):
+        """
+        Return a structure precomputed from this catalog, building it on first use.
+
+        Indexes that depend on the catalog contents (scoring masks, lookup tables)
+        are attached here so they live and die with the catalog they describe.
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = builder(self)
+                    self._derived[key] = value
+        return value
+
+def build_catalog(source=None, default_details=None):
+    """
+    Compile a career catalog.
+
+    Args:
+        source: Mapping of career name to details; defaults to career_data.CAREER_DATA
+        default_details: Details returned for unknown careers
+
+    Returns:
+        CareerCatalog
+    """
+    if source is None or default_details is None:
+        from career_data import CAREER_DATA, DEFAULT_CAREER_DETAILS
+        source = CAREER_DATA if source is None else source
+        default_details = DEFAULT_CAREER_DETAILS if default_details is None else default_details
+    catalog = CareerCatalog(source, default_details)
+    logger.debug(f"Built career catalog {catalog.version} with {len(catalog)} careers")
+    return catalog
+
+class CatalogRegistry:
+    """
+    Holds the catalog snapshot currently being served.
+
+    A new snapshot is built and indexed completely before swap() publishes it
+    with a single reference assignment, so readers see either the old catalog
+    or the new one, never a partial one. Each published snapshot gets the next
+    generation number, which result caches key on.
+    """
+
+    def __init__(self):
+        self._current = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """Return the catalog being served, building the built-in one on first use"""
+        catalog = self._current
+        if catalog is None:
+            with self._lock:
+                if self._current is None:
+                    self._publish(build_catalog())
+                catalog = self._current
+        return catalog
+
+    def _publish(self, catalog):
+        """Number and publish a catalog; caller holds the lock"""
+        self._generation += 1
+        catalog.generation = self._generation
+        self._current = catalog
+
+    def swap(self, catalog):
+        """
+        Serve a fully built catalog from now on.
+
+        Returns:
+            False when it has the same contents as the catalog already served,
+            which is then kept along with its indexes
+        """
+        with self._lock:
+            if self._current is not None and self._current.version == catalog.version:
+                return False
+            self._publish(catalog)
+        logger.info(f"Serving career catalog {catalog.version} (generation {catalog.generation}) "
+                    f"with {len(catalog)} careers")
+        return True
+
+catalog_registry = CatalogRegistry()
+
+# Catalog pinned for the current request, so one request never mixes two snapshots
+_pinned_catalog = contextvars.ContextVar("pinned_catalog", default=None)
+
+def get_catalog():
+    """Return the catalog pinned for this request, or the one currently served"""
+    catalog = _pinned_catalog.get()
+    return catalog if catalog is not None else catalog_registry.current()
+
+def pin_catalog():
+    """Pin the catalog currently served for the rest of this context; returns a token for release_catalog"""
+    return _pinned_catalog.set(catalog_registry.current())
+
+def release_catalog(token):
+    """Undo pin_catalog"""
+    _pinned_catalog.reset(token)
+
+def set_catalog(catalog):
+    """Replace the served career catalog, e.g. with a snapshot loaded from the database"""
+    return catalog_registry.swap(catalog)
@@ -0,0 +1,145 @@
+# Catalog reloader module - rebuilds the career catalog off the request path
+#
+# A background thread polls the catalog source: the catalog revision row when
+# careers are served from the database, or the modification time of a career
+# file when one is configured. When the source changes, the new snapshot is
+# loaded and every derived index is built before it is swapped into the
+# catalog registry, so no request waits on or sees a half-built index. Requests
+# in flight finish on the snapshot they pinned; result caches move to the new
+# catalog generation as soon as it is served.
+
+import logging
+import os
+import threading
+import time
+
+from career_filters import get_filter_index
+from career_search import get_search_index
+from catalog import build_catalog, catalog_registry
+from catalog_store import catalog_revision, load_catalog_snapshot, load_source_file
+from course_catalog import get_course_catalog
+from roadmaps import get_roadmap_index
+from scoring import get_scoring_index
+from similarity import get_similarity_index
+from transition_planner import get_transition_graph
+from transitions import get_transition_matrix
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+RELOAD_INTERVAL_SECONDS = 30
+
+# Builders of every per-catalog index, run on a new snapshot before it is served
+CATALOG_INDEXES = (
+    get_scoring_index,
+    get_filter_index,
+    get_course_catalog,
+    get_roadmap_index,
+    get_transition_matrix,
+    get_transition_graph,
+    get_similarity_index,
+    get_search_index,
+)
+
+def warm_catalog(catalog):
+    """Build every derived index of a catalog"""
+    for build_index in CATALOG_INDEXES:
+        build_index(catalog)
+
+class CatalogReloader:
+    """Watches the catalog source and swaps in rebuilt snapshots"""
+
+    def __init__(self, app, interval=RELOAD_INTERVAL_SECONDS, source_file=None):
+        """
+        Args:
+            app: Flask app whose database holds the catalog
+            interval: Seconds between source checks; 0 disables the background thread
+            source_file: JSON or CSV career file to serve instead of the database
+        """
+        self.app = app
+        self.interval = interval
+        self.source_file = source_file
+        self.revision = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+    def source_revision(self):
+        """Cheap marker of the source's current contents"""
+        if self.source_file:
+            stat = os.stat(self.source_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        with self.app.app_context():
+            return catalog_revision()
+
+    def load(self):
+        """Compile the source into a catalog, or None if the database holds no careers"""
+        if self.source_file:
+            return build_catalog(load_source_file(self.source_file))
+        with self.app.app_context():
+            return load_catalog_snapshot()
+
+    def check(self, warm=True):
+        """
+        Reload the catalog if its source changed since the last check.
+
+        Args:
+            warm: Build every index of the new catalog before serving it
+
+        Returns:
+            True if a new catalog is now being served
+        """
+        with self._lock:
+            # The revision is read before loading, so a write during the load triggers another reload
+            revision = self.source_revision()
+            if revision == self.revision:
+                return False
+            start = time.perf_counter()
+            catalog = self.load()
+            self.revision = revision
+            if catalog is None:
+                return False
+            if warm:
+                warm_catalog(catalog)
+            swapped = catalog_registry.swap(catalog)
+            if swapped:
+                logger.info(f"Reloaded career catalog {catalog.version} in {time.perf_counter() - start:.2f}s")
+            return swapped
+
+    def ensure_started(self):
+        """
+        Load the catalog and start the polling thread on this process's first request; safe after fork.
+
+        The catalog is only loaded here if no check has run yet, so a process
+        forked after a preload starts serving straight away. Its indexes are
+        built on first use rather than before the first response.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self.revision is None:
+                try:
+                    self.check(warm=False)
+                except Exception:
+                    logger.exception("Could not load the career catalog; serving the built-in careers "
+                                     "(has `flask init-db` been run?)")
+            if self.interval > 0:
+                self._stop = threading.Event()
+                thread = threading.Thread(target=self._run, args=(self._stop,), name="catalog-reloader", daemon=True)
+                thread.start()
+            self._pid = os.getpid()
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop.set()
+        self._pid = None
+
+    def _run(self, stop):
+        while not stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Career catalog reload failed; still serving the previous catalog")
@@ -0,0 +1,222 @@
+# Catalog store module - the career catalog in the database
+#
+# Careers live in the career table with their skills, work environments,
+# related careers and resources in association tables. Seeding upserts a source
+# (career_data.CAREER_DATA or a JSON/CSV file) in batches, one executemany per
+# table per batch. At startup the whole catalog is read back with one query
+# per table and compiled into the usual in-memory CareerCatalog, so requests
+# never query careers individually. Writers bump the catalog revision when they
+# finish so running servers know to load a new snapshot.
+
+import csv
+import json
+import logging
+import time
+from itertools import islice
+
+from sqlalchemy import delete, insert, select, update
+
+from catalog import build_catalog
+from extensions import db
+from models import (Career, CareerEnvironment, CareerRelated, CareerResource, CareerSkill, CatalogRevision, Skill,
+                    WorkEnvironment)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SEED_BATCH_SIZE = 500
+CSV_LIST_SEPARATOR = ";"
+LIST_FIELDS = ("required_skills", "related_careers", "resources")
+CAREER_COLUMNS = ("description", "required_education", "salary_range", "job_outlook")
+
+def load_source_file(path):
+    """
+    Read careers from a JSON or CSV file into the CAREER_DATA format.
+
+    JSON files hold either a mapping of career name to details or a list of
+    objects with a "name". CSV files have a header row with "name" and the
+    detail fields; list fields are semicolon-separated.
+    """
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if isinstance(data, list):
+            data = {item["name"]: {key: value for key, value in item.items() if key != "name"} for item in data}
+        return data
+
+    source = {}
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        for row in csv.DictReader(handle):
+            details = {key: value for key, value in row.items() if key != "name"}
+            for field in LIST_FIELDS:
+                details[field] = [item.strip() for item in (row.get(field) or "").split(CSV_LIST_SEPARATOR)
+                                  if item.strip()]
+            source[row["name"]] = details
+    return source
+
+def _split_environments(work_environment):
+    """Work environment names from a comma-separated description"""
+    return [environment.strip() for environment in (work_environment or "").split(",") if environment.strip()]
+
+def upsert_statement(model, key, columns=()):
+    """
+    INSERT ... ON CONFLICT statement for a model's table.
+
+    Args:
+        model: Model class
+        key: Unique column the conflict is detected on
+        columns: Columns overwritten on conflict; when empty existing rows are kept
+
+    Raises:
+        ValueError: On databases without ON CONFLICT support
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        raise ValueError(f"Bulk upserts are not supported on {dialect}")
+    statement = dialect_insert(model.__table__)
+    if columns:
+        return statement.on_conflict_do_update(index_elements=[key],
+                                               set_={column: statement.excluded[column] for column in columns})
+    return statement.on_conflict_do_nothing(index_elements=[key])
+
+def name_ids(model, names):
+    """Dictionary of name to id for rows of a model with a unique name"""
+    rows = db.session.execute(select(model.name, model.id).where(model.name.in_(list(names))))
+    return dict(rows.all())
+
+def _seed_batch(batch):
+    """Upsert one batch of (name, details) pairs and replace their association rows"""
+    db.session.execute(upsert_statement(Career, "name", CAREER_COLUMNS), [
+        {"name": name, **{column: details.get(column, "") for column in CAREER_COLUMNS}}
+        for name, details in batch
+    ])
+    career_ids = name_ids(Career, [name for name, _ in batch])
+
+    skills = {skill for _, details in batch for skill in details.get("required_skills", ())}
+    environments = {environment for _, details in batch
+                    for environment in _split_environments(details.get("work_environment"))}
+    if skills:
+        db.session.execute(upsert_statement(Skill, "name"), [{"name": skill} for skill in skills])
+    if environments:
+        db.session.execute(upsert_statement(WorkEnvironment, "name"), [{"name": name} for name in environments])
+    skill_ids = name_ids(Skill, skills) if skills else {}
+    environment_ids = name_ids(WorkEnvironment, environments) if environments else {}
+
+    associations = {CareerSkill: [], CareerEnvironment: [], CareerRelated: [], CareerResource: []}
+    for name, details in batch:
+        career_id = career_ids[name]
+        for position, skill in enumerate(dict.fromkeys(details.get("required_skills", ()))):
+            associations[CareerSkill].append({"career_id": career_id, "skill_id": skill_ids[skill], "position": position})
+        for position, environment in enumerate(dict.fromkeys(_split_environments(details.get("work_environment")))):
+            associations[CareerEnvironment].append(
+                {"career_id": career_id, "environment_id": environment_ids[environment], "position": position})
+        for position, related in enumerate(details.get("related_careers", ())):
+            associations[CareerRelated].append({"career_id": career_id, "position": position, "name": related})
+        for position, resource in enumerate(details.get("resources", ())):
+            associations[CareerResource].append({"career_id": career_id, "position": position, "name": resource})
+
+    ids = list(career_ids.values())
+    for model, rows in associations.items():
+        db.session.execute(delete(model).where(model.career_id.in_(ids)))
+        if rows:
+            db.session.execute(insert(model), rows)
+
+def seed_catalog(source=None, batch_size=SEED_BATCH_SIZE):
+    """
+    Upsert careers into the database.
+
+    Each batch is committed in its own transaction and every write is an
+    upsert, so a failed seed can simply be re-run. Existing careers are updated
+    in place; careers missing from the source are left alone.
+
+    Args:
+        source: Mapping of career name to details; defaults to career_data.CAREER_DATA
+        batch_size: Careers per transaction
+
+    Returns:
+        Number of careers written
+    """
+    if source is None:
+        from career_data import CAREER_DATA
+        source = CAREER_DATA
+    items = iter(source.items())
+    written = 0
+    start = time.perf_counter()
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            break
+        _seed_batch(batch)
+        db.session.commit()
+        written += len(batch)
+    bump_catalog_revision()
+    elapsed = time.perf_counter() - start
+    logger.info(f"Seeded {written} careers in {elapsed:.2f}s ({written / elapsed if elapsed else 0:.0f} careers/sec)")
+    return written
+
+def catalog_revision():
+    """Current catalog revision number; 0 before anything has been written"""
+    return db.session.execute(select(CatalogRevision.revision).where(CatalogRevision.id == 1)).scalar() or 0
+
+def bump_catalog_revision():
+    """Record that the career tables changed; commits and returns the new revision"""
+    result = db.session.execute(update(CatalogRevision).where(CatalogRevision.id == 1)
+                                .values(revision=CatalogRevision.revision + 1))
+    if not result.rowcount:
+        db.session.execute(upsert_statement(CatalogRevision, "id"), [{"id": 1, "revision": 1}])
+    db.session.commit()
+    return catalog_revision()
+
+def load_catalog_source():
+    """
+    Read every career from the database in the CAREER_DATA format.
+
+    Uses one query per table whatever the catalog size.
+
+    Returns:
+        Dictionary of career name to details, or None if no careers are stored
+    """
+    careers = db.session.execute(select(Career.id, Career.name, *(getattr(Career, column) for column in CAREER_COLUMNS)))
+    details = {}
+    names = {}
+    for career_id, name, *values in careers:
+        names[career_id] = name
+        details[career_id] = {
+            **{column: value or "" for column, value in zip(CAREER_COLUMNS, values)},
+            "required_skills": [],
+            "work_environment": [],
+            "related_careers": [],
+            "resources": [],
+        }
+    if not details:
+        return None
+
+    lists = [
+        ("required_skills", select(CareerSkill.career_id, Skill.name).join(Skill, Skill.id == CareerSkill.skill_id)
+         .order_by(CareerSkill.career_id, CareerSkill.position)),
+        ("work_environment", select(CareerEnvironment.career_id, WorkEnvironment.name)
+         .join(WorkEnvironment, WorkEnvironment.id == CareerEnvironment.environment_id)
+         .order_by(CareerEnvironment.career_id, CareerEnvironment.position)),
+        ("related_careers", select(CareerRelated.career_id, CareerRelated.name)
+         .order_by(CareerRelated.career_id, CareerRelated.position)),
+        ("resources", select(CareerResource.career_id, CareerResource.name)
+         .order_by(CareerResource.career_id, CareerResource.position)),
+    ]
+    for field, statement in lists:
+        for career_id, value in db.session.execute(statement):
+            details[career_id][field].append(value)
+
+    for career in details.values():
+        career["work_environment"] = ", ".join(career["work_environment"])
+    return {names[career_id]: career for career_id, career in details.items()}
+
+def load_catalog_snapshot():
+    """Compile the stored careers into a CareerCatalog, or None if none are stored"""
+    source = load_catalog_source()
+    if source is None:
+        return None
+    return build_catalog(source)
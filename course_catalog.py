@@ -0,0 +1,122 @@
+# Course catalog module - online courses indexed by the skill they teach
+#
+# Courses are laid out once per career catalog: every required skill gets a
+# beginner, intermediate and advanced course on a fixed platform. Looking up
+# courses for a whole skill-gap list is then a set of dict hits, and the same
+# skill always yields the same course.
+
+import logging
+import random
+import zlib
+from collections import namedtuple
+
+from catalog import get_catalog
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+COURSE_LEVELS = ["Beginner", "Intermediate", "Advanced"]
+
+# Online learning platforms: title prefixes and typical duration for each level
+COURSE_PLATFORMS = {
+    "Coursera": {
+        "Beginner": (["Introduction to", "Fundamentals of"], "4 weeks"),
+        "Intermediate": (["Specialization in"], "3 months"),
+        "Advanced": (["Professional Certificate in", "Master"], "6 months"),
+    },
+    "edX": {
+        "Beginner": (["Introduction to"], "6 weeks"),
+        "Intermediate": (["XSeries Program in"], "3 months"),
+        "Advanced": (["Professional Certificate in", "MicroMasters in"], "9 months"),
+    },
+    "Udemy": {
+        "Beginner": (["Crash Course in", "Complete"], "8 hours"),
+        "Intermediate": (["Bootcamp", "Ultimate"], "25 hours"),
+        "Advanced": (["Masterclass"], "40 hours"),
+    },
+    "LinkedIn Learning": {
+        "Beginner": (["Learning", "Essential"], "2 hours"),
+        "Intermediate": (["Skills in", "Becoming a"], "6 hours"),
+        "Advanced": (["Advanced"], "4 hours"),
+    },
+    "Khan Academy": {
+        "Beginner": (["Basics of"], "3 weeks"),
+        "Intermediate": (["Core Concepts in"], "6 weeks"),
+        "Advanced": (["Essentials of"], "8 weeks"),
+    },
+    "Pluralsight": {
+        "Beginner": (["Getting Started with", "Fundamentals of"], "3 hours"),
+        "Intermediate": (["Path to"], "12 hours"),
+        "Advanced": (["Deep Dive into"], "8 hours"),
+    },
+    "Codecademy": {
+        "Beginner": (["Learn"], "10 hours"),
+        "Intermediate": (["Build with"], "20 hours"),
+        "Advanced": (["Skill Path:"], "40 hours"),
+    },
+}
+COURSE_PLATFORM_NAMES = list(COURSE_PLATFORMS)
+
+Course = namedtuple("Course", ["title", "platform", "skill", "level", "duration"])
+
+def _stable_hash(text):
+    """Process-independent hash used to lay out courses"""
+    return zlib.crc32(text.encode("utf-8"))
+
+def make_courses(skill):
+    """Build the beginner, intermediate and advanced course for a skill"""
+    courses = []
+    for level in COURSE_LEVELS:
+        selector = _stable_hash(f"{skill.lower()}|{level}")
+        platform = COURSE_PLATFORM_NAMES[selector % len(COURSE_PLATFORM_NAMES)]
+        prefixes, duration = COURSE_PLATFORMS[platform][level]
+        prefix = prefixes[(selector // len(COURSE_PLATFORM_NAMES)) % len(prefixes)]
+        courses.append(Course(f"{prefix} {skill}", platform, skill, level, duration))
+    return tuple(courses)
+
+class CourseCatalog:
+    """Courses for every skill a career catalog mentions, indexed by skill"""
+
+    def __init__(self, catalog):
+        skills = {}
+        for record in catalog:
+            for skill in record.details.get("required_skills", ()):
+                skills.setdefault(skill.lower(), skill)
+        self.by_skill = {key: make_courses(skill) for key, skill in skills.items()}
+
+    def __len__(self):
+        return sum(len(courses) for courses in self.by_skill.values())
+
+    def courses_for(self, skill):
+        """All courses for a skill, beginner first; unknown skills get courses laid out on the fly"""
+        courses = self.by_skill.get(skill.lower())
+        return courses if courses is not None else make_courses(skill)
+
+    def recommend(self, skill_gaps, limit=3, level="Beginner", seed=None):
+        """
+        Pick one course for each of the first `limit` skill gaps.
+
+        Args:
+            skill_gaps: Skills the user needs to develop, most important first
+            limit: Maximum number of courses to return
+            level: Preferred course level
+            seed: When given, choose among each skill's courses with a random
+                generator seeded with this value instead of by level; used by
+                tests that want varied but reproducible suggestions
+
+        Returns:
+            List of course dictionaries with title, platform, skill, level and duration
+        """
+        level_index = COURSE_LEVELS.index(level) if level in COURSE_LEVELS else 0
+        rng = random.Random(seed) if seed is not None else None
+        recommendations = []
+        for skill in skill_gaps[:limit]:
+            courses = self.courses_for(skill)
+            course = rng.choice(courses) if rng is not None else courses[level_index]
+            recommendations.append(course._asdict())
+        return recommendations
+
+def get_course_catalog(catalog=None):
+    """Return the course catalog for a career catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("courses", CourseCatalog)
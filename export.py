@@ -0,0 +1,210 @@
+# Export module - stream recommendations for every stored user profile
+#
+# Profiles are read in id order through a server-side cursor (yield_per), as
+# plain column tuples so no ORM objects pile up in the session, and each one is
+# scored and written out before the next is fetched. Memory use therefore stays
+# flat however large the UserProfile table is. Every output row carries its
+# profile id, so an interrupted export resumes with after_id set to the last
+# profile written in full.
+
+import csv
+import io
+import json
+import logging
+import os
+
+from extensions import db
+from models import UserProfile
+from recommendation_engine import get_career_recommendations
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_PAGE_SIZE = 500
+RESUME_READ_SIZE = 65536        # Bytes read at a time, backwards, when resuming an export file
+CSV_COLUMNS = ["profile_id", "user_id", "rank", "career", "score", "match_reasons"]
+
+def _answer_list(value):
+    """Read a list answer stored as a JSON list or a comma/semicolon separated string"""
+    if not value:
+        return []
+    text = value.strip()
+    if text.startswith("["):
+        try:
+            return [str(item).strip() for item in json.loads(text) if str(item).strip()]
+        except ValueError:
+            pass
+    return [item.strip() for item in text.replace(";", ",").split(",") if item.strip()]
+
+def iter_profile_rows(after_id=0, page_size=EXPORT_PAGE_SIZE):
+    """
+    Stream UserProfile rows in id order.
+
+    Args:
+        after_id: Only rows with a greater id are returned
+        page_size: Rows fetched from the database cursor at a time
+
+    Yields:
+        Row tuples of (id, user_id, interests, skills, values, personality,
+        education_level, preferred_work_environment)
+    """
+    statement = (
+        db.select(UserProfile.id, UserProfile.user_id, UserProfile.interests, UserProfile.skills,
+                  UserProfile.values, UserProfile.personality, UserProfile.education_level,
+                  UserProfile.preferred_work_environment)
+        .where(UserProfile.id > (after_id or 0))
+        .order_by(UserProfile.id)
+        .execution_options(yield_per=page_size)
+    )
+    yield from db.session.execute(statement)
+
+def iter_profile_recommendations(after_id=0, limit=5, page_size=EXPORT_PAGE_SIZE):
+    """
+    Recommend careers for each stored profile.
+
+    Yields:
+        Dictionaries with the profile id, user id and the profile's recommendations
+    """
+    for profile_id, user_id, interests, skills, values, personality, education, work_environment in \
+            iter_profile_rows(after_id, page_size):
+        recommendations = get_career_recommendations(
+            _answer_list(interests), _answer_list(skills), _answer_list(values), personality or "",
+            education or "", _answer_list(work_environment), limit=limit)
+        yield {
+            "profile_id": profile_id,
+            "user_id": user_id,
+            "recommendations": [
+                {
+                    "career": recommendation["career"],
+                    "score": recommendation["score"],
+                    "match_reasons": recommendation["match_reasons"],
+                }
+                for recommendation in recommendations
+            ],
+        }
+
+def format_ndjson(records):
+    """Encode export records as NDJSON lines"""
+    for record in records:
+        yield json.dumps(record) + "\n"
+
+def format_csv(records, header=True):
+    """Encode export records as CSV lines, one per recommended career"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    if header:
+        writer.writerow(CSV_COLUMNS)
+        yield flush()
+    for record in records:
+        for rank, recommendation in enumerate(record["recommendations"], 1):
+            writer.writerow([record["profile_id"], record["user_id"], rank, recommendation["career"],
+                             recommendation["score"], "; ".join(recommendation["match_reasons"])])
+        yield flush()
+
+def export_recommendations(export_format="ndjson", after_id=0, limit=5, header=True):
+    """
+    Stream recommendations for all stored profiles in an export format.
+
+    Args:
+        export_format: One of EXPORT_FORMATS
+        after_id: Resume after this profile id
+        limit: Recommendations per profile
+        header: Start CSV output with a header row
+
+    Returns:
+        Iterator of text chunks
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    records = iter_profile_recommendations(after_id, limit)
+    if export_format == "csv":
+        return format_csv(records, header=header)
+    return format_ndjson(records)
+
+def _row_profile_id(line, export_format):
+    """Profile id of one complete export line, or None if it is not a data row"""
+    text = line.decode("utf-8", errors="ignore")
+    try:
+        if export_format == "csv":
+            return int(next(csv.reader([text]))[0])
+        return int(json.loads(text)["profile_id"])
+    except (ValueError, KeyError, IndexError, TypeError, StopIteration):
+        return None
+
+def _resume_point(tail, at_start, export_format):
+    """
+    Find where an export should be cut, in a tail of the file.
+
+    Returns:
+        (offset in tail, profile id) of the end of the last complete profile,
+        or None if the tail does not show one
+    """
+    lines = []                          # (start, end) of each complete line
+    position = 0 if at_start else tail.find(b"\n") + 1
+    if not at_start and position == 0:
+        return None
+    while True:
+        newline = tail.find(b"\n", position)
+        if newline < 0:
+            break
+        lines.append((position, newline + 1))
+        position = newline + 1
+
+    last_id = None
+    for start, end in reversed(lines):
+        profile_id = _row_profile_id(tail[start:end], export_format)
+        if profile_id is None:
+            continue
+        # An NDJSON line is a whole profile; the last CSV profile's rows may be cut short
+        if export_format != "csv" or (last_id is not None and profile_id != last_id):
+            return end, profile_id
+        last_id = profile_id
+    return None
+
+def resume_export_file(path, export_format="ndjson"):
+    """
+    Prepare an existing export file for appending.
+
+    The file is cut back to the end of the last profile known to be complete
+    and that profile's id is returned. For NDJSON that is the last complete
+    line. CSV has a row per recommendation, so the last profile in the file is
+    dropped as well, since a crash may have cut its rows short. The file is
+    read backwards from the end only as far as needed. Returns 0 if the file
+    is missing or holds no complete profile; the file then keeps only its CSV
+    header.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, "r+b") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        start = end
+        tail = b""
+        found = None
+        while found is None and start > 0:
+            block_start = max(0, start - RESUME_READ_SIZE)
+            handle.seek(block_start)
+            tail = handle.read(start - block_start) + tail
+            start = block_start
+            found = _resume_point(tail, start == 0, export_format)
+
+        if found is not None:
+            cut, profile_id = found
+            handle.truncate(start + cut)
+            return profile_id
+        handle.seek(0)
+        first_line = handle.readline()
+        header = export_format == "csv" and first_line.endswith(b"\n") and \
+            _row_profile_id(first_line, export_format) is None
+        handle.truncate(len(first_line) if header else 0)
+    return 0
@@ -0,0 +1,15 @@
+# Extensions module - Flask extensions shared by the app, models and stores
+#
+# The database handle lives here rather than in app.py, so models, stores and
+# command-line tools can import it without importing (and configuring) the web
+# app. app.py binds it to the app with db.init_app().
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import DeclarativeBase
+
+# Create SQLAlchemy Base
+class Base(DeclarativeBase):
+    pass
+
+# Initialize SQLAlchemy
+db = SQLAlchemy(model_class=Base)
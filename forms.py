@@ -1,11 +1,21 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField, SelectField, TextAreaField, SelectMultipleField, IntegerField
-from wtforms.validators import DataRequired, Length, Email, NumberRange
-from career_data import get_all_careers
+from wtforms import FieldList, StringField, SelectField, TextAreaField, SelectMultipleField, IntegerField
+from wtforms.validators import DataRequired, Length, Email, NumberRange, Optional, ValidationError
+from catalog import get_catalog
+from recommendation_engine import MAX_COMPARED_CAREERS
+
+class KnownCareer:
+    """Validate that a free-text career field names a career in the catalog"""
+    
+    def __init__(self, message='Please choose a career from the suggestions.'):
+        self.message = message
+    
+    def __call__(self, form, field):
+        if field.data not in get_catalog():
+            raise ValidationError(self.message)
 
 class CareerForm(FlaskForm):
-    career = SelectField('Career', validators=[DataRequired()], 
-                         choices=[(career, career) for career in get_all_careers()])
+    career = StringField('Career', validators=[DataRequired(), KnownCareer()])
     experience_level = SelectField('Experience Level', validators=[DataRequired()],
                                   choices=[
                                       ('entry', 'Entry Level (0-2 years)'),
@@ -39,10 +49,17 @@ class CareerForm(FlaskForm):
 
 
 class ComparisonForm(FlaskForm):
-    career1 = SelectField('First Career', validators=[DataRequired()], 
-                          choices=[(career, career) for career in get_all_careers()])
-    career2 = SelectField('Second Career', validators=[DataRequired()], 
-                          choices=[(career, career) for career in get_all_careers()])
+    career1 = StringField('First Career', validators=[DataRequired(), KnownCareer()])
+    career2 = StringField('Second Career', validators=[DataRequired(), KnownCareer()])
+
+class MultiComparisonForm(FlaskForm):
+    # One typeahead input per slot; blank slots are skipped
+    careers = FieldList(StringField('Career', validators=[Optional(), KnownCareer()]),
+                        min_entries=MAX_COMPARED_CAREERS, max_entries=MAX_COMPARED_CAREERS)
+
+class TransitionPathForm(FlaskForm):
+    current_career = StringField('Current Career', validators=[DataRequired(), KnownCareer()])
+    target_career = StringField('Target Career', validators=[DataRequired(), KnownCareer()])
 
 class QuestionnaireForm(FlaskForm):
     interests = SelectMultipleField('What are your main interests?', validators=[DataRequired()],
@@ -0,0 +1,178 @@
+# Fragment cache module - rendered career panels shared between result pages
+#
+# The career-specific panels of result.html (description, required skills,
+# salary and outlook, related careers, resources) are the same for every
+# visitor. Each panel template is rendered once per career and catalog version
+# and kept in a size-bounded LRU. The few per-visitor bits (match score and
+# reasons, skill highlighting, course suggestions) are marked in the panel
+# template with named slots; a cached panel is stored pre-split at its slots,
+# so layering a visitor's values on top is a string join rather than a render.
+# Slot markers carry a random token drawn for each render, so catalog text
+# that happens to contain the marker characters is never split as a slot.
+# Hits, misses and render time are counted per panel so the savings show up
+# in /api/cache_stats.
+
+import logging
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+from markupsafe import Markup, escape
+
+from catalog import get_catalog
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+FRAGMENT_TEMPLATE = "fragments/{name}.html"
+
+SLOT_TOKEN_BYTES = 8
+
+def fragment_slot(name, token=""):
+    """Template helper marking where a per-visitor value goes in a cached panel"""
+    return Markup(f"\x00{token}:{escape(name)}\x00")
+
+def _slot_pattern(token):
+    return re.compile(re.escape(f"\x00{token}:") + "([^\x00]*)\x00")
+
+class Fragment:
+    """A rendered panel split at its slots"""
+
+    __slots__ = ("parts", "slots", "size")
+
+    def __init__(self, html, token=""):
+        """
+        Args:
+            html: Rendered panel
+            token: Token its slots were marked with, see fragment_slot
+        """
+        pieces = _slot_pattern(token).split(html)
+        self.parts = tuple(Markup(piece) for piece in pieces[0::2])
+        self.slots = tuple(pieces[1::2])
+        self.size = len(html)
+
+    def fill(self, layers=None, **named):
+        """
+        Join the panel with per-visitor values in its slots.
+
+        Args:
+            layers: Mapping of slot name to value
+            named: More slot values by keyword; slots without a value are left empty
+
+        Returns:
+            Markup; values that are not Markup are escaped
+        """
+        values = dict(layers or (), **named)
+        output = [self.parts[0]]
+        for slot, part in zip(self.slots, self.parts[1:]):
+            output.append(escape(values.get(slot, "")))
+            output.append(part)
+        return Markup("".join(output))
+
+    def __html__(self):
+        return self.fill()
+
+class FragmentCache:
+    """Thread-safe LRU of rendered panels, bounded by total size in characters"""
+
+    def __init__(self, max_bytes=FRAGMENT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self._panels = {}          # Panel name to [hits, misses, render seconds]
+
+    def get(self, name, career, version, render):
+        """
+        Return the Fragment for a panel, rendering it on a miss.
+
+        Args:
+            name: Panel template name
+            career: Career the panel describes
+            version: Catalog version the panel was rendered from
+            render: Callable returning the panel's Fragment
+        """
+        key = (name, career, version)
+        with self._lock:
+            counters = self._panels.setdefault(name, [0, 0, 0.0])
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                counters[0] += 1
+                return fragment
+
+        start = time.perf_counter()
+        fragment = render()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            counters[1] += 1
+            counters[2] += elapsed
+            if fragment.size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = fragment
+                self.size += fragment.size
+                while self.size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.size -= evicted.size
+                    self.evictions += 1
+        return fragment
+
+    def clear(self):
+        """Drop all panels; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Return the cache counters, with the render time hits saved estimated from the average miss"""
+        with self._lock:
+            panels = {}
+            saved = 0.0
+            for name, (hits, misses, seconds) in self._panels.items():
+                average = seconds / misses if misses else 0.0
+                saved += hits * average
+                panels[name] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "avg_render_ms": round(average * 1000, 3),
+                    "saved_ms": round(hits * average * 1000, 1),
+                }
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "saved_ms": round(saved * 1000, 1),
+                "panels": panels,
+            }
+
+# Process-wide cache for result.html panels
+fragment_cache = FragmentCache()
+
+def career_fragment(name, career):
+    """
+    Template helper returning a career's cached panel.
+
+    The panel template gets the career name, its details and its catalog
+    record (None for careers outside the catalog). Its fragment_slot marks
+    slots with a token drawn for this render.
+    """
+    catalog = get_catalog()
+
+    def render():
+        template = current_app.jinja_env.get_template(FRAGMENT_TEMPLATE.format(name=name))
+        token = secrets.token_hex(SLOT_TOKEN_BYTES)
+        html = template.render(career=career, details=catalog.details(career), record=catalog.get(career),
+                               fragment_slot=lambda slot: fragment_slot(slot, token))
+        return Fragment(html, token)
+
+    return fragment_cache.get(name, career, catalog.version, render)
+
+def skill_match_layers(skills, user_skills):
+    """Slot values marking required skills that appear in the visitor's skills"""
+    user_text = " ".join(user_skills or ()).lower()
+    return {f"skill:{index}": " matched" for index, skill in enumerate(skills) if skill.lower() in user_text}
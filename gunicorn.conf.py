@@ -0,0 +1,29 @@
+# Gunicorn settings - build the app and its career catalog once, before workers fork
+#
+# With preload on, the master imports the app, loads the catalog and builds
+# every derived index, then freezes the garbage collector's view of those
+# objects. Workers forked afterwards share the pages copy-on-write: the
+# collector never walks (and so never writes to) the frozen objects, so the
+# catalog is held in memory once rather than once per worker. Set
+# PRELOAD_APP=0 to load the app in each worker instead, e.g. with --reload.
+
+import gc
+import os
+
+preload_app = os.environ.get("PRELOAD_APP", "1") != "0"
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+def when_ready(server):
+    """Runs in the master once the app is loaded, before the first worker is forked"""
+    if not server.cfg.preload_app:
+        return
+    from app import preload_app as preload
+    preload()
+    # Move everything allocated so far out of the collector's generations
+    gc.freeze()
+    server.log.info(f"Preloaded the career catalog; {gc.get_freeze_count()} objects frozen for sharing")
+
+def worker_exit(server, worker):
+    """Runs in a worker as it exits; stops the batch pool it may have started"""
+    from batch import shutdown_pool
+    shutdown_pool()
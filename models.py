@@ -1,4 +1,4 @@
-from app import db
+from extensions import db
 from flask_login import UserMixin
 from datetime import datetime
 
@@ -39,13 +39,82 @@ class Career(db.Model):
     name = db.Column(db.String(128), unique=True, nullable=False)
     description = db.Column(db.Text)
     required_education = db.Column(db.String(128))
-    required_skills = db.Column(db.Text)
+    required_skills = db.Column(db.Text)  # Legacy free text; skills are stored in career_skill
     salary_range = db.Column(db.String(64))
     job_outlook = db.Column(db.String(64))
     
     def __repr__(self):
         return f'<Career {self.name}>'
 
+class Skill(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(128), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f'<Skill {self.name}>'
+
+class WorkEnvironment(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(128), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f'<WorkEnvironment {self.name}>'
+
+class CareerSkill(db.Model):
+    # Required skills of a career, in display order
+    career_id = db.Column(db.Integer, db.ForeignKey('career.id', ondelete='CASCADE'), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skill.id', ondelete='CASCADE'), primary_key=True, index=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<CareerSkill {self.career_id} {self.skill_id}>'
+
+class CareerEnvironment(db.Model):
+    # Work environments of a career, in display order
+    career_id = db.Column(db.Integer, db.ForeignKey('career.id', ondelete='CASCADE'), primary_key=True)
+    environment_id = db.Column(db.Integer, db.ForeignKey('work_environment.id', ondelete='CASCADE'),
+                               primary_key=True, index=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<CareerEnvironment {self.career_id} {self.environment_id}>'
+
+class CareerRelated(db.Model):
+    # Related career names; most are not careers in the catalog themselves
+    career_id = db.Column(db.Integer, db.ForeignKey('career.id', ondelete='CASCADE'), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(128), nullable=False)
+    
+    def __repr__(self):
+        return f'<CareerRelated {self.career_id} {self.name}>'
+
+class CareerResource(db.Model):
+    career_id = db.Column(db.Integer, db.ForeignKey('career.id', ondelete='CASCADE'), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(256), nullable=False)
+    
+    def __repr__(self):
+        return f'<CareerResource {self.career_id} {self.name}>'
+
+class CatalogRevision(db.Model):
+    # Single row bumped whenever the career tables are rewritten, so servers know to reload
+    id = db.Column(db.Integer, primary_key=True)
+    revision = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<CatalogRevision {self.revision}>'
+
+class StoredSession(db.Model):
+    # Server-side session data, keyed by the id in the session cookie
+    id = db.Column(db.String(64), primary_key=True)
+    revision = db.Column(db.Integer, nullable=False, default=0)
+    data = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f'<StoredSession {self.id[:8]}>'
+
 class CareerPath(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     career_id = db.Column(db.Integer, db.ForeignKey('career.id'), nullable=False)
@@ -0,0 +1,345 @@
+# O*NET import module - stream large occupation datasets into the career tables
+#
+# Reads the O*NET database text files (tab-separated, or comma-separated when
+# the file ends in .csv) row by row. Occupations become careers, skills with
+# enough importance become the careers' required skills, skill levels place
+# those skills on CareerPath stages, the most common education category sets
+# the required education, and related occupations fill the related careers.
+# O*NET files are sorted by occupation code, so rows are grouped per
+# occupation and written a chunk of occupations at a time: one executemany per
+# table per chunk, one transaction per chunk. Only the current chunk and a map
+# of occupation code to career id are kept in memory. Every write is an upsert
+# or a delete-and-insert of the chunk's own rows, so re-running an import
+# leaves the tables as they were. Rows with too few or too many fields, or a
+# blank required column, are rejected and logged rather than imported.
+
+import csv
+import logging
+import os
+import re
+import time
+from itertools import chain, groupby, islice
+
+from sqlalchemy import delete, insert, update
+
+from catalog_store import bump_catalog_revision, name_ids, upsert_statement
+from extensions import db
+from models import Career, CareerPath, CareerRelated, CareerSkill, Skill
+from roadmaps import STAGE_OUTLINES
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 200            # Occupations per transaction
+
+# Standard O*NET file names for each dataset
+ONET_FILES = {
+    "occupations": "Occupation Data.txt",
+    "skills": "Skills.txt",
+    "education": "Education, Training, and Experience.txt",
+    "related": "Related Occupations.txt",
+}
+CODE_COLUMN = "O*NET-SOC Code"
+
+# Columns every row of a dataset must fill; rows missing one are rejected
+REQUIRED_COLUMNS = {
+    "occupations": (CODE_COLUMN, "Title"),
+    "skills": (CODE_COLUMN, "Element Name", "Scale ID", "Data Value"),
+    "education": (CODE_COLUMN, "Scale ID", "Category", "Data Value"),
+    "related": (CODE_COLUMN, "Related O*NET-SOC Code"),
+}
+
+SKILL_MIN_IMPORTANCE = 3.0         # On the 1-5 importance (IM) scale
+MAX_SKILLS_PER_CAREER = 10
+MAX_RELATED_PER_CAREER = 10
+RELATED_TIERS = ("Primary-Short", "Primary-Long")
+
+# Upper bound of the 0-7 skill level (LV) scale for each roadmap stage
+STAGE_LEVEL_CEILINGS = {
+    "entry": 3.0,
+    "mid": 4.0,
+    "senior": 5.0,
+    "expert": float("inf"),
+}
+
+# Required level of education (RL) categories, worded so catalog education tiers recognise them
+EDUCATION_CATEGORIES = {
+    "1": "Less than a high school diploma",
+    "2": "High school diploma or equivalent",
+    "3": "Post-secondary certificate",
+    "4": "Some college courses",
+    "5": "Associate's degree",
+    "6": "Bachelor's degree",
+    "7": "Post-baccalaureate certificate",
+    "8": "Master's degree",
+    "9": "Post-master's certificate",
+    "10": "First professional degree (doctorate level)",
+    "11": "Doctoral degree (PhD)",
+    "12": "Post-doctoral training (PhD)",
+}
+
+def iter_rows(path):
+    """
+    Stream the rows of an O*NET text file as dictionaries.
+
+    Files ending in .csv are read as comma-separated with quoting; anything
+    else as the tab-separated O*NET text format, which is never quoted.
+    """
+    if path.lower().endswith(".csv"):
+        options = {"delimiter": ","}
+    else:
+        options = {"delimiter": "\t", "quoting": csv.QUOTE_NONE}
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        yield from csv.DictReader(handle, **options)
+
+def _malformed(row, columns):
+    """Why a row cannot be imported, or None when it has every required column filled"""
+    if None in row:
+        return "too many fields"
+    if None in row.values():
+        return "too few fields"
+    blank = [column for column in columns if not row[column].strip()]
+    return f"blank {', '.join(blank)}" if blank else None
+
+def _number(value):
+    """Float value of a data column, or None when it is blank or not a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _years(time_estimate):
+    """Years of experience at the start of a roadmap stage's time estimate"""
+    match = re.match(r"\d+", time_estimate)
+    return int(match.group()) if match else 0
+
+def _stage(skill_level):
+    """Roadmap stage whose level range holds a skill level"""
+    for level, ceiling in STAGE_LEVEL_CEILINGS.items():
+        if skill_level < ceiling:
+            return level
+    return STAGE_OUTLINES[-1][0]
+
+class OnetImporter:
+    """Imports O*NET files into the career tables, keeping a map of occupation code to career"""
+
+    def __init__(self, chunk_size=IMPORT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.careers = {}          # Occupation code to (career id, title)
+        self.skill_ids = {}        # Skill name to id
+
+    def _chunks(self, rows):
+        """Lists of (code, rows) groups, chunk_size occupations at a time"""
+        groups = ((code, list(group)) for code, group in groupby(rows, key=lambda row: row[CODE_COLUMN]))
+        while True:
+            chunk = list(islice(groups, self.chunk_size))
+            if not chunk:
+                break
+            yield chunk
+
+    def _run(self, name, path, columns, write_chunk):
+        """
+        Stream one file through a chunk writer, committing after every chunk.
+
+        Rows with the wrong number of fields or a blank required column are
+        logged and left out of the chunks.
+
+        Returns:
+            Number of rows read
+
+        Raises:
+            ValueError: If the file's header lacks a required column
+        """
+        counter = {"rows": 0, "rejected": 0}
+
+        def counted():
+            rows = iter_rows(path)
+            first = next(rows, None)
+            if first is not None:
+                missing = [column for column in columns if column not in first]
+                if missing:
+                    raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+                rows = chain((first,), rows)
+            for line, row in enumerate(rows, start=2):
+                counter["rows"] += 1
+                problem = _malformed(row, columns)
+                if problem:
+                    counter["rejected"] += 1
+                    logger.warning(f"Rejected {name} row {line}: {problem}")
+                    continue
+                row[CODE_COLUMN] = row[CODE_COLUMN].strip()
+                yield row
+
+        start = time.perf_counter()
+        for chunk in self._chunks(counted()):
+            write_chunk(chunk)
+            db.session.commit()
+        elapsed = time.perf_counter() - start
+        rows = counter["rows"]
+        logger.info(f"Imported {name}: {rows} rows ({counter['rejected']} rejected) in {elapsed:.2f}s "
+                    f"({rows / elapsed if elapsed else 0:.0f} rows/sec)")
+        return rows
+
+    def _known(self, chunk):
+        """Groups of a chunk whose occupation was imported, with their career ids"""
+        known = [(self.careers[code][0], rows) for code, rows in chunk if code in self.careers]
+        if len(known) < len(chunk):
+            logger.debug(f"Skipped {len(chunk) - len(known)} occupations missing from the occupation data")
+        return known
+
+    def import_occupations(self, path):
+        """Upsert a career per occupation, keyed by title; other career columns are left alone"""
+        def write_chunk(chunk):
+            titles = {}
+            for code, rows in chunk:
+                titles[code] = (rows[0]["Title"].strip(), rows[0].get("Description", "").strip())
+            db.session.execute(upsert_statement(Career, "name", ("description",)), [
+                {"name": title, "description": description, "required_education": "",
+                 "salary_range": "", "job_outlook": ""}
+                for title, description in dict(titles.values()).items()
+            ])
+            career_ids = name_ids(Career, {title for title, _ in titles.values()})
+            for code, (title, _) in titles.items():
+                self.careers[code] = (career_ids[title], title)
+
+        return self._run("occupations", path, REQUIRED_COLUMNS["occupations"], write_chunk)
+
+    def _skill_ids(self, names):
+        """Ids of skill names, upserting the ones not seen before"""
+        missing = set(names) - self.skill_ids.keys()
+        if missing:
+            db.session.execute(upsert_statement(Skill, "name"), [{"name": name} for name in missing])
+            self.skill_ids.update(name_ids(Skill, missing))
+        return self.skill_ids
+
+    def import_skills(self, path):
+        """
+        Replace the required skills and CareerPath stages of each occupation.
+
+        Skills rated at least SKILL_MIN_IMPORTANCE are kept, most important
+        first; each is placed on the roadmap stage its level falls in.
+        """
+        titles = dict(self.careers.values())
+
+        def write_chunk(chunk):
+            career_skills = {}
+            for career_id, rows in self._known(chunk):
+                ratings = {}
+                for row in rows:
+                    if row.get("Recommend Suppress") == "Y" or row.get("Not Relevant") == "Y":
+                        continue
+                    value = _number(row.get("Data Value"))
+                    if value is not None and row.get("Scale ID") in ("IM", "LV"):
+                        ratings.setdefault(row["Element Name"].strip(), {})[row["Scale ID"]] = value
+                important = sorted(
+                    ((ratings[name]["IM"], name, ratings[name].get("LV", 0.0)) for name in ratings
+                     if ratings[name].get("IM", 0.0) >= SKILL_MIN_IMPORTANCE),
+                    key=lambda item: (-item[0], item[1]))
+                career_skills[career_id] = [(name, level) for _, name, level in important[:MAX_SKILLS_PER_CAREER]]
+
+            skill_ids = self._skill_ids({name for skills in career_skills.values() for name, _ in skills})
+            skill_rows = []
+            path_rows = []
+            for career_id, skills in career_skills.items():
+                for position, (name, _) in enumerate(skills):
+                    skill_rows.append({"career_id": career_id, "skill_id": skill_ids[name], "position": position})
+                stages = {}
+                for name, skill_level in skills:
+                    stages.setdefault(_stage(skill_level), []).append(name)
+                for level, stage_title, description, time_estimate in STAGE_OUTLINES:
+                    path_rows.append({
+                        "career_id": career_id,
+                        "level": level,
+                        "title": f"{stage_title} {titles[career_id]}",
+                        "description": description.format(career=titles[career_id]),
+                        "required_skills": ", ".join(stages.get(level, ())),
+                        "required_experience": _years(time_estimate),
+                    })
+
+            career_ids = list(career_skills)
+            for model, rows in ((CareerSkill, skill_rows), (CareerPath, path_rows)):
+                db.session.execute(delete(model).where(model.career_id.in_(career_ids)))
+                if rows:
+                    db.session.execute(insert(model), rows)
+
+        return self._run("skills", path, REQUIRED_COLUMNS["skills"], write_chunk)
+
+    def import_education(self, path):
+        """Set each occupation's required education to its most commonly reported category"""
+        def write_chunk(chunk):
+            updates = []
+            for career_id, rows in self._known(chunk):
+                shares = {}
+                for row in rows:
+                    value = _number(row.get("Data Value"))
+                    if row.get("Scale ID") == "RL" and row.get("Category") in EDUCATION_CATEGORIES and value:
+                        shares[row["Category"]] = shares.get(row["Category"], 0.0) + value
+                if shares:
+                    category = max(shares, key=lambda key: (shares[key], -int(key)))
+                    updates.append({"id": career_id, "required_education": EDUCATION_CATEGORIES[category]})
+            if updates:
+                db.session.execute(update(Career), updates)
+
+        return self._run("education", path, REQUIRED_COLUMNS["education"], write_chunk)
+
+    def import_related(self, path):
+        """Replace each occupation's related careers with its closest related occupations"""
+        def write_chunk(chunk):
+            related_rows = []
+            career_ids = []
+            for career_id, rows in self._known(chunk):
+                career_ids.append(career_id)
+                ranked = sorted(
+                    (row for row in rows if row.get("Relatedness Tier", RELATED_TIERS[0]) in RELATED_TIERS),
+                    key=lambda row: _number(row.get("Index")) or 0.0)
+                names = [self.careers[row["Related O*NET-SOC Code"]][1] for row in ranked
+                         if row["Related O*NET-SOC Code"] in self.careers]
+                for position, name in enumerate(list(dict.fromkeys(names))[:MAX_RELATED_PER_CAREER]):
+                    related_rows.append({"career_id": career_id, "position": position, "name": name})
+            db.session.execute(delete(CareerRelated).where(CareerRelated.career_id.in_(career_ids)))
+            if related_rows:
+                db.session.execute(insert(CareerRelated), related_rows)
+
+        return self._run("related occupations", path, REQUIRED_COLUMNS["related"], write_chunk)
+
+def import_onet(directory, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Import an O*NET database directory into the career tables.
+
+    The occupation data is required; skills, education and related
+    occupations are imported when their files are present. Each chunk of
+    occupations is committed in its own transaction, so an interrupted import
+    can simply be re-run.
+
+    Args:
+        directory: Directory holding the ONET_FILES text files
+        chunk_size: Occupations per transaction
+
+    Returns:
+        Dictionary of dataset name to rows read
+
+    Raises:
+        ValueError: If the occupation data file is missing, or a file lacks a required column
+    """
+    paths = {name: os.path.join(directory, filename) for name, filename in ONET_FILES.items()}
+    if not os.path.exists(paths["occupations"]):
+        raise ValueError(f"Missing occupation data: {paths['occupations']}")
+
+    importer = OnetImporter(chunk_size)
+    steps = [
+        ("occupations", importer.import_occupations),
+        ("skills", importer.import_skills),
+        ("education", importer.import_education),
+        ("related", importer.import_related),
+    ]
+    counts = {}
+    start = time.perf_counter()
+    for name, step in steps:
+        if os.path.exists(paths[name]):
+            counts[name] = step(paths[name])
+    bump_catalog_revision()
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    logger.info(f"Imported {len(importer.careers)} occupations from {total} rows in {elapsed:.2f}s "
+                f"({total / elapsed if elapsed else 0:.0f} rows/sec)")
+    return counts
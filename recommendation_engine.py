@@ -1,63 +1,122 @@
 import logging
-from career_data import get_all_careers, get_career_details
-import random
+from career_filters import get_filter_index
+from catalog import get_catalog
+from course_catalog import get_course_catalog
+from roadmaps import (
+    DEFAULT_BASE_EDUCATION, STAGE_INDEX, education_requirements, filter_known_skills,
+    get_roadmap_index, typical_roles,
+)
+from skill_ontology import has_skill
+from scoring import (
+    PERSONALITY_KEYWORDS, VALUE_REASONS, education_level, education_match,
+    environment_matches_career, get_scoring_index, interest_matches_career,
+    personality_matches_career, skill_matches_career, value_matches_career,
+)
+from transitions import get_transition_matrix
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-def get_online_course_recommendations(career, skills, skill_gaps=None):
+# Most careers compare_many() accepts at once
+MAX_COMPARED_CAREERS = 10
+
+# Course level suggested for each roadmap stage
+STAGE_COURSE_LEVELS = ["Beginner", "Intermediate", "Advanced", "Advanced"]
+
+def _required_skills(record):
+    """Pair each required skill of a catalog record with its canonical skill id"""
+    if record is None:
+        return []
+    return zip(record.details["required_skills"], record.skill_ids)
+
+def _skill_gaps(record, user_skill_mask):
+    """Required skills of a career, in catalog order, that a skill bitset does not cover"""
+    return [skill for skill, skill_id in _required_skills(record) if not has_skill(user_skill_mask, skill_id)]
+
+def get_online_course_recommendations(career, skills, skill_gaps=None, level="Beginner", seed=None, catalog=None):
     """
-    Generate online course recommendations based on career and skill gaps.
+    Recommend online courses based on career and skill gaps.
     
     Args:
         career: Career path
         skills: List of user's current skills
         skill_gaps: Optional list of skills the user needs to develop (if None, will be inferred)
+        level: Preferred course level ("Beginner", "Intermediate" or "Advanced")
+        seed: Optional seed for reproducible varied picks, see CourseCatalog.recommend
+        catalog: Catalog to read the career from; defaults to the process-wide catalog
     
     Returns:
-        List of course recommendations with titles and platforms
+        List of course recommendations with titles, platforms, levels and durations
     """
-    # Online learning platforms
-    platforms = {
-        "Coursera": ["Introduction to", "Fundamentals of", "Specialization in", "Professional Certificate in", "Master"],
-        "edX": ["Introduction to", "Professional Certificate in", "MicroMasters in", "XSeries Program in"],
-        "Udemy": ["Complete", "Ultimate", "Bootcamp", "Masterclass", "Crash Course in"],
-        "LinkedIn Learning": ["Essential", "Advanced", "Becoming a", "Learning", "Skills in"],
-        "Khan Academy": ["Basics of", "Core Concepts in", "Essentials of"],
-        "Pluralsight": ["Path to", "Fundamentals of", "Getting Started with", "Deep Dive into"],
-        "Codecademy": ["Learn", "Build with", "Skill Path:"]
-    }
+    catalog = catalog if catalog is not None else get_catalog()
     
     # If no skill gaps provided, infer them based on career required skills
-    if not skill_gaps:
-        career_details = get_career_details(career)
-        required_skills = career_details.get("required_skills", [])
-        user_skills_lower = [s.lower() for s in skills]
-        skill_gaps = [skill for skill in required_skills 
-                      if not any(s in skill.lower() for s in user_skills_lower)]
-    
-    # Generate course recommendations
-    course_recommendations = []
-    for skill in skill_gaps[:3]:  # Limit to top 3 skill gaps
-        # Select a random platform
-        platform = random.choice(list(platforms.keys()))
-        # Select a random prefix for the course title
-        prefix = random.choice(platforms[platform])
-        # Generate course title
-        course_title = f"{prefix} {skill}"
-        # Add to recommendations
-        course_recommendations.append({
-            "title": course_title,
-            "platform": platform,
-            "skill": skill
-        })
-    
-    return course_recommendations
+    if skill_gaps is None:
+        skill_gaps = _skill_gaps(catalog.get(career), catalog.ontology.user_mask(skills))
+    
+    # Limit to top 3 skill gaps
+    return get_course_catalog(catalog).recommend(skill_gaps, limit=3, level=level, seed=seed)
+
+def _match_reasons(catalog, record, interests, skills, values, personality, user_edu_level, work_environment):
+    """Explain why a career matched, in the order the scoring rules are applied"""
+    match_reasons = []
+    
+    skill_matches = [s for s in skills if skill_matches_career(record, s, catalog.ontology)]
+    if skill_matches:
+        match_reasons.append(f"Matched {len(skill_matches)} skills: {', '.join(skill_matches[:3])}")
+    
+    for interest in interests or []:
+        if interest_matches_career(record, interest):
+            match_reasons.append(f"Interest match: {interest}")
+            break
+    
+    education_reason = education_match(record, user_edu_level)
+    if education_reason:
+        match_reasons.append(education_reason)
+    
+    env_matches = [env for env in work_environment if environment_matches_career(record, env)]
+    if env_matches:
+        match_reasons.append(f"Work environment match: {', '.join(env_matches[:2])}")
+    
+    for value in values:
+        if value in VALUE_REASONS and value_matches_career(record, value):
+            match_reasons.append(VALUE_REASONS[value])
+    
+    if personality_matches_career(record, personality):
+        match_reasons.append(PERSONALITY_KEYWORDS[personality][1])
+    
+    return match_reasons
 
-def get_career_recommendations(interests, skills, values, personality, education, work_environment, limit=5):
+def _build_recommendation(catalog, record, score, interests, skills, values, personality,
+                          user_edu_level, work_environment, user_skill_mask):
+    """Materialize the full recommendation payload for one ranked career"""
+    match_reasons = _match_reasons(catalog, record, interests, skills, values, personality,
+                                   user_edu_level, work_environment)
+    
+    # Calculate skill gaps for this career
+    skill_gaps = _skill_gaps(record, user_skill_mask)
+    
+    # Generate specific course recommendations
+    course_recommendations = get_online_course_recommendations(record.name, skills, skill_gaps, catalog=catalog)
+    
+    # Add career recommendation with course suggestions
+    return {
+        "career": record.name,
+        "score": score,
+        "match_reasons": match_reasons[:3],  # Top 3 reasons only
+        "details": dict(record.details),
+        "course_recommendations": course_recommendations
+    }
+
+def get_career_recommendations(interests, skills, values, personality, education, work_environment, limit=5,
+                               lazy=True, catalog=None, filters=None):
     """
     Generate career recommendations based on user preferences and skills.
     
+    Works in two phases. Phase one ranks careers by their numeric score, using
+    the catalog's inverted feature index and bitmask scoring. Phase two builds
+    match reasons, skill gaps, course suggestions and details payloads.
+    
     Args:
         interests: List of user's interest areas
         skills: List of user's skills
@@ -66,340 +125,221 @@ def get_career_recommendations(interests, skills, values, personality, education
         education: User's education level
         work_environment: User's preferred work environments
         limit: Maximum number of recommendations to return
+        lazy: Run phase two only for the returned careers; when False every
+            career is materialized before the ranking is cut to `limit`
+        catalog: Catalog to recommend from; defaults to the process-wide catalog
+        filters: Optional career_filters.CareerFilters; careers failing them
+            are excluded before scoring
     
     Returns:
         List of recommended careers with scores and reasoning
     """
-    all_careers = get_all_careers()
-    recommendations = []
-    
-    for career in all_careers:
-        career_details = get_career_details(career)
-        score = 0
-        match_reasons = []
-        
-        # Score based on skills match
-        career_skills = [s.lower() for s in career_details.get("required_skills", [])]
-        skill_matches = [s for s in skills if any(s in cs.lower() for cs in career_skills)]
-        skill_score = len(skill_matches) * 10  # 10 points per matching skill
-        if skill_score > 0:
-            score += skill_score
-            match_reasons.append(f"Matched {len(skill_matches)} skills: {', '.join(skill_matches[:3])}")
-        
-        # Score based on interests
-        if interests:
-            for interest in interests:
-                if interest.lower() in career_details.get("description", "").lower():
-                    score += 5
-                    match_reasons.append(f"Interest match: {interest}")
-                    break
-        
-        # Score based on education
-        edu_level_scores = {
-            "highschool": 1,
-            "associate": 2,
-            "bachelor": 3, 
-            "master": 4,
-            "phd": 5,
-            "trade": 2,
-            "selftaught": 1
-        }
-        
-        user_edu_level = edu_level_scores.get(education, 0) if isinstance(education, str) else 0
-        
-        required_edu = career_details.get("required_education", "").lower()
-        if "bachelor" in required_edu and user_edu_level >= 3:
-            score += 15
-            match_reasons.append("Education match: Bachelor's degree or higher")
-        elif "associate" in required_edu and user_edu_level >= 2:
-            score += 15
-            match_reasons.append("Education match: Associate degree or higher")
-        elif "master" in required_edu and user_edu_level >= 4:
-            score += 15
-            match_reasons.append("Education match: Master's degree or higher")
-        elif "phd" in required_edu and user_edu_level >= 5:
-            score += 15
-            match_reasons.append("Education match: PhD")
-        
-        # Score based on work environment
-        career_environment = career_details.get("work_environment", "").lower()
-        env_matches = [env for env in work_environment if env.lower() in career_environment]
-        if env_matches:
-            score += len(env_matches) * 5
-            match_reasons.append(f"Work environment match: {', '.join(env_matches[:2])}")
-        
-        # Score based on values
-        for value in values:
-            # Check for work-life balance
-            if value == "worklife" and "flexible" in career_environment:
-                score += 5
-                match_reasons.append("Value match: Work-life balance")
-            
-            # Check for compensation
-            if value == "compensation" and any(high_pay in career_details.get("salary_range", "") 
-                                             for high_pay in ["$100,000", "$150,000", "$200,000"]):
-                score += 5
-                match_reasons.append("Value match: High compensation potential")
-            
-            # Check for growth
-            if value == "growth" and "growth" in career_details.get("job_outlook", "").lower():
-                score += 5
-                match_reasons.append("Value match: Career growth opportunities")
-        
-        # Score based on personality
-        if personality == "analytical" and any(analytical in career_details.get("description", "").lower() 
-                                            for analytical in ["analytical", "analysis", "data", "research"]):
-            score += 10
-            match_reasons.append("Personality match: Analytical role")
-        
-        elif personality == "creative" and any(creative in career_details.get("description", "").lower() 
-                                            for creative in ["creative", "design", "innovative"]):
-            score += 10
-            match_reasons.append("Personality match: Creative role")
-        
-        elif personality == "leader" and any(leader in career_details.get("description", "").lower() 
-                                          for leader in ["lead", "manage", "direct", "supervise"]):
-            score += 10
-            match_reasons.append("Personality match: Leadership role")
-        
-        elif personality == "social" and any(social in career_details.get("description", "").lower() 
-                                          for social in ["social", "people", "team", "collaborate"]):
-            score += 10
-            match_reasons.append("Personality match: Social/collaborative role")
-        
-        # Calculate skill gaps for this career
-        career_skills = career_details.get("required_skills", [])
-        user_skills_lower = [s.lower() for s in skills]
-        skill_gaps = [skill for skill in career_skills 
-                     if not any(us in skill.lower() for us in user_skills_lower)]
-        
-        # Generate specific course recommendations
-        course_recommendations = get_online_course_recommendations(career, skills, skill_gaps)
-        
-        # Add career recommendation with course suggestions
-        recommendations.append({
-            "career": career,
-            "score": score,
-            "match_reasons": match_reasons[:3],  # Top 3 reasons only
-            "details": career_details,
-            "course_recommendations": course_recommendations
-        })
-    
-    # Sort by score and limit results
-    sorted_recommendations = sorted(recommendations, key=lambda x: x["score"], reverse=True)
-    return sorted_recommendations[:limit]
+    catalog = catalog if catalog is not None else get_catalog()
+    index = get_scoring_index(catalog)
+    query = index.encode_profile(interests, skills, values, personality, education, work_environment)
+    allowed = get_filter_index(catalog).matching(filters) if filters is not None else None
+    
+    # Phase one: cheap numeric ranking
+    ranked = index.top_candidates(query, limit if lazy else len(catalog), allowed=allowed)
+    
+    # Phase two: explanations and payloads
+    recommendations = materialize_recommendations(catalog, ranked, interests, skills, values, personality,
+                                                  education, work_environment)
+    return recommendations[:limit]
 
-def get_career_roadmap(career, experience_level, skills, education, experience_years):
+def materialize_recommendations(catalog, ranked, interests, skills, values, personality, education, work_environment):
+    """
+    Build recommendation payloads for already ranked careers.
+    
+    Args:
+        catalog: Catalog the career ids refer to
+        ranked: List of (career_id, score), best first
+        interests, skills, values, personality, education, work_environment:
+            The answers the careers were ranked for
+    
+    Returns:
+        List of recommendation dictionaries in ranking order
+    """
+    user_skill_mask = catalog.ontology.user_mask(skills)
+    user_edu_level = education_level(education)
+    return [
+        _build_recommendation(catalog, catalog.records[career_id], score, interests, skills, values, personality,
+                              user_edu_level, work_environment, user_skill_mask)
+        for career_id, score in ranked
+    ]
+
+def get_career_roadmap(career, experience_level, skills, education, experience_years, share_static=False):
     """
     Generate a career roadmap based on a selected career path.
     
+    The stage skeleton comes from the precomputed roadmap template for the
+    career; only the skill filtering, current stage and skill gaps are
+    computed per request.
+    
     Args:
         career: Selected career path
         experience_level: User's current experience level
         skills: User's current skills
         education: User's education background
         experience_years: User's years of experience
+        share_static: Return the template's immutable parts (roles, resources,
+            salary progression) by reference instead of copying them
     
     Returns:
         Dictionary with roadmap information
     """
-    career_details = get_career_details(career)
+    catalog = get_catalog()
+    template = get_roadmap_index(catalog).template(career)
+    user_skill_mask = catalog.ontology.user_mask(skills)
     
-    # Define the roadmap stages
+    # Apply the user's skills to each precomputed stage
     stages = [
         {
-            "title": "Entry Level",
-            "description": f"Beginning roles in {career}",
-            "typical_roles": get_typical_roles(career, "entry"),
-            "skills_to_develop": get_skills_to_develop(career, "entry", skills),
-            "education_requirements": get_education_requirements(career, "entry"),
-            "time_estimate": "0-2 years"
-        },
-        {
-            "title": "Mid-Level",
-            "description": f"Intermediate roles in {career} with some experience",
-            "typical_roles": get_typical_roles(career, "mid"),
-            "skills_to_develop": get_skills_to_develop(career, "mid", skills),
-            "education_requirements": get_education_requirements(career, "mid"),
-            "time_estimate": "3-5 years"
-        },
-        {
-            "title": "Senior Level",
-            "description": f"Advanced roles in {career} with substantial experience",
-            "typical_roles": get_typical_roles(career, "senior"),
-            "skills_to_develop": get_skills_to_develop(career, "senior", skills),
-            "education_requirements": get_education_requirements(career, "senior"),
-            "time_estimate": "6-10 years"
-        },
-        {
-            "title": "Expert / Leadership",
-            "description": f"Top-level positions in {career} field",
-            "typical_roles": get_typical_roles(career, "expert"),
-            "skills_to_develop": get_skills_to_develop(career, "expert", skills),
-            "education_requirements": get_education_requirements(career, "expert"),
-            "time_estimate": "10+ years"
+            "title": stage.title,
+            "description": stage.description,
+            "typical_roles": stage.typical_roles if share_static else list(stage.typical_roles),
+            "skills_to_develop": filter_known_skills(stage.skills, user_skill_mask),
+            "education_requirements": stage.education_requirements,
+            "time_estimate": stage.time_estimate
         }
+        for stage in template.stages
     ]
     
     # Determine user's current stage based on experience level
-    current_stage_index = {
-        "entry": 0,
-        "mid": 1,
-        "senior": 2,
-        "expert": 3
-    }.get(experience_level, 0)
+    current_stage_index = STAGE_INDEX.get(experience_level, 0)
     
-    # Identify skill gaps at current and next levels
-    current_required_skills = set(get_skills_to_develop(career, experience_level, []))
-    user_skills = set(skills)
-    skill_gaps = list(current_required_skills - user_skills)
+    # Identify skill gaps at the current level through the ontology, like the
+    # stages above, keeping the catalog order so course suggestions are stable
+    current_stage = template.stage_by_level.get(experience_level)
+    required_skills = current_stage.skills if current_stage else template.base_skills
+    skill_gaps = list(dict.fromkeys(filter_known_skills(required_skills, user_skill_mask)))
     
-    # Prepare resources
-    resources = career_details.get("resources", [])
+    # Suggest courses for the gaps at a level suited to the current stage
+    course_recommendations = get_online_course_recommendations(
+        career, skills, skill_gaps, level=STAGE_COURSE_LEVELS[current_stage_index], catalog=catalog)
     
     return {
         "career": career,
-        "overview": career_details.get("description", ""),
+        "overview": template.overview,
         "current_stage": current_stage_index,
         "stages": stages,
         "skill_gaps": skill_gaps,
-        "recommended_resources": resources,
-        "salary_progression": {
-            "entry": "Entry Level: " + (career_details.get("salary_range", "").split("-")[0] 
-                                      if "-" in career_details.get("salary_range", "") else "Varies"),
-            "mid": "Mid-Level: Middle of range",
-            "senior": "Senior Level: " + (career_details.get("salary_range", "").split("-")[1] 
-                                        if "-" in career_details.get("salary_range", "") else "Varies"),
-            "expert": "Expert Level: Top of range and beyond"
-        }
+        "recommended_resources": template.resources if share_static else list(template.resources),
+        "course_recommendations": course_recommendations,
+        "salary_progression": template.salary_progression if share_static else dict(template.salary_progression)
     }
 
 def get_typical_roles(career, level):
     """Get typical roles for a career at a specific level"""
-    # Mapping of careers to roles at different levels
-    role_mappings = {
-        "Software Developer": {
-            "entry": ["Junior Developer", "Software Engineer I", "Associate Developer"],
-            "mid": ["Software Engineer II", "Full Stack Developer", "Application Developer"],
-            "senior": ["Senior Software Engineer", "Software Architect", "Technical Lead"],
-            "expert": ["Principal Engineer", "Software Engineering Manager", "CTO", "VP of Engineering"]
-        },
-        "Data Scientist": {
-            "entry": ["Junior Data Scientist", "Data Analyst", "Research Assistant"],
-            "mid": ["Data Scientist", "Machine Learning Engineer", "Analytics Specialist"],
-            "senior": ["Senior Data Scientist", "Lead Data Scientist", "Data Science Manager"],
-            "expert": ["Principal Data Scientist", "Director of Data Science", "Chief Data Officer"]
-        },
-        "UX/UI Designer": {
-            "entry": ["Junior Designer", "UI Designer", "Visual Designer"],
-            "mid": ["UX/UI Designer", "Interaction Designer", "Experience Designer"],
-            "senior": ["Senior UX Designer", "Lead Designer", "UX Manager"],
-            "expert": ["Design Director", "VP of Design", "Chief Design Officer"]
-        },
-        "Product Manager": {
-            "entry": ["Associate Product Manager", "Product Analyst", "Product Owner"],
-            "mid": ["Product Manager", "Senior Product Owner", "Technical Product Manager"],
-            "senior": ["Senior Product Manager", "Group Product Manager", "Product Lead"],
-            "expert": ["Director of Product", "VP of Product", "Chief Product Officer"]
-        }
-    }
-    
-    # Return specific roles if available, otherwise return generic roles
-    if career in role_mappings and level in role_mappings[career]:
-        return role_mappings[career][level]
-    else:
-        # Generic roles based on level
-        generic_roles = {
-            "entry": ["Entry Level " + career, "Junior " + career, "Associate " + career],
-            "mid": [career, "Experienced " + career, career + " Specialist"],
-            "senior": ["Senior " + career, "Lead " + career, career + " Manager"],
-            "expert": ["Principal " + career, "Director of " + career, "Chief " + career + " Officer"]
-        }
-        return generic_roles.get(level, ["Role information not available"])
+    stage = get_roadmap_index().template(career).stage_by_level.get(level)
+    return list(stage.typical_roles) if stage else typical_roles(career, level)
 
 def get_skills_to_develop(career, level, current_skills):
     """Get skills to develop for a career at a specific level"""
-    # Convert current skills to lowercase for case-insensitive comparison
-    current_skills_lower = [s.lower() for s in current_skills]
-    
-    # Get career details
-    career_details = get_career_details(career)
-    base_skills = career_details.get("required_skills", [])
-    
-    # Define additional skills by level
-    additional_skills = {
-        "Software Developer": {
-            "entry": ["Programming Fundamentals", "Data Structures", "Version Control"],
-            "mid": ["Design Patterns", "System Architecture", "CI/CD", "Code Optimization"],
-            "senior": ["Scalability", "Microservices", "Technical Leadership", "Mentoring"],
-            "expert": ["Enterprise Architecture", "Technology Strategy", "Team Leadership"]
-        },
-        "Data Scientist": {
-            "entry": ["Python Programming", "Statistics", "Data Visualization"],
-            "mid": ["Machine Learning", "Data Pipelines", "Feature Engineering"],
-            "senior": ["Advanced ML Algorithms", "MLOps", "Research Methods"],
-            "expert": ["AI Strategy", "Research Leadership", "Cross-functional Leadership"]
-        },
-        "UX/UI Designer": {
-            "entry": ["Design Software", "Visual Design", "Wireframing"],
-            "mid": ["User Research", "Prototyping", "Information Architecture"],
-            "senior": ["Design Systems", "Team Collaboration", "Project Management"],
-            "expert": ["Design Strategy", "Design Leadership", "Business Acumen"]
-        }
-    }
+    # Resolve current skills to the canonical skills they cover
+    catalog = get_catalog()
+    user_skill_mask = catalog.ontology.user_mask(current_skills)
     
-    # Get level-specific skills if available
-    level_skills = []
-    if career in additional_skills and level in additional_skills[career]:
-        level_skills = additional_skills[career][level]
-    
-    # Combine base skills and level-specific skills
-    all_skills = base_skills + level_skills
+    # Level-specific skills if available, otherwise the career's base skills
+    template = get_roadmap_index(catalog).template(career)
+    stage = template.stage_by_level.get(level)
     
     # Return skills that the user doesn't already have
-    return [skill for skill in all_skills if not any(skill.lower() in cs for cs in current_skills_lower)]
+    return filter_known_skills(stage.skills if stage else template.base_skills, user_skill_mask)
 
 def get_education_requirements(career, level):
     """Get education requirements for a career at a specific level"""
-    # Get career details
-    career_details = get_career_details(career)
-    base_education = career_details.get("required_education", "Bachelor's degree or equivalent experience")
-    
-    # Define additional education by level
-    additional_education = {
-        "Software Developer": {
-            "entry": "Bachelor's in Computer Science or equivalent bootcamp/self-learning",
-            "mid": "Bachelor's in Computer Science plus specialized certifications",
-            "senior": "Bachelor's/Master's plus extensive experience",
-            "expert": "Master's/PhD may be preferred, extensive experience required"
+    stage = get_roadmap_index().template(career).stage_by_level.get(level)
+    if stage:
+        return stage.education_requirements
+    base_education = get_catalog().details(career).get("required_education", DEFAULT_BASE_EDUCATION)
+    return education_requirements(career, level, base_education)
+
+def _compare_profile(record, details, user_skill_mask):
+    """
+    One career's row of a comparison matrix.
+
+    Each required skill is checked against the user's skill bitset once and
+    sorted into matching or missing in the same pass.
+    """
+    matching_skills = []
+    missing_skills = []
+    for skill, skill_id in _required_skills(record):
+        if has_skill(user_skill_mask, skill_id):
+            matching_skills.append(skill)
+        else:
+            missing_skills.append(skill)
+    required_skills = details.get("required_skills", [])
+    skill_match_pct = (len(matching_skills) / len(required_skills)) * 100 if required_skills else 0
+
+    return {
+        "description": details.get("description", ""),
+        "skill_match": round(skill_match_pct, 1),
+        "matching_skills": matching_skills,
+        "missing_skills": missing_skills,
+        "education": {
+            "required": details.get("required_education", ""),
+            "level_index": record.education_tier if record is not None else 0
         },
-        "Data Scientist": {
-            "entry": "Bachelor's in Statistics, Computer Science, or related field",
-            "mid": "Master's degree often preferred plus specialized knowledge",
-            "senior": "Master's/PhD plus domain expertise",
-            "expert": "PhD common at this level plus research contributions"
+        "compensation": {
+            "range": details.get("salary_range", ""),
+            "min": record.salary_min if record is not None else None,
+            "max": record.salary_max if record is not None else None
         },
-        "UX/UI Designer": {
-            "entry": "Degree in Design, HCI, or strong portfolio",
-            "mid": "Degree plus proven work experience and diverse portfolio",
-            "senior": "Portfolio more important than formal education at this stage",
-            "expert": "Track record of successful projects, formal education secondary"
-        }
+        "outlook": {
+            "description": details.get("job_outlook", ""),
+            "growth_pct": record.growth_pct if record is not None else None
+        },
+        "work_environment": details.get("work_environment", ""),
+        "related_careers": list(details.get("related_careers", []))
     }
+
+def compare_many(careers, skills, education, experience_years, catalog=None):
+    """
+    Compare several careers side by side based on user's background.
+    
+    Args:
+        careers: Careers to compare, at most MAX_COMPARED_CAREERS
+        skills: User's current skills
+        education: User's education background
+        experience_years: User's years of experience
     
-    # Return level-specific education if available, otherwise return base education
-    if career in additional_education and level in additional_education[career]:
-        return additional_education[career][level]
+    Returns:
+        Dictionary with the career names, one profile per career and an N x N
+        transition matrix where transitions[i][j] describes moving from
+        careers[i] to careers[j] (None on the diagonal)
+    """
+    careers = list(careers)
+    if len(careers) > MAX_COMPARED_CAREERS:
+        raise ValueError(f"At most {MAX_COMPARED_CAREERS} careers can be compared at once")
+    catalog = catalog if catalog is not None else get_catalog()
+    matrix = get_transition_matrix(catalog)
+    records = [catalog.get(career) for career in careers]
+    user_skill_mask = catalog.ontology.user_mask(skills)
+    
+    profiles = []
+    for career, record in zip(careers, records):
+        profile = _compare_profile(record, catalog.details(career), user_skill_mask)
+        profile["name"] = career
+        profiles.append(profile)
+    
+    transitions = []
+    for i, source in enumerate(records):
+        row = []
+        for j, target in enumerate(records):
+            if i == j:
+                row.append(None)
+            elif source is not None and target is not None:
+                row.append(_transition_payload(matrix.transition(source.id, target.id), experience_years))
+            else:
+                row.append(_transition_payload(matrix.transition_between(careers[i], careers[j]), experience_years))
+        transitions.append(row)
     
-    # Generic education requirements by level
-    generic_education = {
-        "entry": base_education,
-        "mid": base_education + " with 3-5 years of experience",
-        "senior": base_education + " with 6-10 years of experience, advanced certifications may be beneficial",
-        "expert": "Advanced degrees often preferred, 10+ years of experience, specialized expertise and leadership experience"
+    return {
+        "careers": careers,
+        "profiles": profiles,
+        "transitions": transitions
     }
-    
-    return generic_education.get(level, base_education)
 
 def compare_careers(career1, career2, skills, education, experience_years):
     """
@@ -414,114 +354,68 @@ def compare_careers(career1, career2, skills, education, experience_years):
     Returns:
         Dictionary with comparison information
     """
-    career1_details = get_career_details(career1)
-    career2_details = get_career_details(career2)
-    
-    # Calculate skill match percentages
-    career1_skills = career1_details.get("required_skills", [])
-    career2_skills = career2_details.get("required_skills", [])
-    
-    skills_lower = [s.lower() for s in skills]
-    
-    career1_matches = sum(1 for skill in career1_skills if any(s in skill.lower() for s in skills_lower))
-    career2_matches = sum(1 for skill in career2_skills if any(s in skill.lower() for s in skills_lower))
-    
-    career1_match_pct = (career1_matches / len(career1_skills)) * 100 if career1_skills else 0
-    career2_match_pct = (career2_matches / len(career2_skills)) * 100 if career2_skills else 0
+    catalog = get_catalog()
+    comparison_matrix = compare_many([career1, career2], skills, education, experience_years, catalog=catalog)
+    profile1, profile2 = comparison_matrix["profiles"]
+    transition = comparison_matrix["transitions"][0][1]
     
-    # Determine education compatibility
-    education_levels = ["highschool", "associate", "bachelor", "master", "phd"]
-    
-    def get_required_edu_level(career_details):
-        required_edu = career_details.get("required_education", "").lower()
-        if "bachelor" in required_edu:
-            return 2  # Index of bachelor in education_levels
-        elif "associate" in required_edu:
-            return 1
-        elif "master" in required_edu:
-            return 3
-        elif "phd" in required_edu or "doctorate" in required_edu:
-            return 4
-        return 0  # Default to high school
-    
-    career1_edu_level = get_required_edu_level(career1_details)
-    career2_edu_level = get_required_edu_level(career2_details)
+    # Courses cover the skills career2 needs beyond career1, in catalog order
+    career1_record = catalog.get(career1)
+    transition_skills = _skill_gaps(catalog.get(career2), career1_record.skill_mask if career1_record else 0)
     
     # Create more detailed comparison
     comparison = {
         "overview": {
             "career1": {
                 "name": career1,
-                "description": career1_details.get("description", ""),
-                "skill_match": round(career1_match_pct, 1),
-                "matching_skills": [skill for skill in career1_skills if any(s in skill.lower() for s in skills_lower)],
-                "missing_skills": [skill for skill in career1_skills if not any(s in skill.lower() for s in skills_lower)]
+                "description": profile1["description"],
+                "skill_match": profile1["skill_match"],
+                "matching_skills": profile1["matching_skills"],
+                "missing_skills": profile1["missing_skills"]
             },
             "career2": {
                 "name": career2,
-                "description": career2_details.get("description", ""),
-                "skill_match": round(career2_match_pct, 1),
-                "matching_skills": [skill for skill in career2_skills if any(s in skill.lower() for s in skills_lower)],
-                "missing_skills": [skill for skill in career2_skills if not any(s in skill.lower() for s in skills_lower)]
+                "description": profile2["description"],
+                "skill_match": profile2["skill_match"],
+                "matching_skills": profile2["matching_skills"],
+                "missing_skills": profile2["missing_skills"]
             }
         },
         "education": {
-            "career1": {
-                "required": career1_details.get("required_education", ""),
-                "level_index": career1_edu_level
-            },
-            "career2": {
-                "required": career2_details.get("required_education", ""),
-                "level_index": career2_edu_level
-            }
+            "career1": profile1["education"],
+            "career2": profile2["education"]
         },
         "compensation": {
-            "career1": career1_details.get("salary_range", ""),
-            "career2": career2_details.get("salary_range", "")
+            "career1": profile1["compensation"]["range"],
+            "career2": profile2["compensation"]["range"]
         },
         "outlook": {
-            "career1": career1_details.get("job_outlook", ""),
-            "career2": career2_details.get("job_outlook", "")
+            "career1": profile1["outlook"]["description"],
+            "career2": profile2["outlook"]["description"]
         },
         "work_environment": {
-            "career1": career1_details.get("work_environment", ""),
-            "career2": career2_details.get("work_environment", "")
+            "career1": profile1["work_environment"],
+            "career2": profile2["work_environment"]
         },
-        "transition_difficulty": calculate_transition_difficulty(career1, career2, skills, experience_years),
+        "transition_difficulty": transition,
         "related_careers": {
-            "career1": career1_details.get("related_careers", []),
-            "career2": career2_details.get("related_careers", [])
-        }
+            "career1": profile1["related_careers"],
+            "career2": profile2["related_careers"]
+        },
+        "course_recommendations": get_online_course_recommendations(career2, skills, transition_skills)
     }
     
     return comparison
 
 def calculate_transition_difficulty(career1, career2, skills, experience_years):
     """Calculate the difficulty of transitioning between two careers"""
-    career1_details = get_career_details(career1)
-    career2_details = get_career_details(career2)
-    
-    # Compare required skills
-    career1_skills = set([s.lower() for s in career1_details.get("required_skills", [])])
-    career2_skills = set([s.lower() for s in career2_details.get("required_skills", [])])
-    
-    # Calculate overlap
-    skill_overlap = len(career1_skills.intersection(career2_skills))
-    skill_total = len(career2_skills)
-    
-    # Calculate skill match percentage
-    skill_match_pct = (skill_overlap / skill_total) * 100 if skill_total > 0 else 0
-    
-    # Determine transition difficulty based on skill match and experience
-    if skill_match_pct >= 70:
-        difficulty = "Easy"
-        description = "The careers have significant skill overlap, making this a natural transition."
-    elif skill_match_pct >= 40:
-        difficulty = "Moderate"
-        description = "You'll need to develop some new skills, but there's meaningful overlap."
-    else:
-        difficulty = "Challenging"
-        description = "These careers require substantially different skillsets, requiring significant retraining."
+    # Skill overlap, difficulty and education needs come from the precomputed matrix
+    transition = get_transition_matrix().transition_between(career1, career2)
+    return _transition_payload(transition, experience_years)
+
+def _transition_payload(transition, experience_years):
+    """Transition dictionary for a Transition, with the experience adjustment"""
+    difficulty = transition.level
     
     # Adjust for experience
     if experience_years >= 10 and difficulty != "Easy":
@@ -531,16 +425,11 @@ def calculate_transition_difficulty(career1, career2, skills, experience_years):
     else:
         difficulty_modifier = ""
     
-    # Suggest education or certification needs
-    education_needs = []
-    if career2_details.get("required_education", "").lower() not in career1_details.get("required_education", "").lower():
-        education_needs.append(career2_details.get("required_education", ""))
-    
     return {
         "level": difficulty,
-        "description": description,
+        "description": transition.description,
         "experience_factor": difficulty_modifier,
-        "skill_gap": list(career2_skills - career1_skills),
-        "additional_education": education_needs,
-        "skill_overlap_percentage": round(skill_match_pct, 1)
+        "skill_gap": list(transition.skill_gap),
+        "additional_education": list(transition.additional_education),
+        "skill_overlap_percentage": transition.skill_overlap_percentage
     }
@@ -0,0 +1,151 @@
+# Result cache module - memoizes recommendation results per canonical questionnaire
+#
+# Questionnaire answers come from a small closed vocabulary, so a bounded LRU
+# keyed by the canonicalized answers absorbs repeat page loads and refreshes.
+# Entries are tagged with the catalog generation and dropped when a newer
+# catalog is served.
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from catalog import get_catalog
+from recommendation_engine import get_career_recommendations
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class ResultCache:
+    """Thread-safe LRU cache with a per-entry TTL and a catalog generation tag"""
+
+    def __init__(self, max_entries=4096, ttl_seconds=900, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = None
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _check_version(self, version):
+        """
+        Drop every entry when a newer catalog generation shows up; caller holds the lock.
+
+        Returns:
+            False for an older generation, from a request that pinned the
+            previous catalog; such lookups bypass the cache
+        """
+        if self.version is not None and version < self.version:
+            return False
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                logger.debug(f"Catalog changed from generation {self.version} to {version}, "
+                             f"dropping {len(self._entries)} cached results")
+            self._entries.clear()
+            self.version = version
+        return True
+
+    def get(self, key, version, default=None):
+        """Return the cached value for key under a catalog generation, or default"""
+        with self._lock:
+            if not self._check_version(version):
+                self.misses += 1
+                return default
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, version, value):
+        """Store a value, evicting the least recently used entries past max_entries"""
+        with self._lock:
+            if not self._check_version(version):
+                return
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the cache counters as a dictionary"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+def _canonical_list(answers):
+    """Sorted, deduplicated tuple of list answers"""
+    return tuple(sorted(set(answers or ())))
+
+def canonical_answers(interests, skills, values, personality, education, work_environment):
+    """
+    Canonicalize questionnaire answers so equivalent submissions share a key.
+
+    Returns:
+        Tuple (interests, skills, values, personality, education, work_environment)
+        with list answers sorted and deduplicated
+    """
+    return (
+        _canonical_list(interests),
+        _canonical_list(skills),
+        _canonical_list(values),
+        personality or "",
+        education or "",
+        _canonical_list(work_environment),
+    )
+
+# Process-wide cache for /recommendation_result
+recommendation_cache = ResultCache()
+
+def get_cached_recommendations(interests, skills, values, personality, education, work_environment, limit=5,
+                               filters=None):
+    """
+    Return career recommendations, computing them only on a cache miss.
+
+    Results are computed from the canonical answers, so equivalent submissions
+    get identical output. Cached results are shared between requests and must
+    be treated as read-only.
+    """
+    answers = canonical_answers(interests, skills, values, personality, education, work_environment)
+    key = (answers, limit, filters)
+    version = get_catalog().generation
+    recommendations = recommendation_cache.get(key, version)
+    if recommendations is None:
+        interests, skills, values, personality, education, work_environment = answers
+        recommendations = get_career_recommendations(list(interests), list(skills), list(values), personality,
+                                                     education, list(work_environment), limit=limit, filters=filters)
+        recommendation_cache.set(key, version, recommendations)
+    return recommendations
@@ -0,0 +1,93 @@
+# Result links module - stateless, signed result URLs with HTTP cache validators
+#
+# A result page's inputs are canonicalized (list answers sorted and
+# deduplicated, fields in a fixed order) and signed into a URL-safe token, so
+# the same answers always produce the same URL and anyone holding the link
+# sees the same result without a session. Responses carry a strong ETag
+# derived from the token and the catalog version, so browsers and shared
+# caches can revalidate with a 304 instead of re-rendering.
+
+import hashlib
+import logging
+
+from flask import current_app, url_for
+from itsdangerous import BadSignature, URLSafeSerializer
+
+from career_filters import CareerFilters
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Bump when result pages change in a way cached copies should not survive
+RESULT_LINK_VERSION = 1
+RESULT_MAX_AGE = 300
+
+# Answer fields carried in a result link for each tool, in token order
+RESULT_LINK_FIELDS = {
+    "roadmap": ("career", "experience_level", "education_level", "skills", "experience_years"),
+    "comparison": ("career1", "career2", "skills", "education_level", "experience_years"),
+    "multi_comparison": ("careers", "skills", "education_level", "experience_years"),
+    "transition_path": ("current_career", "target_career"),
+    "recommendation": ("interests", "skills", "values", "personality", "education", "work_environment", "filters"),
+}
+
+# List answers whose order does not matter
+UNORDERED_FIELDS = frozenset(["interests", "skills", "values", "work_environment"])
+
+def _serializer(tool):
+    """Token signer keyed on the app's secret key; a tool's tokens do not verify for another tool"""
+    return URLSafeSerializer(current_app.secret_key, salt=f"result-link:{tool}")
+
+def canonical_result_answers(tool, answers):
+    """List of a tool's answer values in token order, with unordered lists sorted and deduplicated"""
+    values = []
+    for field in RESULT_LINK_FIELDS[tool]:
+        value = answers.get(field)
+        if field in UNORDERED_FIELDS:
+            value = sorted(set(value or ()))
+        elif field == "careers":
+            value = list(value or ())
+        elif field == "filters":
+            value = list(value) if value else None
+        values.append(value)
+    return values
+
+def encode_result_token(tool, answers):
+    """Signed token for a tool's answers; equal answers always give the same token"""
+    return _serializer(tool).dumps(canonical_result_answers(tool, answers))
+
+def decode_result_token(tool, token):
+    """
+    Read a tool's answers back from a result token.
+
+    Returns:
+        Dictionary of answers; empty fields are left out
+
+    Raises:
+        ValueError: If the tool is unknown, or the token is forged or malformed
+    """
+    fields = RESULT_LINK_FIELDS.get(tool)
+    if fields is None:
+        raise ValueError(f"Unknown result type: {tool}")
+    try:
+        values = _serializer(tool).loads(token)
+    except BadSignature:
+        raise ValueError("Invalid result link")
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise ValueError("Invalid result link")
+    answers = {field: value for field, value in zip(fields, values) if value is not None}
+    if "filters" in answers:
+        try:
+            answers["filters"] = CareerFilters(*answers["filters"])
+        except TypeError:
+            raise ValueError("Invalid result link")
+    return answers
+
+def result_url(tool, answers):
+    """Shareable URL of a tool's result page for a set of answers"""
+    return url_for("shared_result", tool=tool, token=encode_result_token(tool, answers))
+
+def result_etag(tool, token, catalog):
+    """Strong ETag of a result page: the same inputs on the same catalog render the same page"""
+    payload = f"{RESULT_LINK_VERSION}:{tool}:{token}:{catalog.version}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
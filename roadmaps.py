@@ -0,0 +1,205 @@
+# Roadmap module - precomputed roadmap skeletons for every career and level
+#
+# Roles, level skills, education requirements, stage outlines, resources and
+# salary progression depend only on the career, so they are laid out once per
+# catalog. A roadmap request only applies the user-specific parts: filtering
+# out skills the user has, the current stage and the skill gaps.
+
+import logging
+from collections import namedtuple
+from types import MappingProxyType
+
+from catalog import get_catalog, parse_salary_range
+from skill_ontology import has_skill
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Level key, stage title, description and typical time for each roadmap stage
+STAGE_OUTLINES = [
+    ("entry", "Entry Level", "Beginning roles in {career}", "0-2 years"),
+    ("mid", "Mid-Level", "Intermediate roles in {career} with some experience", "3-5 years"),
+    ("senior", "Senior Level", "Advanced roles in {career} with substantial experience", "6-10 years"),
+    ("expert", "Expert / Leadership", "Top-level positions in {career} field", "10+ years"),
+]
+STAGE_INDEX = {level: index for index, (level, _, _, _) in enumerate(STAGE_OUTLINES)}
+
+# Mapping of careers to roles at different levels
+ROLE_MAPPINGS = {
+    "Software Developer": {
+        "entry": ["Junior Developer", "Software Engineer I", "Associate Developer"],
+        "mid": ["Software Engineer II", "Full Stack Developer", "Application Developer"],
+        "senior": ["Senior Software Engineer", "Software Architect", "Technical Lead"],
+        "expert": ["Principal Engineer", "Software Engineering Manager", "CTO", "VP of Engineering"]
+    },
+    "Data Scientist": {
+        "entry": ["Junior Data Scientist", "Data Analyst", "Research Assistant"],
+        "mid": ["Data Scientist", "Machine Learning Engineer", "Analytics Specialist"],
+        "senior": ["Senior Data Scientist", "Lead Data Scientist", "Data Science Manager"],
+        "expert": ["Principal Data Scientist", "Director of Data Science", "Chief Data Officer"]
+    },
+    "UX/UI Designer": {
+        "entry": ["Junior Designer", "UI Designer", "Visual Designer"],
+        "mid": ["UX/UI Designer", "Interaction Designer", "Experience Designer"],
+        "senior": ["Senior UX Designer", "Lead Designer", "UX Manager"],
+        "expert": ["Design Director", "VP of Design", "Chief Design Officer"]
+    },
+    "Product Manager": {
+        "entry": ["Associate Product Manager", "Product Analyst", "Product Owner"],
+        "mid": ["Product Manager", "Senior Product Owner", "Technical Product Manager"],
+        "senior": ["Senior Product Manager", "Group Product Manager", "Product Lead"],
+        "expert": ["Director of Product", "VP of Product", "Chief Product Officer"]
+    }
+}
+# Additional skills by career and level
+ADDITIONAL_SKILLS = {
+    "Software Developer": {
+        "entry": ["Programming Fundamentals", "Data Structures", "Version Control"],
+        "mid": ["Design Patterns", "System Architecture", "CI/CD", "Code Optimization"],
+        "senior": ["Scalability", "Microservices", "Technical Leadership", "Mentoring"],
+        "expert": ["Enterprise Architecture", "Technology Strategy", "Team Leadership"]
+    },
+    "Data Scientist": {
+        "entry": ["Python Programming", "Statistics", "Data Visualization"],
+        "mid": ["Machine Learning", "Data Pipelines", "Feature Engineering"],
+        "senior": ["Advanced ML Algorithms", "MLOps", "Research Methods"],
+        "expert": ["AI Strategy", "Research Leadership", "Cross-functional Leadership"]
+    },
+    "UX/UI Designer": {
+        "entry": ["Design Software", "Visual Design", "Wireframing"],
+        "mid": ["User Research", "Prototyping", "Information Architecture"],
+        "senior": ["Design Systems", "Team Collaboration", "Project Management"],
+        "expert": ["Design Strategy", "Design Leadership", "Business Acumen"]
+    }
+}
+# Additional education by career and level
+ADDITIONAL_EDUCATION = {
+    "Software Developer": {
+        "entry": "Bachelor's in Computer Science or equivalent bootcamp/self-learning",
+        "mid": "Bachelor's in Computer Science plus specialized certifications",
+        "senior": "Bachelor's/Master's plus extensive experience",
+        "expert": "Master's/PhD may be preferred, extensive experience required"
+    },
+    "Data Scientist": {
+        "entry": "Bachelor's in Statistics, Computer Science, or related field",
+        "mid": "Master's degree often preferred plus specialized knowledge",
+        "senior": "Master's/PhD plus domain expertise",
+        "expert": "PhD common at this level plus research contributions"
+    },
+    "UX/UI Designer": {
+        "entry": "Degree in Design, HCI, or strong portfolio",
+        "mid": "Degree plus proven work experience and diverse portfolio",
+        "senior": "Portfolio more important than formal education at this stage",
+        "expert": "Track record of successful projects, formal education secondary"
+    }
+}
+DEFAULT_BASE_EDUCATION = "Bachelor's degree or equivalent experience"
+
+StageTemplate = namedtuple("StageTemplate", [
+    "level", "title", "description", "typical_roles",
+    "skills",              # Tuple of (skill, canonical skill id) to develop at this stage
+    "education_requirements", "time_estimate",
+])
+
+RoadmapTemplate = namedtuple("RoadmapTemplate", [
+    "career", "overview", "stages", "stage_by_level",
+    "base_skills",         # Tuple of (skill, canonical skill id) required by the career
+    "resources", "salary_progression",
+])
+
+def typical_roles(career, level):
+    """Typical roles for a career at a specific level"""
+    # Return specific roles if available, otherwise return generic roles
+    if career in ROLE_MAPPINGS and level in ROLE_MAPPINGS[career]:
+        return ROLE_MAPPINGS[career][level]
+    # Generic roles based on level
+    generic_roles = {
+        "entry": ["Entry Level " + career, "Junior " + career, "Associate " + career],
+        "mid": [career, "Experienced " + career, career + " Specialist"],
+        "senior": ["Senior " + career, "Lead " + career, career + " Manager"],
+        "expert": ["Principal " + career, "Director of " + career, "Chief " + career + " Officer"]
+    }
+    return generic_roles.get(level, ["Role information not available"])
+
+def level_skills(career, level, base_skills):
+    """Base skills plus the level-specific skills for a career"""
+    return list(base_skills) + ADDITIONAL_SKILLS.get(career, {}).get(level, [])
+
+def education_requirements(career, level, base_education):
+    """Education requirements for a career at a specific level"""
+    # Return level-specific education if available, otherwise return base education
+    if career in ADDITIONAL_EDUCATION and level in ADDITIONAL_EDUCATION[career]:
+        return ADDITIONAL_EDUCATION[career][level]
+    # Generic education requirements by level
+    generic_education = {
+        "entry": base_education,
+        "mid": base_education + " with 3-5 years of experience",
+        "senior": base_education + " with 6-10 years of experience, advanced certifications may be beneficial",
+        "expert": "Advanced degrees often preferred, 10+ years of experience, specialized expertise and leadership experience"
+    }
+    return generic_education.get(level, base_education)
+
+def filter_known_skills(skills, user_skill_mask):
+    """Drop the (skill, skill id) pairs covered by the user's skill bitset"""
+    return [skill for skill, skill_id in skills if not has_skill(user_skill_mask, skill_id)]
+
+def _pair_skill_ids(skills, ontology):
+    return tuple((skill, ontology.skill_id(skill)) for skill in skills)
+
+def build_roadmap_template(career, details, ontology):
+    """Lay out the user-independent parts of a career's roadmap, with skill ids from the catalog's ontology"""
+    base_skills = details.get("required_skills", ())
+    base_education = details.get("required_education", DEFAULT_BASE_EDUCATION)
+    stages = tuple(
+        StageTemplate(
+            level=level,
+            title=title,
+            description=description.format(career=career),
+            typical_roles=tuple(typical_roles(career, level)),
+            skills=_pair_skill_ids(level_skills(career, level, base_skills), ontology),
+            education_requirements=education_requirements(career, level, base_education),
+            time_estimate=time_estimate,
+        )
+        for level, title, description, time_estimate in STAGE_OUTLINES
+    )
+
+    # Entry and senior salaries are the bounds of the parsed salary range
+    salary_range = details.get("salary_range", "")
+    salary_min, salary_max = parse_salary_range(salary_range)
+    open_ended = "+" if salary_range.rstrip().endswith("+") else ""
+    salary_progression = MappingProxyType({
+        "entry": "Entry Level: " + (f"${salary_min:,}" if salary_min is not None else "Varies"),
+        "mid": "Mid-Level: Middle of range",
+        "senior": "Senior Level: " + (f"${salary_max:,}{open_ended}" if salary_max is not None else "Varies"),
+        "expert": "Expert Level: Top of range and beyond"
+    })
+
+    return RoadmapTemplate(
+        career=career,
+        overview=details.get("description", ""),
+        stages=stages,
+        stage_by_level=MappingProxyType({stage.level: stage for stage in stages}),
+        base_skills=_pair_skill_ids(base_skills, ontology),
+        resources=tuple(details.get("resources", ())),
+        salary_progression=salary_progression,
+    )
+
+class RoadmapIndex:
+    """Roadmap templates for every career in a catalog"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.templates = {record.name: build_roadmap_template(record.name, record.details, catalog.ontology)
+                          for record in catalog}
+
+    def template(self, career):
+        """Return the template for a career; unknown careers get one built from the default details"""
+        template = self.templates.get(career)
+        if template is None:
+            template = build_roadmap_template(career, self.catalog.details(career), self.catalog.ontology)
+        return template
+
+def get_roadmap_index(catalog=None):
+    """Return the roadmap templates for a catalog, building them on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("roadmaps", RoadmapIndex)
@@ -0,0 +1,389 @@
+# Scoring module - batched career scoring over bitmask-encoded catalog features
+#
+# Every career is encoded once per catalog as one integer bitmask per feature
+# family (skills, interests, education tier, environments, values, personality).
+# A questionnaire is encoded into matching query masks, so scoring a career is a
+# handful of AND/popcount operations and the whole catalog is scored in one pass.
+#
+# The same masks are inverted into per-term posting lists, which let a request
+# score only careers that share at least one signal with the answers and stop
+# as soon as the remaining careers cannot reach the current top-k.
+
+import heapq
+import logging
+from collections import Counter, namedtuple
+
+from catalog import get_catalog
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Points awarded per matching feature
+SKILL_POINTS = 10
+INTEREST_POINTS = 5
+EDUCATION_POINTS = 15
+ENVIRONMENT_POINTS = 5
+VALUE_POINTS = 5
+PERSONALITY_POINTS = 10
+
+# Questionnaire education answers mapped to comparable levels
+EDUCATION_LEVEL_SCORES = {
+    "highschool": 1,
+    "associate": 2,
+    "bachelor": 3,
+    "master": 4,
+    "phd": 5,
+    "trade": 2,
+    "selftaught": 1
+}
+MAX_EDUCATION_LEVEL = max(EDUCATION_LEVEL_SCORES.values())
+
+# Required-education keywords, the questionnaire level that satisfies each and the
+# reason shown to the user; checked in order, the first satisfied keyword wins
+EDUCATION_REQUIREMENTS = [
+    ("bachelor", 3, "Education match: Bachelor's degree or higher"),
+    ("associate", 2, "Education match: Associate degree or higher"),
+    ("master", 4, "Education match: Master's degree or higher"),
+    ("phd", 5, "Education match: PhD"),
+]
+
+# Description keywords that evidence each work personality
+PERSONALITY_KEYWORDS = {
+    "analytical": (["analytical", "analysis", "data", "research"], "Personality match: Analytical role"),
+    "creative": (["creative", "design", "innovative"], "Personality match: Creative role"),
+    "leader": (["lead", "manage", "direct", "supervise"], "Personality match: Leadership role"),
+    "social": (["social", "people", "team", "collaborate"], "Personality match: Social/collaborative role"),
+}
+
+# Values the catalog can evidence and the reason shown to the user
+VALUE_REASONS = {
+    "worklife": "Value match: Work-life balance",
+    "compensation": "Value match: High compensation potential",
+    "growth": "Value match: Career growth opportunities",
+}
+HIGH_PAY_THRESHOLD = 100000    # Top of the salary range, in dollars
+
+# Questionnaire vocabularies encoded as mask bits; other answers fall back to a scan
+SKILL_TERMS = ("analytical", "communication", "technical", "creativity", "management",
+               "math", "research", "interpersonal", "writing", "languages")
+INTEREST_TERMS = ("technology", "science", "creative", "business", "healthcare",
+                  "education", "social", "engineering", "writing", "legal")
+ENVIRONMENT_TERMS = ("office", "remote", "outdoors", "travel", "startup",
+                     "corporate", "flexible", "creative")
+
+CareerFeatures = namedtuple("CareerFeatures", [
+    "skills", "interests", "education", "environments", "values", "personality",
+])
+
+ProfileQuery = namedtuple("ProfileQuery", [
+    "skill_groups",        # Tuple of (multiplicity, mask) for answered skills
+    "skill_fallback",      # Tuple of (multiplicity, career id set) for unknown skills
+    "interest_mask",
+    "interest_fallback",   # Career id set matched by unknown interests
+    "education_bit",
+    "environment_groups",
+    "environment_fallback",
+    "value_groups",
+    "personality_bit",
+])
+
+def skill_matches_career(record, skill, ontology):
+    """Whether a user skill covers any of the career's required skills in its catalog's skill ontology"""
+    return record.skill_mask & ontology.user_mask((skill,)) != 0
+
+def interest_matches_career(record, interest):
+    """Whether an interest keyword appears in the career description"""
+    return interest.lower() in record.description_lower
+
+def environment_matches_career(record, environment):
+    """Whether a preferred work environment appears in the career's environments"""
+    return environment.lower() in record.environment_lower
+
+def value_matches_career(record, value):
+    """Whether the catalog evidences a career value for the career"""
+    if value == "worklife":
+        return "flexible" in record.environment_lower
+    if value == "compensation":
+        return record.salary_max is not None and record.salary_max >= HIGH_PAY_THRESHOLD
+    if value == "growth":
+        return "growth" in record.outlook_lower
+    return False
+
+def personality_matches_career(record, personality):
+    """Whether the career description fits a work personality"""
+    keywords, _ = PERSONALITY_KEYWORDS.get(personality, ((), None))
+    return any(keyword in record.description_lower for keyword in keywords)
+
+def education_match(record, education_level):
+    """Return the reason for the first education requirement the level satisfies, or None"""
+    for keyword, minimum_level, reason in EDUCATION_REQUIREMENTS:
+        if keyword in record.education_lower and education_level >= minimum_level:
+            return reason
+    return None
+
+def education_level(education):
+    """Map a questionnaire education answer to its comparable level"""
+    return EDUCATION_LEVEL_SCORES.get(education, 0) if isinstance(education, str) else 0
+
+def _bits(mask):
+    """Yield the positions of the set bits in a mask, lowest first"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+def _term_mask(record, terms, matches):
+    """Bitmask of the vocabulary terms that match a career"""
+    mask = 0
+    for bit, term in enumerate(terms):
+        if matches(record, term):
+            mask |= 1 << bit
+    return mask
+
+def _education_mask(record):
+    """Bitmask of the questionnaire education levels that earn the education points"""
+    mask = 0
+    for level in range(1, MAX_EDUCATION_LEVEL + 1):
+        if education_match(record, level):
+            mask |= 1 << level
+    return mask
+
+class ScoringIndex:
+    """Per-catalog feature bitmasks and the batched scorer that reads them"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.skill_bits = {term: bit for bit, term in enumerate(SKILL_TERMS)}
+        self.interest_bits = {term: bit for bit, term in enumerate(INTEREST_TERMS)}
+        self.environment_bits = {term: bit for bit, term in enumerate(ENVIRONMENT_TERMS)}
+        self.value_bits = {value: bit for bit, value in enumerate(VALUE_REASONS)}
+        self.personality_bits = {personality: bit for bit, personality in enumerate(PERSONALITY_KEYWORDS)}
+        self.features = tuple(self._encode_career(record) for record in catalog)
+        self.postings = self._build_postings()
+
+    def _encode_career(self, record):
+        return CareerFeatures(
+            skills=_term_mask(record, SKILL_TERMS, self._skill_matches),
+            interests=_term_mask(record, INTEREST_TERMS, interest_matches_career),
+            education=_education_mask(record),
+            environments=_term_mask(record, ENVIRONMENT_TERMS, environment_matches_career),
+            values=_term_mask(record, tuple(VALUE_REASONS), value_matches_career),
+            personality=_term_mask(record, tuple(PERSONALITY_KEYWORDS), personality_matches_career),
+        )
+
+    def _skill_matches(self, record, skill):
+        return skill_matches_career(record, skill, self.catalog.ontology)
+
+    def _build_postings(self):
+        """Invert the feature masks into {family: {bit: career ids}} posting lists"""
+        postings = {family: {} for family in CareerFeatures._fields}
+        for career_id, features in enumerate(self.features):
+            for family, mask in zip(CareerFeatures._fields, features):
+                for bit in _bits(mask):
+                    postings[family].setdefault(bit, []).append(career_id)
+        return {family: {bit: tuple(career_ids) for bit, career_ids in lists.items()}
+                for family, lists in postings.items()}
+
+    def _scan(self, term, matches):
+        """Career ids matching a term outside the encoded vocabulary"""
+        return frozenset(record.id for record in self.catalog if matches(record, term))
+
+    def _group(self, answers, bits, normalize, matches):
+        """Split answers into (multiplicity, mask) groups plus scanned fallbacks"""
+        groups = {}
+        fallback = []
+        for term, multiplicity in Counter(normalize(answer) for answer in answers).items():
+            bit = bits.get(term)
+            if bit is None:
+                fallback.append((multiplicity, self._scan(term, matches)))
+            else:
+                groups[multiplicity] = groups.get(multiplicity, 0) | (1 << bit)
+        return tuple(groups.items()), tuple(fallback)
+
+    def encode_profile(self, interests, skills, values, personality, education, work_environment):
+        """Encode questionnaire answers as query masks against this index"""
+        # Skills are matched case-sensitively against lowercase career skills
+        skill_groups, skill_fallback = self._group(skills, self.skill_bits, str, self._skill_matches)
+
+        interest_mask = 0
+        interest_fallback = set()
+        for interest in set(interests or ()):
+            bit = self.interest_bits.get(interest.lower())
+            if bit is None:
+                interest_fallback |= self._scan(interest, interest_matches_career)
+            else:
+                interest_mask |= 1 << bit
+
+        environment_groups, environment_fallback = self._group(
+            work_environment, self.environment_bits, str.lower, environment_matches_career)
+        value_groups, _ = self._group(
+            [value for value in values if value in self.value_bits], self.value_bits, str, value_matches_career)
+
+        personality_bit = self.personality_bits.get(personality)
+        return ProfileQuery(
+            skill_groups=skill_groups,
+            skill_fallback=skill_fallback,
+            interest_mask=interest_mask,
+            interest_fallback=frozenset(interest_fallback),
+            education_bit=1 << education_level(education),
+            environment_groups=environment_groups,
+            environment_fallback=environment_fallback,
+            value_groups=value_groups,
+            personality_bit=0 if personality_bit is None else 1 << personality_bit,
+        )
+
+    def score_career(self, career_id, query):
+        """Score a single career against an encoded profile"""
+        features = self.features[career_id]
+        score = 0
+        for multiplicity, mask in query.skill_groups:
+            score += SKILL_POINTS * multiplicity * (features.skills & mask).bit_count()
+        for multiplicity, career_ids in query.skill_fallback:
+            if career_id in career_ids:
+                score += SKILL_POINTS * multiplicity
+        if features.interests & query.interest_mask or career_id in query.interest_fallback:
+            score += INTEREST_POINTS
+        if features.education & query.education_bit:
+            score += EDUCATION_POINTS
+        for multiplicity, mask in query.environment_groups:
+            score += ENVIRONMENT_POINTS * multiplicity * (features.environments & mask).bit_count()
+        for multiplicity, career_ids in query.environment_fallback:
+            if career_id in career_ids:
+                score += ENVIRONMENT_POINTS * multiplicity
+        for multiplicity, mask in query.value_groups:
+            score += VALUE_POINTS * multiplicity * (features.values & mask).bit_count()
+        if features.personality & query.personality_bit:
+            score += PERSONALITY_POINTS
+        return score
+
+    def score_all(self, query):
+        """Score every career in the catalog; returns a list indexed by career id"""
+        score_career = self.score_career
+        return [score_career(career_id, query) for career_id in range(len(self.features))]
+
+    def _family_terms(self, query):
+        """
+        Posting lists a query touches, each with its feature family and the most
+        points it can add.
+
+        Every career with a positive score appears in at least one of them.
+        """
+        postings = self.postings
+        terms = []
+        for multiplicity, mask in query.skill_groups:
+            for bit in _bits(mask):
+                terms.append(("skills", SKILL_POINTS * multiplicity, postings["skills"].get(bit, ())))
+        for multiplicity, career_ids in query.skill_fallback:
+            terms.append(("skills", SKILL_POINTS * multiplicity, career_ids))
+
+        # Interests score once however many match, so they form a single term
+        interest_ids = set(query.interest_fallback)
+        for bit in _bits(query.interest_mask):
+            interest_ids.update(postings["interests"].get(bit, ()))
+        terms.append(("interests", INTEREST_POINTS, interest_ids))
+
+        terms.append(("education", EDUCATION_POINTS,
+                      postings["education"].get(query.education_bit.bit_length() - 1, ())))
+        for multiplicity, mask in query.environment_groups:
+            for bit in _bits(mask):
+                terms.append(("environments", ENVIRONMENT_POINTS * multiplicity, postings["environments"].get(bit, ())))
+        for multiplicity, career_ids in query.environment_fallback:
+            terms.append(("environments", ENVIRONMENT_POINTS * multiplicity, career_ids))
+        for multiplicity, mask in query.value_groups:
+            for bit in _bits(mask):
+                terms.append(("values", VALUE_POINTS * multiplicity, postings["values"].get(bit, ())))
+        for bit in _bits(query.personality_bit):
+            terms.append(("personality", PERSONALITY_POINTS, postings["personality"].get(bit, ())))
+        return [(family, weight, career_ids) for family, weight, career_ids in terms if career_ids]
+
+    def _query_terms(self, query):
+        """Posting lists a query touches as (weight, career ids), across all families"""
+        return [(weight, career_ids) for _, weight, career_ids in self._family_terms(query)]
+
+    def contributions(self, query, families=None):
+        """
+        Per-family score contributions of every career.
+
+        Args:
+            query: Encoded profile
+            families: Feature families to compute; defaults to all of them
+
+        Returns:
+            Dictionary of family -> {career id: points} holding only the careers
+            the family gives points to; a career's score is the sum over families
+        """
+        families = CareerFeatures._fields if families is None else families
+        columns = {family: {} for family in families}
+        for family, weight, career_ids in self._family_terms(query):
+            column = columns.get(family)
+            if column is not None:
+                for career_id in career_ids:
+                    column[career_id] = column.get(career_id, 0) + weight
+        return columns
+
+    def top_candidates(self, query, limit, allowed=None):
+        """
+        Rank the best careers for a query using the inverted index.
+
+        Posting lists are walked shortest first and every career met is scored
+        exactly once. Once the points still available from unvisited lists fall
+        below the current k-th score, no unscored career can enter the top-k and
+        the walk stops. Careers with no signal score 0 and only pad the result.
+
+        Args:
+            query: Encoded profile
+            limit: Number of careers to return
+            allowed: Optional set of career ids to rank among, e.g. from hard
+                filters; when it is smaller than the posting lists the allowed
+                careers are scored directly instead
+
+        Returns:
+            List of (career_id, score), best first, in the same order as a
+            stable sort of score_all()
+        """
+        if limit <= 0:
+            return []
+        terms = sorted(self._query_terms(query), key=lambda term: (len(term[1]), -term[0]))
+        if allowed is not None and len(allowed) <= sum(len(career_ids) for _, career_ids in terms):
+            scores = {career_id: self.score_career(career_id, query) for career_id in allowed}
+            best = heapq.nlargest(limit, scores, key=lambda career_id: (scores[career_id], -career_id))
+            return [(career_id, scores[career_id]) for career_id in best]
+        remaining = sum(weight for weight, _ in terms)
+        best = []  # Min-heap of (score, -career_id) for the best careers seen so far
+        scored = set()
+
+        for weight, career_ids in terms:
+            if len(best) == limit and remaining < best[0][0]:
+                break
+            remaining -= weight
+            for career_id in career_ids:
+                if career_id in scored or (allowed is not None and career_id not in allowed):
+                    continue
+                scored.add(career_id)
+                entry = (self.score_career(career_id, query), -career_id)
+                if len(best) < limit:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+        ranked = [(-negative_id, score) for score, negative_id in sorted(best, reverse=True)]
+        if len(ranked) < limit:
+            candidates = range(len(self.features)) if allowed is None else sorted(allowed)
+            padding = (career_id for career_id in candidates if career_id not in scored)
+            ranked.extend((career_id, 0) for career_id, _ in zip(padding, range(limit - len(ranked))))
+        return ranked
+
+    @staticmethod
+    def top_k(scores, limit):
+        """
+        Career ids of the highest scores, best first.
+
+        Uses a partial sort; ties keep catalog (alphabetical) order, matching a
+        stable full sort of the scores.
+        """
+        return heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+
+def get_scoring_index(catalog=None):
+    """Return the scoring index for a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("scoring", ScoringIndex)
@@ -0,0 +1,310 @@
+# Server session module - session data kept server-side behind an opaque cookie
+#
+# Flask's default session serializes and signs every value into the cookie on
+# each response. Here the cookie carries only a random session id and the
+# revision of the last write; the data lives on the server. Each process keeps
+# an LRU tier of recently used sessions in front of the stored_session table.
+# A cached copy is used only when its revision matches the cookie, so a worker
+# never serves a session another worker has since changed. Writes go through
+# to both tiers, sessions are only written when they change (or when half
+# their lifetime has passed), and expired sessions are removed by a background
+# sweeper thread. The memory-only backend is the same tiered store without a
+# backing tier. Expiry times are timezone-aware UTC datetimes throughout.
+
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import CallbackDict
+
+from catalog_store import upsert_statement
+from extensions import db
+from models import StoredSession
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SESSION_BACKENDS = ("database", "memory", "cookie")
+MEMORY_SESSION_LIMIT = 10000          # Sessions kept per process in the LRU tier
+SWEEP_INTERVAL_SECONDS = 300
+
+SESSION_ID_PATTERN = re.compile(r"^([A-Za-z0-9_-]{32,64})\.(\d{1,9})$")
+
+StoredEntry = namedtuple("StoredEntry", [
+    "revision",            # Write counter, also carried in the cookie
+    "expires_at",          # UTC datetime after which the session is gone
+    "payload",             # Serialized session data
+])
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session data for one request, tracking reads and writes"""
+
+    def __init__(self, initial=None, sid=None, revision=0, expires_at=None):
+        def on_update(self):
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.revision = revision
+        self.expires_at = expires_at
+        self.new = sid is None
+        self.modified = False
+        self.accessed = False
+
+    def __getitem__(self, key):
+        self.accessed = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed = True
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self.accessed = True
+        return super().setdefault(key, default)
+
+class MemorySessionStore:
+    """Per-process LRU of stored sessions"""
+
+    def __init__(self, max_entries=MEMORY_SESSION_LIMIT):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sid):
+        """Return the StoredEntry for a session id, or None"""
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is not None:
+                self._entries.move_to_end(sid)
+            return entry
+
+    def save(self, sid, entry):
+        with self._lock:
+            self._entries[sid] = entry
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def sweep(self, now):
+        """Drop expired sessions; returns how many were dropped"""
+        with self._lock:
+            expired = [sid for sid, entry in self._entries.items() if entry.expires_at <= now]
+            for sid in expired:
+                del self._entries[sid]
+        return len(expired)
+
+class DatabaseSessionStore:
+    """
+    Sessions in the stored_session table, written on their own connection.
+
+    Database errors (such as a missing table before `flask init-db`) are
+    logged rather than raised, so a request still gets its response; the
+    memory tier then keeps the session for this process only.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._engine = None
+        self._upsert = None
+
+    def _connect(self):
+        """Engine and upsert statement, resolved once inside an app context"""
+        if self._engine is None:
+            with self.app.app_context():
+                self._upsert = upsert_statement(StoredSession, "id", ("revision", "expires_at", "data"))
+                self._engine = db.engine
+        return self._engine
+
+    def get(self, sid):
+        try:
+            with self._connect().connect() as connection:
+                row = connection.execute(
+                    select(StoredSession.revision, StoredSession.expires_at, StoredSession.data)
+                    .where(StoredSession.id == sid)).first()
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not read session {sid[:8]}: {e}")
+            return None
+        if row is None:
+            return None
+        revision, expires_at, payload = row
+        # SQLite has no timezone type and hands back naive datetimes; they were stored as UTC
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return StoredEntry(revision, expires_at, payload)
+
+    def save(self, sid, entry):
+        try:
+            with self._connect().begin() as connection:
+                connection.execute(self._upsert, [{"id": sid, "revision": entry.revision,
+                                                   "expires_at": entry.expires_at, "data": entry.payload}])
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not store session {sid[:8]}; keeping it in this process only: {e}")
+
+    def delete(self, sid):
+        try:
+            with self._connect().begin() as connection:
+                connection.execute(delete(StoredSession).where(StoredSession.id == sid))
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not delete session {sid[:8]}: {e}")
+
+    def sweep(self, now):
+        with self._connect().begin() as connection:
+            return connection.execute(delete(StoredSession).where(StoredSession.expires_at <= now)).rowcount
+
+class TieredSessionStore:
+    """
+    Memory tier in front of a backing store; reads fall through when the revision differs.
+
+    Without a backing store the memory tier holds the only copy, which is
+    served whatever its revision.
+    """
+
+    def __init__(self, memory, backing=None):
+        self.memory = memory
+        self.backing = backing
+
+    def get(self, sid, revision):
+        """Return the StoredEntry for a session id at the revision its cookie carries, or None"""
+        entry = self.memory.get(sid)
+        if self.backing is not None and (entry is None or entry.revision != revision):
+            entry = self.backing.get(sid)
+            if entry is not None:
+                self.memory.save(sid, entry)
+        return entry
+
+    def save(self, sid, entry):
+        if self.backing is not None:
+            self.backing.save(sid, entry)
+        self.memory.save(sid, entry)
+
+    def delete(self, sid):
+        if self.backing is not None:
+            self.backing.delete(sid)
+        self.memory.delete(sid)
+
+    def sweep(self, now):
+        removed = self.memory.sweep(now)
+        return self.backing.sweep(now) if self.backing is not None else removed
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface over a session store, with a background expiry sweeper"""
+
+    serializer = TaggedJSONSerializer()
+    session_class = ServerSession
+
+    def __init__(self, store, sweep_interval=SWEEP_INTERVAL_SECONDS):
+        self.store = store
+        self.sweep_interval = sweep_interval
+        self._sweeper_pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_sweeper(self):
+        """Start the expiry sweeper in this process if it is not running; safe after fork"""
+        if self.sweep_interval <= 0 or self._sweeper_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sweeper_pid == os.getpid():
+                return
+            threading.Thread(target=self._sweep_forever, name="session-sweeper", daemon=True).start()
+            self._sweeper_pid = os.getpid()
+
+    def _sweep_forever(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                removed = self.store.sweep(datetime.now(timezone.utc))
+                if removed:
+                    logger.debug(f"Removed {removed} expired sessions")
+            except Exception:
+                logger.exception("Session sweep failed")
+
+    def open_session(self, app, request):
+        self._ensure_sweeper()
+        match = SESSION_ID_PATTERN.match(request.cookies.get(self.get_cookie_name(app), ""))
+        if match:
+            sid, revision = match.group(1), int(match.group(2))
+            entry = self.store.get(sid, revision)
+            if entry is not None and entry.expires_at > datetime.now(timezone.utc):
+                try:
+                    data = self.serializer.loads(entry.payload)
+                except ValueError:
+                    logger.warning(f"Discarding unreadable session {sid[:8]}")
+                else:
+                    return self.session_class(data, sid, entry.revision, entry.expires_at)
+        return self.session_class()
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        # A shared cache must never store one visitor's session cookie and replay it to others
+        if response.cache_control.public:
+            if not session.modified:
+                return
+            response.cache_control.public = False
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+
+        if not session:
+            if session.sid is not None and session.modified:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+                response.vary.add("Cookie")
+            return
+
+        now = datetime.now(timezone.utc)
+        lifetime = app.permanent_session_lifetime
+        # Unchanged sessions are only rewritten to extend their lifetime once half of it has passed
+        if not session.modified and session.expires_at is not None and session.expires_at - now > lifetime / 2:
+            return
+
+        sid = session.sid or secrets.token_urlsafe(32)
+        revision = session.revision + 1 if session.modified or session.sid is None else session.revision
+        self.store.save(sid, StoredEntry(revision, now + lifetime, self.serializer.dumps(dict(session))))
+        response.set_cookie(name, f"{sid}.{revision}", expires=self.get_expiration_time(app, session),
+                            httponly=self.get_cookie_httponly(app), domain=domain, path=path,
+                            secure=self.get_cookie_secure(app), samesite=self.get_cookie_samesite(app))
+        response.vary.add("Cookie")
+
+def create_session_interface(app, backend="database"):
+    """
+    Session interface for a backend name.
+
+    Args:
+        app: Flask app whose database holds stored sessions
+        backend: "database" (memory tier over the stored_session table),
+            "memory" (single process only) or "cookie" (Flask's signed cookie)
+
+    Returns:
+        SessionInterface to assign to app.session_interface
+
+    Raises:
+        ValueError: If the backend is not one of SESSION_BACKENDS
+    """
+    if backend == "cookie":
+        return app.session_interface
+    if backend == "memory":
+        return ServerSessionInterface(TieredSessionStore(MemorySessionStore()))
+    if backend == "database":
+        return ServerSessionInterface(TieredSessionStore(MemorySessionStore(), DatabaseSessionStore(app)))
+    raise ValueError(f"Unknown session backend: {backend}")
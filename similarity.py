@@ -0,0 +1,252 @@
+# Similarity module - "careers like X" from precomputed TF-IDF neighbours
+#
+# Each career becomes a sparse, L2-normalized TF-IDF vector over its
+# description words, canonical skills and work environments. The k nearest
+# neighbours of every career are computed once per catalog, so a lookup just
+# reads a stored row. Candidates come from champion lists (the highest-weighted
+# careers of each feature) and are then scored exactly, which keeps the build
+# near-linear on large catalogs. An index is read-only once built. When a
+# reload publishes a catalog with the same careers, its index is derived from
+# the previous one: only the changed careers are re-vectorized, only the
+# neighbour rows that could see a change are recomputed, and everything else is
+# shared with the previous index. IDF weights are kept from the last full build
+# until a tenth of the catalog has changed, since recomputing them would move
+# the vector of nearly every career.
+
+import heapq
+import logging
+import math
+import re
+import threading
+from collections import Counter
+
+from catalog import get_catalog
+from skill_ontology import has_skill
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SIMILAR_CAREERS_K = 10
+CHAMPION_LIST_SIZE = 64        # Highest-weighted careers kept per feature for candidate generation
+RERANK_CANDIDATES = 50         # Candidates scored exactly after the champion-list pass
+MAX_IDF_DRIFT = 0.1            # Share of careers changed since the last full build before IDF is recomputed
+
+# Relative weight of each feature field before IDF
+SKILL_WEIGHT = 2.0
+ENVIRONMENT_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 1.0
+
+WORD_PATTERN = re.compile(r"[a-z]{3,}")
+STOP_WORDS = frozenset([
+    "and", "the", "for", "with", "that", "this", "from", "into", "their", "they", "them",
+    "are", "was", "were", "will", "can", "using", "use", "other", "such", "also", "its",
+    "all", "any", "through", "across", "various", "within", "while", "who", "how", "what",
+])
+
+def career_features(record, ontology):
+    """
+    Count the features of a career record.
+
+    Skills are keyed by their ontology key rather than their id, since ids
+    are assigned per catalog and an updated index mixes two catalogs' features.
+
+    Returns:
+        Dictionary of feature key to field-weighted term frequency
+    """
+    counts = Counter()
+    details = record.details
+    for word in WORD_PATTERN.findall(details.get("description", "").lower()):
+        if word not in STOP_WORDS:
+            counts[f"w:{word}"] += 1
+    features = {key: DESCRIPTION_WEIGHT * (1 + math.log(count)) for key, count in counts.items()}
+    for skill_id in record.skill_ids:
+        features[f"s:{ontology.key(skill_id)}"] = SKILL_WEIGHT
+    for environment in details.get("work_environment", "").lower().split(","):
+        if environment.strip():
+            features[f"e:{environment.strip()}"] = ENVIRONMENT_WEIGHT
+    return features
+
+def _dot(vector, other):
+    """Dot product of two sparse vectors"""
+    if len(other) < len(vector):
+        vector, other = other, vector
+    return sum(weight * other.get(feature, 0.0) for feature, weight in vector.items())
+
+class SimilarityIndex:
+    """TF-IDF vectors of every career and their k nearest neighbours"""
+
+    def __init__(self, catalog, k=SIMILAR_CAREERS_K, previous=None, idf=None):
+        """
+        Args:
+            catalog: Catalog to index
+            k: Neighbours kept per career
+            previous: Index of an earlier catalog to update from; used when both
+                catalogs list the same careers and IDF drift allows it
+            idf: IDF weights to build with instead of computing them
+        """
+        self.catalog = catalog
+        self.k = k
+        self.default_idf = math.log((1 + len(catalog)) / 2) + 1
+        if previous is not None and previous.k == k and previous.catalog.names == catalog.names:
+            changed = [career_id for career_id, (record, old) in enumerate(zip(catalog, previous.catalog))
+                       if record.details != old.details]
+            if previous.drift + len(changed) <= MAX_IDF_DRIFT * len(catalog):
+                self._update_from(previous, changed)
+                return
+        self._build(idf)
+
+    def _build(self, idf=None):
+        """Vectorize every career and compute every neighbour row"""
+        catalog = self.catalog
+        raw = [career_features(record, catalog.ontology) for record in catalog]
+        if idf is None:
+            document_frequency = Counter(feature for features in raw for feature in features)
+            idf = {feature: math.log((1 + len(catalog)) / (1 + count)) + 1
+                   for feature, count in document_frequency.items()}
+        # IDF is fixed at build time; features first seen in an update get the
+        # weight of a feature found in a single career
+        self.idf = idf
+        self.drift = 0
+
+        self.vectors = [self._vector(features) for features in raw]
+        self.postings = {}
+        for career_id, vector in enumerate(self.vectors):
+            for feature, weight in vector.items():
+                self.postings.setdefault(feature, {})[career_id] = weight
+        self.champions = {feature: self._champions(posting) for feature, posting in self.postings.items()}
+
+        self.neighbours = [self._nearest(career_id) for career_id in range(len(catalog))]
+        logger.debug(f"Built similarity index for catalog {catalog.version}: "
+                     f"{len(self.postings)} features, k={self.k}")
+
+    def _update_from(self, previous, changed):
+        """
+        Derive this index from the previous catalog's, copy-on-write.
+
+        The result matches a full build with the same IDF weights: a row is
+        recomputed whenever the career's vector changed, or a champion list it
+        reads changed or lists a career whose vector changed.
+        """
+        self.idf = previous.idf
+        self.drift = previous.drift + len(changed)
+        self.vectors = list(previous.vectors)
+        moved = set()
+        for career_id in changed:
+            vector = self._vector(career_features(self.catalog.records[career_id], self.catalog.ontology))
+            if vector != previous.vectors[career_id]:
+                self.vectors[career_id] = vector
+                moved.add(career_id)
+
+        # Postings and champion lists of the moved careers' features, rebuilt in catalog order
+        self.postings = dict(previous.postings)
+        self.champions = dict(previous.champions)
+        stale = set()
+        touched = {feature for career_id in moved
+                   for feature in previous.vectors[career_id].keys() | self.vectors[career_id].keys()}
+        for feature in touched:
+            posting = {career_id: weight for career_id, weight in previous.postings.get(feature, {}).items()
+                       if career_id not in moved}
+            posting.update((career_id, self.vectors[career_id][feature]) for career_id in moved
+                           if feature in self.vectors[career_id])
+            old_champions = previous.champions.get(feature, ())
+            if posting:
+                self.postings[feature] = {career_id: posting[career_id] for career_id in sorted(posting)}
+                self.champions[feature] = self._champions(self.postings[feature])
+            else:
+                del self.postings[feature]
+                del self.champions[feature]
+            if old_champions != self.champions.get(feature, ()) or \
+                    any(career_id in moved for career_id, _ in old_champions):
+                stale.update(previous.postings.get(feature, ()))
+                stale.update(self.postings.get(feature, ()))
+
+        self.neighbours = list(previous.neighbours)
+        for career_id in moved | stale:
+            self.neighbours[career_id] = self._nearest(career_id)
+        logger.debug(f"Updated similarity index for catalog {self.catalog.version}: {len(changed)} careers changed, "
+                     f"{len(moved | stale)} rows recomputed")
+
+    def _vector(self, features):
+        """L2-normalized TF-IDF vector for raw feature weights"""
+        vector = {feature: weight * self.idf.get(feature, self.default_idf) for feature, weight in features.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        return {feature: weight / norm for feature, weight in vector.items()}
+
+    def _champions(self, posting):
+        """(career_id, weight) pairs of the careers with the highest weights for a feature"""
+        if len(posting) <= CHAMPION_LIST_SIZE:
+            return tuple(posting.items())
+        return tuple(heapq.nlargest(CHAMPION_LIST_SIZE, posting.items(), key=lambda item: item[1]))
+
+    def _candidates(self, career_id):
+        """Careers sharing a feature with a career, with exact cosine similarities"""
+        vector = self.vectors[career_id]
+        partial = {}
+        for feature, weight in vector.items():
+            for other_id, other_weight in self.champions[feature]:
+                partial[other_id] = partial.get(other_id, 0.0) + weight * other_weight
+        partial.pop(career_id, None)
+        if len(partial) > RERANK_CANDIDATES:
+            partial = heapq.nlargest(RERANK_CANDIDATES, partial, key=partial.get)
+        return {other_id: _dot(vector, self.vectors[other_id]) for other_id in partial}
+
+    def _top(self, scores):
+        """Best k (career_id, similarity) pairs, ties broken by catalog order"""
+        return tuple(heapq.nlargest(self.k, scores.items(), key=lambda item: (item[1], -item[0])))
+
+    def _nearest(self, career_id):
+        """Neighbour row of a career"""
+        return self._top({other_id: score for other_id, score in self._candidates(career_id).items() if score > 0})
+
+    def similar(self, career_id, limit=None):
+        """List of (career_id, similarity) for a career's nearest neighbours, best first"""
+        return self.neighbours[career_id][:limit]
+
+# Most recently built index; the next catalog's index is derived from it
+_latest_index = None
+_latest_lock = threading.Lock()
+
+def _build_index(catalog):
+    """Build a catalog's index, from the previous index when the careers match"""
+    global _latest_index
+    index = SimilarityIndex(catalog, previous=_latest_index)
+    with _latest_lock:
+        _latest_index = index
+    return index
+
+def get_similarity_index(catalog=None):
+    """Return the similarity index of a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("similarity", _build_index)
+
+def similar_careers(career, limit=5, catalog=None):
+    """
+    Careers most like a given career.
+
+    Args:
+        career: Career name
+        limit: Maximum number of careers to return, at most SIMILAR_CAREERS_K
+        catalog: Catalog to search; defaults to the process-wide catalog
+
+    Returns:
+        List of dictionaries with the career, its cosine similarity and the
+        required skills it shares with the given career, or None if the career
+        is not in the catalog
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    record = catalog.get(career)
+    if record is None:
+        return None
+    index = get_similarity_index(catalog)
+    results = []
+    for other_id, score in index.similar(record.id, limit):
+        other = catalog.records[other_id]
+        # Shared skills are reported as the similar career lists them
+        skills = zip(other.details.get("required_skills", ()), other.skill_ids)
+        shared = dict.fromkeys(skill for skill, skill_id in skills if has_skill(record.skill_mask, skill_id))
+        results.append({
+            "career": other.name,
+            "similarity": round(score, 3),
+            "shared_skills": list(shared),
+        })
+    return results
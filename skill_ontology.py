@@ -0,0 +1,259 @@
+# Skill ontology module - canonical skills with synonyms and parent/child links
+#
+# Questionnaire skill answers, catalog required_skills strings and roadmap
+# skills all resolve to canonical skill ids. A career is the bitset of its
+# skills' ids; a user is the bitset of their answers' ids plus every skill
+# below them in the hierarchy, so "math" covers Statistics and "technical"
+# covers Programming. Matching, gaps and overlap are then AND and popcount
+# operations instead of substring scans. Labels the ontology does not know get
+# a standalone id the first time they are seen. Every catalog snapshot builds
+# its own ontology, so the labels a catalog registers are dropped with it on
+# reload instead of accumulating for the life of the process.
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Canonical skills: key -> (display label, parent keys, synonyms). Synonyms are
+# lowercase; the key and the lowercase label always resolve to the skill too.
+SKILL_ONTOLOGY = {
+    # Broad skill areas offered by the questionnaire and roadmap forms
+    "analytical": ("Analytical & Problem-Solving", [], ["analytical skills", "analysis", "analytical thinking"]),
+    "communication": ("Communication & Presentation", [], ["communication", "presentation"]),
+    "technical": ("Technical & Programming", [], ["technical skills"]),
+    "creativity": ("Creativity & Design", [], ["creative", "design"]),
+    "management": ("Leadership & Management", [], ["leadership & management"]),
+    "math": ("Mathematics & Quantitative", [], ["mathematics", "quantitative"]),
+    "research": ("Research & Data Analysis", [], ["research"]),
+    "interpersonal": ("Interpersonal & Teamwork", [], ["teamwork", "team collaboration"]),
+    "writing": ("Writing & Editing", [], ["writing"]),
+    "languages": ("Languages & Linguistics", [], ["linguistics"]),
+
+    # Technology
+    "programming": ("Programming", ["technical"], [
+        "programming languages", "programming languages (python, java, javascript, etc.)",
+        "programming (python, r)", "python programming", "programming fundamentals", "coding",
+    ]),
+    "algorithms": ("Data Structures & Algorithms", ["technical", "math"], [
+        "data structures", "algorithms", "advanced ml algorithms",
+    ]),
+    "version_control": ("Version Control", ["technical"], []),
+    "testing": ("Testing & Debugging", ["technical"], ["testing", "debugging"]),
+    "databases": ("SQL/Database Knowledge", ["technical"], ["sql", "databases", "database knowledge"]),
+    "machine_learning": ("Machine Learning", ["technical", "math"], ["mlops", "feature engineering"]),
+    "software_architecture": ("Software Architecture", ["technical"], [
+        "design patterns", "system architecture", "enterprise architecture", "microservices",
+        "scalability", "code optimization",
+    ]),
+    "devops": ("CI/CD & Data Pipelines", ["technical"], ["ci/cd", "data pipelines"]),
+    "spreadsheets": ("Excel/Spreadsheets", ["technical", "math"], ["excel", "spreadsheets"]),
+    "network_security": ("Network Security", ["technical"], []),
+    "security_tools": ("Security Tools", ["technical"], []),
+    "threat_analysis": ("Threat Analysis", ["technical", "analytical"], []),
+    "cad_software": ("CAD Software", ["technical", "creativity"], ["design software (autocad, etc.)", "autocad"]),
+    "lab_techniques": ("Lab Techniques", ["research", "technical"], []),
+
+    # Analysis and quantitative work
+    "problem_solving": ("Problem Solving", ["analytical"], []),
+    "critical_thinking": ("Critical Thinking", ["analytical"], []),
+    "attention_to_detail": ("Attention to Detail", ["analytical"], []),
+    "statistics": ("Statistics", ["math", "analytical"], []),
+    "data_analysis": ("Data Analysis", ["analytical", "research", "math"], ["analytics"]),
+    "data_visualization": ("Data Visualization", ["analytical", "communication"], []),
+    "market_analysis": ("Market Analysis", ["analytical", "research"], []),
+    "financial_modeling": ("Financial Modeling", ["math", "analytical"], []),
+    "financial_statement_analysis": ("Financial Statement Analysis", ["math", "analytical"], []),
+    "financial_reporting": ("Financial Reporting", ["math"], []),
+    "tax_preparation": ("Tax Preparation", ["math"], []),
+    "auditing": ("Auditing", ["math", "analytical"], []),
+    "budgeting": ("Budgeting", ["management", "math"], []),
+    "risk_assessment": ("Risk Assessment", ["analytical"], []),
+    "structural_analysis": ("Structural Analysis", ["analytical", "math", "technical"], []),
+    "thermal_analysis": ("Thermal Analysis", ["analytical", "math", "technical"], []),
+    "diagnosis": ("Diagnosis", ["analytical"], []),
+    "requirements_gathering": ("Requirements Gathering", ["analytical", "communication"], []),
+    "process_modeling": ("Process Modeling", ["analytical"], ["process improvement"]),
+    "research_methodology": ("Research Methodology", ["research"], ["research methods"]),
+    "user_research": ("User Research", ["research", "interpersonal"], []),
+    "seo": ("SEO/SEM", ["analytical", "writing"], ["seo", "sem", "seo knowledge"]),
+
+    # Design
+    "visual_design": ("Visual Design", ["creativity"], ["layout design", "typography"]),
+    "design_software": ("Design Software", ["creativity", "technical"], [
+        "design software (figma, adobe xd)", "adobe creative suite", "figma",
+    ]),
+    "wireframing": ("Wireframing", ["creativity"], ["information architecture"]),
+    "prototyping": ("Prototyping", ["creativity", "technical"], []),
+    "mechanical_design": ("Mechanical Design", ["creativity", "technical"], []),
+    "technical_drawing": ("Technical Drawing", ["creativity", "technical"], []),
+    "visual_communication": ("Visual Communication", ["creativity", "communication"], []),
+    "brand_identity": ("Brand Identity", ["creativity"], ["design systems"]),
+
+    # Writing and communication
+    "editing": ("Editing", ["writing", "languages"], []),
+    "content_creation": ("Content Creation", ["writing", "creativity"], []),
+    "content_strategy": ("Content Strategy", ["writing", "management"], []),
+    "technical_writing": ("Technical Writing", ["writing", "technical"], ["technical communication"]),
+    "email_marketing": ("Email Marketing", ["writing", "communication"], []),
+    "social_media_marketing": ("Social Media Marketing", ["communication", "creativity"], []),
+    "instruction": ("Instruction", ["communication", "interpersonal"], ["teaching", "mentoring"]),
+    "curriculum_development": ("Curriculum Development", ["writing"], []),
+
+    # People and leadership
+    "team_leadership": ("Team Leadership", ["management", "interpersonal"], [
+        "leadership", "technical leadership", "design leadership", "research leadership",
+        "cross-functional leadership",
+    ]),
+    "strategic_thinking": ("Strategic Thinking", ["analytical", "management"], [
+        "strategy", "technology strategy", "ai strategy", "design strategy", "business acumen",
+    ]),
+    "project_management": ("Project Management", ["management"], ["planning"]),
+    "agile": ("Agile Methodologies", ["management"], ["agile", "scrum"]),
+    "risk_management": ("Risk Management", ["management", "analytical"], []),
+    "benefits_administration": ("Benefits Administration", ["management"], []),
+    "classroom_management": ("Classroom Management", ["management", "interpersonal"], []),
+    "recruiting": ("Recruiting", ["interpersonal", "management"], []),
+    "conflict_resolution": ("Conflict Resolution", ["interpersonal", "communication"], []),
+    "negotiation": ("Negotiation", ["communication", "interpersonal"], []),
+    "sales_techniques": ("Sales Techniques", ["communication", "interpersonal"], []),
+    "customer_relationships": ("Customer Relationship Management", ["interpersonal"], ["crm"]),
+    "patient_care": ("Patient Care", ["interpersonal"], []),
+    "empathy": ("Empathy", ["interpersonal"], []),
+    "adaptability": ("Adaptability", ["interpersonal"], []),
+
+    # Domain knowledge
+    "medical_knowledge": ("Medical Knowledge", [], []),
+    "employment_law": ("Employment Law", [], []),
+}
+
+PARENTHETICAL_PATTERN = re.compile(r"\s*\([^)]*\)")
+MAX_CACHED_ANSWERS = 1024      # Free-text answers outside the ontology whose coverage is remembered
+
+def normalize_skill(text):
+    """Lowercase a skill label and collapse its whitespace"""
+    return " ".join((text or "").lower().split())
+
+class SkillOntology:
+    """Canonical skill ids, their synonyms and the skills below each one"""
+
+    def __init__(self, ontology):
+        self.keys = list(ontology)
+        self.ids = {key: skill_id for skill_id, key in enumerate(self.keys)}
+        self.labels = [label for label, _, _ in ontology.values()]
+        self.synonyms = {}
+        for key, (label, _, synonyms) in ontology.items():
+            for synonym in [key, label, *synonyms]:
+                self.synonyms.setdefault(normalize_skill(synonym), self.ids[key])
+
+        # Each skill's subtree: itself plus everything below it
+        children = {key: [] for key in ontology}
+        for key, (_, parents, _) in ontology.items():
+            for parent in parents:
+                children[parent].append(key)
+
+        def subtree(key):
+            mask = 1 << self.ids[key]
+            for child in children[key]:
+                mask |= subtree(child)
+            return mask
+
+        self.subtrees = [subtree(key) for key in self.keys]
+        self._answer_masks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def skill_id(self, label):
+        """
+        Canonical id for a required-skill label.
+
+        Labels are looked up as given and then without parenthetical examples
+        ("Programming (Python, R)"); unknown labels get a new standalone id.
+        """
+        normalized = normalize_skill(label)
+        skill_id = self.synonyms.get(normalized)
+        if skill_id is None:
+            skill_id = self.synonyms.get(PARENTHETICAL_PATTERN.sub("", normalized))
+        if skill_id is None:
+            skill_id = self._register(normalized, label)
+        return skill_id
+
+    def _register(self, normalized, label):
+        """Add a standalone skill for a label outside the ontology"""
+        with self._lock:
+            skill_id = self.synonyms.get(normalized)
+            if skill_id is None:
+                skill_id = len(self.keys)
+                self.keys.append(normalized)
+                self.ids[normalized] = skill_id
+                self.labels.append(label)
+                self.subtrees.append(1 << skill_id)
+                self.synonyms[normalized] = skill_id
+                logger.debug(f"Registered skill outside the ontology: {label}")
+        return skill_id
+
+    def career_mask(self, skill_ids):
+        """Bitset of a career's skill ids"""
+        mask = 0
+        for skill_id in skill_ids:
+            mask |= 1 << skill_id
+        return mask
+
+    def user_mask(self, skills):
+        """
+        Bitset of the skills a user's answers cover.
+
+        Each answer covers its own skill and every skill below it. Answers
+        outside the ontology cover the skills whose names contain them.
+        """
+        mask = 0
+        for skill in skills:
+            key = normalize_skill(skill)
+            skill_id = self.synonyms.get(key)
+            if skill_id is not None:
+                mask |= self.subtrees[skill_id]
+            else:
+                mask |= self._answer_mask(key)
+        return mask
+
+    def _answer_mask(self, key):
+        """
+        Skills covered by an answer outside the ontology, by substring match.
+
+        The scan is remembered for the most recent answers only, and redone
+        when new skills have been registered since.
+        """
+        known = len(self.keys)
+        with self._lock:
+            cached = self._answer_masks.get(key)
+            if cached is not None and cached[0] == known:
+                self._answer_masks.move_to_end(key)
+                return cached[1]
+        covered = 0
+        if key:
+            for synonym, synonym_id in list(self.synonyms.items()):
+                if key in synonym:
+                    covered |= self.subtrees[synonym_id]
+        with self._lock:
+            self._answer_masks[key] = (known, covered)
+            self._answer_masks.move_to_end(key)
+            while len(self._answer_masks) > MAX_CACHED_ANSWERS:
+                self._answer_masks.popitem(last=False)
+        return covered
+
+    def label(self, skill_id):
+        """Display label of a canonical skill"""
+        return self.labels[skill_id]
+
+    def key(self, skill_id):
+        """Key of a skill: its SKILL_ONTOLOGY key, or the normalized label of a registered skill"""
+        return self.keys[skill_id]
+
+def has_skill(mask, skill_id):
+    """Whether a skill bitset contains a skill id"""
+    return mask >> skill_id & 1 == 1
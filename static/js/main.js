@@ -47,8 +47,124 @@ document.addEventListener('DOMContentLoaded', function() {
 
     // Setup any charts on the page
     setupCharts();
+
+    // Interactive what-if re-ranking on the recommendation results page
+    setupWhatIf();
+
+    // Typeahead suggestions for career fields
+    setupCareerSearch();
 });
 
+function setupCareerSearch() {
+    const inputs = document.querySelectorAll('[data-career-search]');
+
+    inputs.forEach(input => {
+        const endpoint = input.getAttribute('data-career-search');
+        const options = document.getElementById(input.getAttribute('list'));
+        let timer = null;
+        let latest = '';
+
+        function render(data) {
+            // Ignore responses to queries the user has already typed past
+            if (data.query !== latest) return;
+            options.innerHTML = '';
+            data.results.forEach(result => {
+                const option = document.createElement('option');
+                option.value = result.career;
+                if (result.match !== result.career) {
+                    option.label = `${result.career} (${result.kind}: ${result.match})`;
+                }
+                options.appendChild(option);
+            });
+        }
+
+        input.addEventListener('input', function() {
+            clearTimeout(timer);
+            latest = this.value.trim();
+            if (!latest) {
+                options.innerHTML = '';
+                return;
+            }
+            timer = setTimeout(function() {
+                fetch(`${endpoint}?q=${encodeURIComponent(latest)}`)
+                    .then(response => response.json())
+                    .then(render)
+                    .catch(error => console.error('Career search failed:', error));
+            }, 150);
+        });
+    });
+}
+
+function setupWhatIf() {
+    const panel = document.getElementById('whatIfPanel');
+    if (!panel) return;
+
+    const endpoint = panel.getAttribute('data-endpoint');
+    const skillSelect = document.getElementById('whatIfSkill');
+    const educationSelect = document.getElementById('whatIfEducation');
+    const results = document.getElementById('whatIfResults');
+    let changes = [];
+
+    function render(data) {
+        results.innerHTML = '';
+        if (data.error) {
+            const item = document.createElement('li');
+            item.className = 'list-group-item text-danger';
+            item.textContent = data.error;
+            results.appendChild(item);
+            return;
+        }
+        data.recommendations.forEach(recommendation => {
+            const change = data.score_changes[recommendation.career] || 0;
+            const item = document.createElement('li');
+            item.className = 'list-group-item d-flex justify-content-between align-items-center';
+            item.textContent = recommendation.career;
+            const badge = document.createElement('span');
+            badge.className = 'badge ' + (change > 0 ? 'bg-success' : change < 0 ? 'bg-danger' : 'bg-secondary');
+            badge.textContent = recommendation.score + '% Match' + (change ? ` (${change > 0 ? '+' : ''}${change})` : '');
+            item.appendChild(badge);
+            results.appendChild(item);
+        });
+    }
+
+    function update() {
+        if (changes.length === 0) {
+            results.innerHTML = '';
+            return;
+        }
+        fetch(endpoint, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({changes: changes})
+        })
+            .then(response => response.json())
+            .then(render)
+            .catch(error => console.error('What-if request failed:', error));
+    }
+
+    skillSelect.addEventListener('change', function() {
+        if (this.value) {
+            changes.push({field: 'skills', add: this.value});
+            update();
+        }
+    });
+
+    educationSelect.addEventListener('change', function() {
+        changes = changes.filter(change => change.field !== 'education');
+        if (this.value) {
+            changes.push({field: 'education', set: this.value});
+        }
+        update();
+    });
+
+    document.getElementById('whatIfReset').addEventListener('click', function() {
+        changes = [];
+        skillSelect.value = '';
+        educationSelect.value = '';
+        update();
+    });
+}
+
 function setupMultiStepForm() {
     const multiStepForms = document.querySelectorAll('.multi-step-form');
     
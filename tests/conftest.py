@@ -0,0 +1,43 @@
+"""Shared fixtures: the app on a throwaway SQLite database"""
+
+import os
+import tempfile
+
+import pytest
+
+# The app reads its configuration at import, so point it at a scratch database first
+_database_dir = tempfile.mkdtemp(prefix="career-navigator-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_database_dir, 'test.db')}"
+os.environ["CATALOG_RELOAD_INTERVAL"] = "0"
+os.environ["SESSION_BACKEND"] = "database"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+@pytest.fixture(scope="session")
+def app():
+    from app import create_app, init_db
+    app = create_app()
+    # create_app never creates tables; deploys run `flask init-db` first
+    init_db()
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def store(tmp_path):
+    """App context on an empty database of its own, for tests that write the career tables"""
+    from flask import Flask
+
+    from extensions import db
+    import models  # noqa: F401 - registers the tables
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'catalog.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield
+        db.session.remove()
+        db.engine.dispose()
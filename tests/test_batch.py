@@ -0,0 +1,52 @@
+"""Tests for batch: upload parsing and in-process versus pooled scoring"""
+
+import pytest
+
+import batch
+from batch import parse_profiles_csv, parse_profiles_json, recommend_batch
+
+CSV_UPLOAD = (
+    "id,interests,skills,values,personality,education,work_environment\n"
+    "a1,technology; science,analytical;programming,salary,analytical,bachelor,office\n"
+    "a2,healthcare,,helping_others, social ,,\n"
+)
+
+def test_csv_lists_split_on_semicolons_and_blanks_are_dropped():
+    first, second = parse_profiles_csv(CSV_UPLOAD)
+    assert first == {"id": "a1", "interests": ["technology", "science"], "skills": ["analytical", "programming"],
+                     "values": ["salary"], "personality": "analytical", "education": "bachelor",
+                     "work_environment": ["office"]}
+    assert second["skills"] == [] and second["work_environment"] == []
+    assert second["personality"] == "social" and second["education"] == ""
+
+def test_csv_without_every_questionnaire_column_is_rejected():
+    with pytest.raises(ValueError, match="missing columns: education, work_environment"):
+        parse_profiles_csv("interests,skills,values,personality\ntechnology,,,\n")
+
+def test_json_accepts_a_list_or_a_profiles_object():
+    profile = {"id": 7, "interests": ["technology"], "skills": "analytical;writing", "personality": None}
+    assert parse_profiles_json([profile]) == parse_profiles_json({"profiles": [profile]})
+    parsed, = parse_profiles_json([profile])
+    assert parsed["id"] == 7
+    assert parsed["skills"] == ["analytical", "writing"]
+    assert parsed["values"] == [] and parsed["personality"] == ""
+
+@pytest.mark.parametrize("upload", [None, {"profiles": "nope"}, ["not a profile"], [{"skills": 3}]])
+def test_malformed_json_uploads_are_rejected(upload):
+    with pytest.raises(ValueError):
+        parse_profiles_json(upload)
+
+def test_batch_size_is_capped(monkeypatch):
+    monkeypatch.setattr(batch, "MAX_BATCH_PROFILES", 1)
+    with pytest.raises(ValueError):
+        recommend_batch(parse_profiles_csv(CSV_UPLOAD))
+
+def test_pooled_results_match_in_process_results():
+    profiles = parse_profiles_csv(CSV_UPLOAD) * 3
+    inline = list(recommend_batch(profiles, use_pool=False))
+    try:
+        pooled = sorted(recommend_batch(profiles, use_pool=True, workers=1), key=lambda result: result["index"])
+    finally:
+        batch.shutdown_pool()
+    assert [result["index"] for result in inline] == list(range(len(profiles)))
+    assert pooled == inline
@@ -0,0 +1,112 @@
+"""Tests for career_filters: the sorted range filters against a brute-force scan"""
+
+import itertools
+
+import pytest
+
+from benchmarks.synthetic_catalog import generate_career_data
+from career_filters import EDUCATION_ANSWER_TIERS, CareerFilters, get_filter_index, parse_filters
+from catalog import EDUCATION_TIERS, build_catalog
+
+def brute_force(catalog, filters):
+    """Reference filter: check every career's fields one by one"""
+    def passes(record):
+        if filters.min_salary is not None and not (record.salary_max is not None
+                                                   and record.salary_max >= filters.min_salary):
+            return False
+        if filters.min_growth is not None and not (record.growth_pct is not None
+                                                   and record.growth_pct >= filters.min_growth):
+            return False
+        return filters.max_education is None or record.education_tier <= filters.max_education
+    return frozenset(career_id for career_id, record in enumerate(catalog) if passes(record))
+
+@pytest.fixture(scope="module")
+def catalog():
+    data = generate_career_data(150, seed=3)
+    # Careers whose salary or outlook cannot be parsed must never pass those filters
+    for name in list(data)[:10]:
+        data[name] = dict(data[name], salary_range="Varies by employer")
+    for name in list(data)[5:15]:
+        data[name] = dict(data[name], job_outlook="Not available")
+    return build_catalog(data)
+
+def boundary_values(values):
+    """Every value a column holds, and values just either side of them and of its ends"""
+    values = sorted({value for value in values if value is not None})
+    edges = [values[0] - 1, values[-1] + 1, 0.0, -5.0]
+    return values + [value + offset for value in values[::7] for offset in (-0.5, 0.5)] + edges
+
+def test_unparsed_fields_are_in_the_fixture(catalog):
+    assert any(record.salary_max is None for record in catalog)
+    assert any(record.growth_pct is None for record in catalog)
+
+def test_each_filter_matches_a_brute_force_scan(catalog):
+    index = get_filter_index(catalog)
+    cases = itertools.chain(
+        (CareerFilters(value, None, None) for value in boundary_values(r.salary_max for r in catalog)),
+        (CareerFilters(None, value, None) for value in boundary_values(r.growth_pct for r in catalog)),
+        (CareerFilters(None, None, tier) for tier in range(len(EDUCATION_TIERS))),
+    )
+    for filters in cases:
+        assert index.matching(filters) == brute_force(catalog, filters), filters
+
+def test_a_filter_at_a_career_value_keeps_that_career(catalog):
+    index = get_filter_index(catalog)
+    for career_id, record in enumerate(catalog):
+        if record.salary_max is not None:
+            assert career_id in index.matching(CareerFilters(record.salary_max, None, None))
+        if record.growth_pct is not None:
+            assert career_id in index.matching(CareerFilters(None, record.growth_pct, None))
+        assert career_id in index.matching(CareerFilters(None, None, record.education_tier))
+
+def test_combined_filters_match_a_brute_force_scan(catalog):
+    index = get_filter_index(catalog)
+    salaries = sorted({record.salary_max for record in catalog if record.salary_max is not None})
+    growths = sorted({record.growth_pct for record in catalog if record.growth_pct is not None})
+    for salary, growth, tier in itertools.product(
+            [None] + salaries[::10], [None] + growths[::5], [None] + list(range(len(EDUCATION_TIERS)))):
+        filters = CareerFilters(salary, growth, tier)
+        expected = None if filters == CareerFilters(None, None, None) else brute_force(catalog, filters)
+        assert index.matching(filters) == expected, filters
+
+def test_parse_filters_reads_request_values():
+    assert parse_filters() is None
+    assert parse_filters("", "", "") is None
+    assert parse_filters("100000", "7.5", None) == CareerFilters(100000.0, 7.5, None)
+    assert parse_filters(None, "-2", "master") == CareerFilters(None, -2.0, 3)
+    for answer, tier in EDUCATION_ANSWER_TIERS.items():
+        assert parse_filters(max_education=answer) == CareerFilters(None, None, tier)
+    for tier, name in enumerate(EDUCATION_TIERS):
+        assert parse_filters(max_education=name) == CareerFilters(None, None, tier)
+
+@pytest.mark.parametrize("values, message", [
+    (("lots", None, None), "min_salary must be a number"),
+    ((None, "10%", None), "min_growth must be a number"),
+    (("nan", None, None), "min_salary must be a number"),
+    ((None, None, "Bachelor's degree"), "Unknown education level"),
+    ((None, None, "doctorate"), "Unknown education level"),
+])
+def test_parse_filters_rejects_bad_values(values, message):
+    with pytest.raises(ValueError, match=message):
+        parse_filters(*values)
+
+@pytest.mark.parametrize("query", [
+    "min_salary=lots",
+    "min_growth=ten",
+    "min_salary=nan",
+    "max_education=doctorate",
+    "interest=technology&min_salary=100000&max_education=college",
+])
+def test_recommendations_api_rejects_bad_filters(client, query):
+    response = client.get(f"/api/recommendations?{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+def test_recommendations_api_applies_filters(client):
+    response = client.get("/api/recommendations?interest=technology&skill=math&min_salary=100000")
+    assert response.status_code == 200
+    catalog = build_catalog()
+    recommendations = response.get_json()["recommendations"]
+    assert recommendations
+    for recommendation in recommendations:
+        assert catalog.get(recommendation["career"]).salary_max >= 100000
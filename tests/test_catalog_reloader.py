@@ -0,0 +1,119 @@
+"""Tests for catalog reloads: atomic swaps, request pinning and cache invalidation"""
+
+import copy
+import json
+import os
+import threading
+
+import pytest
+
+import catalog
+import catalog_reloader
+from career_data import CAREER_DATA
+from catalog import CatalogRegistry, get_catalog, pin_catalog, release_catalog
+from catalog_reloader import CatalogReloader
+from fragment_cache import career_fragment
+from result_cache import get_cached_recommendations, recommendation_cache
+from scoring import get_scoring_index
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A private catalog registry, so reloads here do not leak into other tests"""
+    fresh = CatalogRegistry()
+    monkeypatch.setattr(catalog, "catalog_registry", fresh)
+    monkeypatch.setattr(catalog_reloader, "catalog_registry", fresh)
+    # Result caches key on generation numbers, which the private registry restarts
+    recommendation_cache.clear()
+    yield fresh
+    recommendation_cache.clear()
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "careers.json"
+    revisions = []
+
+    def write(data):
+        path.write_text(json.dumps(data))
+        # Distinct modification times even on coarse-grained filesystems
+        revisions.append(len(revisions))
+        os.utime(path, ns=(revisions[-1] * 10**9, revisions[-1] * 10**9))
+
+    write(CAREER_DATA)
+    return path, write
+
+def edited(description):
+    data = copy.deepcopy(CAREER_DATA)
+    data["Nurse"]["description"] = description
+    return data
+
+def test_reload_publishes_a_new_version(app, registry, source):
+    path, write = source
+    reloader = CatalogReloader(app, interval=0, source_file=str(path))
+    assert reloader.check()
+    first = get_catalog()
+    assert not reloader.check()
+
+    write(edited("Cares for patients on night shifts."))
+    assert reloader.check()
+    second = get_catalog()
+    assert second.version != first.version
+    assert second.generation == first.generation + 1
+    assert second.details("Nurse")["description"] == "Cares for patients on night shifts."
+    # Warmed before it was published
+    assert "scoring" in second._derived and "similarity" in second._derived
+
+    # Rewriting the same contents keeps the served catalog and its indexes
+    write(edited("Cares for patients on night shifts."))
+    assert not reloader.check()
+    assert get_catalog() is second
+
+def test_pinned_catalog_survives_a_swap(app, registry, source):
+    path, write = source
+    reloader = CatalogReloader(app, interval=0, source_file=str(path))
+    reloader.check(warm=False)
+    old = get_catalog()
+
+    token = pin_catalog()
+    try:
+        write(edited("Swapped mid-request."))
+        reloader.check(warm=False)
+        assert get_catalog() is old
+        # Other contexts, e.g. a request starting on another thread, see the new catalog
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_catalog()))
+        thread.start()
+        thread.join()
+        assert seen[0] is not old and seen[0].details("Nurse")["description"] == "Swapped mid-request."
+    finally:
+        release_catalog(token)
+    assert get_catalog() is seen[0]
+
+def test_requests_pin_the_catalog_until_they_finish(app, registry):
+    with app.test_request_context("/"):
+        app.preprocess_request()
+        pinned = get_catalog()
+        registry.swap(catalog.build_catalog(edited("Published during the request.")))
+        assert get_catalog() is pinned
+    assert get_catalog() is not pinned
+
+def test_caches_keyed_on_the_old_catalog_are_not_served(app, registry, source):
+    path, write = source
+    reloader = CatalogReloader(app, interval=0, source_file=str(path))
+    reloader.check(warm=False)
+    answers = (["healthcare"], ["interpersonal"], ["helping_others"], "social", "bachelor", [])
+    with app.test_request_context():
+        old_panel = str(career_fragment("career_overview", "Nurse").fill())
+    old_index = get_scoring_index()
+    old_recommendations = get_cached_recommendations(*answers)
+
+    write(edited("A freshly reloaded description."))
+    reloader.check(warm=False)
+    with app.test_request_context():
+        new_panel = str(career_fragment("career_overview", "Nurse").fill())
+    assert "A freshly reloaded description." in new_panel
+    assert "A freshly reloaded description." not in old_panel
+    assert get_scoring_index() is not old_index
+    new_recommendations = get_cached_recommendations(*answers)
+    assert new_recommendations is not old_recommendations
+    nurse = next(item for item in new_recommendations if item["career"] == "Nurse")
+    assert nurse["details"]["description"] == "A freshly reloaded description."
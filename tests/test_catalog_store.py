@@ -0,0 +1,53 @@
+"""Tests for catalog_store: seeding the database and loading it back"""
+
+import pytest
+from sqlalchemy import func, select
+
+from career_data import CAREER_DATA
+from catalog import build_catalog
+from catalog_store import catalog_revision, load_catalog_snapshot, load_catalog_source, seed_catalog
+from extensions import db
+from models import (Career, CareerEnvironment, CareerRelated, CareerResource, CareerSkill, Skill,
+                    WorkEnvironment)
+
+CATALOG_TABLES = (Career, Skill, WorkEnvironment, CareerSkill, CareerEnvironment, CareerRelated, CareerResource)
+
+def row_counts():
+    return {model.__tablename__: db.session.execute(select(func.count()).select_from(model)).scalar()
+            for model in CATALOG_TABLES}
+
+def records(catalog):
+    return [(record.name, dict(record.details)) for record in catalog]
+
+def test_empty_database_has_no_snapshot(store):
+    assert load_catalog_source() is None
+    assert load_catalog_snapshot() is None
+    assert catalog_revision() == 0
+
+@pytest.mark.parametrize("batch_size", [1, 7, 500])
+def test_seed_then_load_gives_back_the_built_in_catalog(store, batch_size):
+    assert seed_catalog(batch_size=batch_size) == len(CAREER_DATA)
+    built_in = build_catalog()
+    loaded = load_catalog_snapshot()
+    assert records(loaded) == records(built_in)
+    assert loaded.version == built_in.version
+    assert catalog_revision() == 1
+
+def test_reseeding_changes_nothing(store):
+    seed_catalog()
+    counts, version = row_counts(), load_catalog_snapshot().version
+    seed_catalog(batch_size=3)
+    assert row_counts() == counts
+    assert load_catalog_snapshot().version == version
+    assert catalog_revision() == 2
+
+def test_reseeding_updates_changed_careers_in_place(store):
+    seed_catalog()
+    counts = row_counts()
+    career = dict(CAREER_DATA["Nurse"], description="Updated", required_skills=["Patient Care"])
+    seed_catalog({"Nurse": career})
+    source = load_catalog_source()
+    assert source["Nurse"]["description"] == "Updated"
+    assert source["Nurse"]["required_skills"] == ["Patient Care"]
+    assert row_counts()["career"] == counts["career"]
+    assert build_catalog(source).details("Teacher") == build_catalog().details("Teacher")
@@ -0,0 +1,105 @@
+"""Tests for export: resuming interrupted files and the admin-only HTTP export"""
+
+import json
+
+import pytest
+
+import export
+from export import EXPORT_FORMATS, format_csv, format_ndjson, resume_export_file
+
+def write(path, text):
+    path.write_bytes(text.encode("utf-8"))
+
+def test_resume_cuts_a_truncated_ndjson_line(tmp_path):
+    path = tmp_path / "export.ndjson"
+    write(path, '{"profile_id": 3, "recommendations": []}\n'
+                '{"profile_id": 9, "recommendations": []}\n'
+                '{"profile_id": 12, "recommen')
+    assert resume_export_file(str(path)) == 9
+    assert path.read_text().endswith('{"profile_id": 9, "recommendations": []}\n')
+
+CSV_HEADER = "profile_id,user_id,rank,career,score,match_reasons\n"
+
+def test_resume_drops_a_csv_profile_cut_off_between_its_rows(tmp_path):
+    path = tmp_path / "export.csv"
+    complete = CSV_HEADER + '4,1,1,Nurse,40,"Interest match; Values"\n4,1,2,Chef,30,\n'
+    for crash in ("5,1,1,Data Scientist,50,\n", "5,1,1,Data Scientist,50,\n5,1,2,Data Sci"):
+        write(path, complete + crash)
+        assert resume_export_file(str(path), "csv") == 4
+        assert path.read_text() == complete
+
+def test_resume_of_a_single_csv_profile_keeps_only_the_header(tmp_path):
+    path = tmp_path / "export.csv"
+    write(path, CSV_HEADER + "4,1,1,Nurse,40,\n4,1,2,Chef,30,\n")
+    assert resume_export_file(str(path), "csv") == 0
+    assert path.read_text() == CSV_HEADER
+
+def export_records(count):
+    return [{"profile_id": profile_id, "user_id": 1,
+             "recommendations": [{"career": f"Career {rank}", "score": 50 - rank, "match_reasons": ["Reason"]}
+                                 for rank in range(1, profile_id % 4 + 2)]}
+            for profile_id in range(1, count + 1)]
+
+@pytest.mark.parametrize("export_format", EXPORT_FORMATS)
+def test_resume_after_a_crash_at_any_byte_gives_the_full_export(tmp_path, monkeypatch, export_format):
+    monkeypatch.setattr(export, "RESUME_READ_SIZE", 16)        # Force scanning back across several blocks
+    records = export_records(6)
+
+    def render(after_id, header):
+        remaining = [record for record in records if record["profile_id"] > after_id]
+        chunks = format_csv(remaining, header=header) if export_format == "csv" else format_ndjson(remaining)
+        return "".join(chunks).encode("utf-8")
+
+    full = render(0, True)
+    path = tmp_path / f"export.{export_format}"
+    for crash in range(len(full)):
+        path.write_bytes(full[:crash])
+        after_id = resume_export_file(str(path), export_format)
+        written = path.read_bytes()
+        assert full.startswith(written)
+        assert written + render(after_id, header=not written) == full, crash
+
+@pytest.mark.parametrize("text", ["", '{"profile_id": 1', CSV_HEADER])
+def test_resume_without_complete_rows_starts_over(tmp_path, text):
+    path = tmp_path / "export.out"
+    write(path, text)
+    assert resume_export_file(str(path), "csv" if text == CSV_HEADER else "ndjson") == 0
+
+def test_resume_of_a_missing_file_starts_over(tmp_path):
+    assert resume_export_file(str(tmp_path / "missing.ndjson")) == 0
+
+@pytest.fixture
+def profiles(app):
+    from extensions import db
+    from models import User, UserProfile
+    with app.app_context():
+        user = User(username="export-test", email="export-test@example.com")
+        db.session.add(user)
+        db.session.flush()
+        rows = [UserProfile(user_id=user.id, interests="technology", skills='["analytical", "programming"]',
+                            values="salary", personality="analytical", education_level="bachelor")
+                for _ in range(3)]
+        db.session.add_all(rows)
+        db.session.commit()
+        ids = [row.id for row in rows]
+    yield ids
+    with app.app_context():
+        UserProfile.query.filter(UserProfile.id.in_(ids)).delete()
+        User.query.filter_by(username="export-test").delete()
+        db.session.commit()
+
+def test_http_export_is_hidden_without_a_configured_token(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "EXPORT_API_TOKEN", None)
+    assert client.get("/export/recommendations").status_code == 404
+
+def test_http_export_needs_the_admin_token(app, client, monkeypatch, profiles):
+    monkeypatch.setitem(app.config, "EXPORT_API_TOKEN", "s3cret")
+    assert client.get("/export/recommendations").status_code == 401
+    assert client.get("/export/recommendations", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get(f"/export/recommendations?after_id={profiles[0]}",
+                          headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [record["profile_id"] for record in records] == profiles[1:]
+    assert all(record["recommendations"] for record in records)
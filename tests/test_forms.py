@@ -0,0 +1,37 @@
+"""Tests for the career pickers: typeahead inputs validated against the catalog"""
+
+import pytest
+
+from catalog import get_catalog
+
+@pytest.fixture
+def form_client(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "WTF_CSRF_ENABLED", False)
+    return client
+
+def test_multi_comparison_page_does_not_ship_the_catalog(form_client):
+    html = form_client.get("/multi_comparison").get_data(as_text=True)
+    assert "data-career-search" in html
+    assert not any(career in html for career in get_catalog().names)
+
+def test_multi_comparison_accepts_known_careers_in_any_slots(form_client):
+    response = form_client.post("/multi_comparison", data={"careers-0": "Nurse", "careers-3": "Data Scientist",
+                                                            "careers-5": "Nurse"})
+    assert response.status_code == 302
+    with form_client.session_transaction() as session:
+        assert session["multi_comparison"]["careers"] == ["Nurse", "Data Scientist"]
+
+@pytest.mark.parametrize("data, message", [
+    ({"careers-0": "Nurse", "careers-1": "Not A Career"}, "Please choose a career from the suggestions."),
+    ({"careers-0": "Nurse"}, "Please select between 2 and"),
+])
+def test_multi_comparison_rejects_unknown_or_too_few_careers(form_client, data, message):
+    response = form_client.post("/multi_comparison", data=data)
+    assert response.status_code == 200
+    assert message in response.get_data(as_text=True)
+
+def test_compare_api_checks_names_against_the_catalog(client):
+    assert client.get("/api/compare?career=Nurse&career=Teacher").status_code == 200
+    response = client.get("/api/compare?career=Nurse&career=Nobody")
+    assert response.status_code == 404
+    assert response.get_json()["careers"] == ["Nobody"]
@@ -0,0 +1,73 @@
+"""Tests for fragment_cache: slot filling, escaping and the panel LRU"""
+
+from markupsafe import Markup
+
+from fragment_cache import Fragment, FragmentCache, career_fragment, fragment_slot, skill_match_layers
+
+def panel(*pieces):
+    return Fragment("".join(str(piece) for piece in pieces))
+
+def test_fill_escapes_plain_values_and_keeps_markup():
+    fragment = panel("<p>", fragment_slot("reason"), "</p><b>", fragment_slot("score"), "</b>")
+    html = fragment.fill(reason='<script>alert("x")</script>', score=Markup("<i>90</i>"))
+    assert html == '<p>&lt;script&gt;alert(&#34;x&#34;)&lt;/script&gt;</p><b><i>90</i></b>'
+    assert isinstance(html, Markup)
+
+def test_fill_takes_layers_and_leaves_missing_slots_empty():
+    fragment = panel("<span class=\"tag", fragment_slot("skill:0"), "\">SQL</span>", fragment_slot("missing"))
+    assert fragment.slots == ("skill:0", "missing")
+    assert fragment.fill({"skill:0": " matched"}) == '<span class="tag matched">SQL</span>'
+    assert fragment.__html__() == '<span class="tag">SQL</span>'
+
+def test_slot_names_are_escaped_like_the_template_writes_them():
+    fragment = panel(fragment_slot("a<b"))
+    assert fragment.fill({"a&lt;b": "x"}) == "x"
+
+def test_skill_match_layers_mark_skills_in_the_visitors_answers():
+    layers = skill_match_layers(["Python", "Statistics", "Excel"], ["python programming", "excel"])
+    assert layers == {"skill:0": " matched", "skill:2": " matched"}
+    assert skill_match_layers(["Python"], None) == {}
+
+def test_cache_is_keyed_per_catalog_version_and_bounded_by_size():
+    cache = FragmentCache(max_bytes=10)
+    renders = []
+
+    def render(html):
+        def render_panel():
+            renders.append(html)
+            return Fragment(html)
+        return render_panel
+
+    first = cache.get("card", "Nurse", "v1", render("12345"))
+    assert cache.get("card", "Nurse", "v1", render("other")) is first
+    cache.get("card", "Nurse", "v2", render("abcde"))
+    cache.get("card", "Chef", "v2", render("fghij"))
+    assert renders == ["12345", "abcde", "fghij"]
+    assert cache.size == 10 and cache.evictions == 1
+
+    cache.get("card", "Nurse", "v1", render("12345"))
+    assert renders[-1] == "12345"
+    assert cache.get("card", "Big", "v1", render("x" * 11)).size == 11
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["panels"]["card"]["hits"] == 1
+
+def test_career_panel_renders_catalog_text_escaped(app):
+    with app.test_request_context():
+        html = career_fragment("recommendation_card", "<Not A Career>").fill(score=10)
+    assert "&lt;Not A Career&gt;" in html
+    assert "10% Match" in html
+
+def test_marker_characters_in_text_are_not_slots():
+    token = "a1b2"
+    fragment = Fragment("<p>A\x00:score\x00B\x00</p>" + str(fragment_slot("score", token)), token)
+    assert fragment.slots == ("score",)
+    assert fragment.fill(score=7) == "<p>A\x00:score\x00B\x00</p>7"
+
+def test_career_panel_keeps_nul_characters_in_catalog_text(app):
+    name = "Night\x00:score\x00Nurse\x00"
+    with app.test_request_context():
+        fragment = career_fragment("recommendation_card", name)
+        html = fragment.fill(score=42)
+    assert fragment.slots[0] == "score"
+    assert name in html
+    assert "42% Match" in html
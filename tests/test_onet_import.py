@@ -0,0 +1,78 @@
+"""Tests for onet_import: idempotent re-runs and rejection of malformed rows"""
+
+import logging
+import os
+
+import pytest
+from sqlalchemy import func, select
+
+from catalog_store import load_catalog_snapshot, load_catalog_source
+from extensions import db
+from models import Career, CareerPath, CareerRelated, CareerSkill, Skill
+from onet_import import ONET_FILES, import_onet
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "onet")
+IMPORT_TABLES = (Career, Skill, CareerSkill, CareerPath, CareerRelated)
+
+def row_counts():
+    return {model.__tablename__: db.session.execute(select(func.count()).select_from(model)).scalar()
+            for model in IMPORT_TABLES}
+
+def table_rows():
+    """Every imported row without its surrogate id, so two imports can be compared"""
+    rows = {}
+    for model in IMPORT_TABLES:
+        columns = [column for column in model.__table__.columns if column.name != "id"]
+        rows[model.__tablename__] = sorted(db.session.execute(select(*columns)).all())
+    return rows
+
+def test_import_reads_the_fixture(store):
+    counts = import_onet(FIXTURES)
+    assert counts == {"occupations": 6, "skills": 14, "education": 7, "related": 4}
+    source = load_catalog_source()
+    assert sorted(source) == ["Computer Systems Analysts", "Registered Nurses", "Software Developers"]
+    developers = source["Software Developers"]
+    assert developers["required_skills"] == ["Programming", "Complex Problem Solving"]
+    assert developers["required_education"] == "Bachelor's degree"
+    assert developers["related_careers"] == ["Computer Systems Analysts"]
+    assert source["Computer Systems Analysts"]["required_skills"] == ["Systems Analysis", "Programming"]
+    assert source["Registered Nurses"]["required_skills"] == ["Service Orientation"]
+    assert source["Registered Nurses"]["related_careers"] == []
+
+def test_rerunning_the_import_is_idempotent(store):
+    import_onet(FIXTURES)
+    counts, rows, version = row_counts(), table_rows(), load_catalog_snapshot().version
+    import_onet(FIXTURES, chunk_size=1)
+    assert row_counts() == counts
+    assert table_rows() == rows
+    assert load_catalog_snapshot().version == version
+
+def test_malformed_rows_are_rejected(store, caplog):
+    with caplog.at_level(logging.WARNING, logger="onet_import"):
+        import_onet(FIXTURES)
+    rejected = sorted(record.getMessage() for record in caplog.records)
+    assert rejected == [
+        "Rejected education row 8: blank Category",
+        "Rejected occupations row 5: too few fields",
+        "Rejected occupations row 6: blank Title",
+        "Rejected occupations row 7: too many fields",
+        "Rejected related occupations row 5: blank Related O*NET-SOC Code",
+        "Rejected skills row 11: blank Element Name",
+        "Rejected skills row 14: too few fields",
+    ]
+    names = set(db.session.execute(select(Career.name)).scalars())
+    assert not names & {"Missing Description", "", "Extra Fields"}
+    assert "" not in set(db.session.execute(select(Skill.name)).scalars())
+
+def test_file_missing_a_required_column_is_refused(store, tmp_path):
+    with open(os.path.join(FIXTURES, ONET_FILES["occupations"]), encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+    lines[0] = lines[0].replace("Title", "Name")
+    (tmp_path / ONET_FILES["occupations"]).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="missing columns: Title"):
+        import_onet(str(tmp_path))
+    assert row_counts()["career"] == 0
+
+def test_missing_occupation_data_is_refused(store, tmp_path):
+    with pytest.raises(ValueError, match="Missing occupation data"):
+        import_onet(str(tmp_path))
@@ -0,0 +1,85 @@
+"""Tests for result_links: canonical signed tokens and cacheable result pages"""
+
+import secrets
+from datetime import datetime, timezone
+
+import pytest
+
+from result_links import decode_result_token, encode_result_token
+
+ANSWERS = {"career1": "Data Scientist", "career2": "Software Developer", "skills": ["programming", "analytical"]}
+
+@pytest.fixture
+def token(app):
+    with app.test_request_context():
+        return encode_result_token("comparison", ANSWERS)
+
+def test_equal_answers_give_the_same_token(app, token):
+    with app.test_request_context():
+        reordered = dict(ANSWERS, skills=["analytical", "programming", "analytical"])
+        assert encode_result_token("comparison", reordered) == token
+        assert decode_result_token("comparison", token) == dict(ANSWERS, skills=["analytical", "programming"])
+
+def test_token_is_bound_to_its_tool(app, token):
+    with app.test_request_context():
+        with pytest.raises(ValueError):
+            decode_result_token("roadmap", token)
+        with pytest.raises(ValueError):
+            decode_result_token("unknown", token)
+
+def tampered(token):
+    payload, signature = token.rsplit(".", 1)
+    return f"{payload[:-1]}{'A' if payload[-1] != 'A' else 'B'}.{signature}"
+
+def test_tampered_token_is_not_found(client, token):
+    assert client.get(f"/results/comparison/{tampered(token)}").status_code == 404
+    assert client.get(f"/results/comparison/{token[:-2]}").status_code == 404
+    assert client.get(f"/results/unknown/{token}").status_code == 404
+
+def test_result_page_is_public_and_revalidates_with_its_etag(client, token):
+    response = client.get(f"/results/comparison/{token}")
+    assert response.status_code == 200
+    assert response.cache_control.public
+    etag, _ = response.get_etag()
+    assert etag
+
+    revalidated = client.get(f"/results/comparison/{token}", headers={"If-None-Match": f'"{etag}"'})
+    assert revalidated.status_code == 304
+    assert revalidated.get_etag()[0] == etag
+
+def ageing_session(app, client):
+    """Give the client a stored session past half its lifetime, so the next save would refresh it"""
+    from server_session import StoredEntry
+    interface = app.session_interface
+    sid = secrets.token_urlsafe(32)
+    expires_at = datetime.now(timezone.utc) + app.permanent_session_lifetime / 4
+    interface.store.save(sid, StoredEntry(1, expires_at, interface.serializer.dumps({"seen": True})))
+    client.set_cookie(app.config["SESSION_COOKIE_NAME"], f"{sid}.1")
+
+@pytest.fixture
+def shared_urls(app):
+    with app.test_request_context():
+        return [
+            f"/results/comparison/{encode_result_token('comparison', ANSWERS)}",
+            f"/results/roadmap/{encode_result_token('roadmap', {'career': 'Nurse', 'experience_level': 'entry'})}",
+            f"/results/recommendation/{encode_result_token('recommendation', {'interests': ['technology']})}",
+        ]
+
+@pytest.mark.parametrize("visitor", ["anonymous", "fresh session", "ageing session"])
+def test_public_responses_never_set_a_cookie(app, client, shared_urls, visitor):
+    if visitor == "fresh session":
+        with client.session_transaction() as session:
+            session["seen"] = True
+    elif visitor == "ageing session":
+        ageing_session(app, client)
+    for url in shared_urls + ["/", "/questionnaire"]:
+        response = client.get(url)
+        assert response.status_code == 200, url
+        if response.cache_control.public:
+            assert "Set-Cookie" not in response.headers, url
+
+def test_ageing_session_still_gets_a_shareable_result(app, client, shared_urls):
+    ageing_session(app, client)
+    response = client.get(shared_urls[0])
+    assert response.cache_control.public
+    assert "Set-Cookie" not in response.headers
@@ -0,0 +1,46 @@
+"""Tests for scoring: the pruned top-k walk against a full stable sort"""
+
+import random
+
+import pytest
+
+from benchmarks.synthetic_catalog import build_synthetic_catalog, generate_profiles
+from scoring import ScoringIndex
+
+def expected_top(scores, limit, allowed=None):
+    """Reference ranking: stable sort of every (allowed) career by score"""
+    candidates = range(len(scores)) if allowed is None else sorted(allowed)
+    ranked = sorted(candidates, key=lambda career_id: -scores[career_id])
+    return [(career_id, scores[career_id]) for career_id in ranked[:limit]]
+
+def encode(index, profile):
+    return index.encode_profile(profile["interests"], profile["skills"], profile["values"],
+                                profile["personality"], profile["education"], profile["work_environment"])
+
+@pytest.mark.parametrize("size, seed", [(20, 0), (60, 1), (300, 2)])
+def test_top_candidates_matches_a_stable_sort(size, seed):
+    index = ScoringIndex(build_synthetic_catalog(size, seed=seed))
+    rng = random.Random(seed)
+    ties_at_cutoff = 0
+    for profile in generate_profiles(40, seed=seed):
+        query = encode(index, profile)
+        scores = index.score_all(query)
+        for limit in (1, 3, 5, 10, size, size + 5):
+            expected = expected_top(scores, limit)
+            assert index.top_candidates(query, limit) == expected
+            if limit < size and expected[-1][1] == sorted(scores, reverse=True)[limit]:
+                ties_at_cutoff += 1
+
+        for share in (0.05, 0.3, 0.9):
+            allowed = set(rng.sample(range(size), max(1, int(size * share))))
+            for limit in (1, 5, len(allowed) + 2):
+                assert index.top_candidates(query, limit, allowed) == expected_top(scores, limit, allowed)
+        assert index.top_candidates(query, 0) == []
+    # The comparison is only meaningful if some cutoffs fell inside a run of equal scores
+    assert ties_at_cutoff > 0
+
+def test_profile_without_signal_pads_in_catalog_order():
+    index = ScoringIndex(build_synthetic_catalog(30))
+    query = index.encode_profile([], [], [], "", "", [])
+    assert index.top_candidates(query, 4) == [(0, 0), (1, 0), (2, 0), (3, 0)]
+    assert index.top_candidates(query, 2, allowed={7, 3, 12}) == [(3, 0), (7, 0)]
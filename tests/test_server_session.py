@@ -0,0 +1,90 @@
+"""Tests for server_session: the tiered store and the session cookie"""
+
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask
+
+from extensions import db
+from server_session import (SESSION_ID_PATTERN, DatabaseSessionStore, MemorySessionStore, StoredEntry,
+                            TieredSessionStore)
+
+def entry(revision, payload="{}"):
+    return StoredEntry(revision, datetime.now(timezone.utc) + timedelta(hours=1), payload)
+
+def test_stale_memory_copy_falls_through_to_the_database(app):
+    backing = DatabaseSessionStore(app)
+    store = TieredSessionStore(MemorySessionStore(), backing)
+    store.save("stale-session", entry(1, '{"step": 1}'))
+
+    # Another worker writes revision 2; this process still caches revision 1
+    backing.save("stale-session", entry(2, '{"step": 2}'))
+    assert store.memory.get("stale-session").revision == 1
+
+    fetched = store.get("stale-session", 2)
+    assert (fetched.revision, fetched.payload) == (2, '{"step": 2}')
+    assert store.memory.get("stale-session").revision == 2
+
+def test_matching_memory_copy_skips_the_backing_store():
+    class Unreachable:
+        def get(self, sid):
+            raise AssertionError("backing store read")
+
+    store = TieredSessionStore(MemorySessionStore(), Unreachable())
+    store.memory.save("fresh-session", entry(3))
+    assert store.get("fresh-session", 3).revision == 3
+
+def test_database_store_returns_aware_expiry_times(app):
+    store = DatabaseSessionStore(app)
+    saved = entry(1)
+    store.save("aware-session", saved)
+    fetched = store.get("aware-session")
+    assert fetched.expires_at.tzinfo is not None
+    assert fetched.expires_at == saved.expires_at
+    store.sweep(saved.expires_at - timedelta(seconds=1))
+    assert store.get("aware-session") is not None
+    store.sweep(saved.expires_at)
+    assert store.get("aware-session") is None
+
+def test_memory_only_store_serves_any_revision():
+    store = TieredSessionStore(MemorySessionStore())
+    store.save("only-copy", entry(4))
+    assert store.get("only-copy", 3).revision == 4
+    assert store.sweep(datetime.now(timezone.utc) + timedelta(hours=2)) == 1
+    assert store.get("only-copy", 4) is None
+
+def test_memory_tier_is_bounded():
+    memory = MemorySessionStore(max_entries=2)
+    for number in range(3):
+        memory.save(f"session-{number}", entry(1))
+    assert memory.get("session-0") is None
+    assert memory.get("session-2") is not None
+
+def test_database_errors_do_not_fail_the_request(tmp_path):
+    # An app whose database has no stored_session table yet
+    bare = Flask(__name__)
+    bare.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'empty.db'}"
+    db.init_app(bare)
+    store = DatabaseSessionStore(bare)
+    store.save("missing-table", entry(1))
+    assert store.get("missing-table") is None
+    store.delete("missing-table")
+
+def test_session_cookie_carries_only_the_id_and_revision(app, client):
+    with client.session_transaction() as session:
+        session["answers"] = {"skills": ["analytical"]}
+    cookie = client.get_cookie(app.config["SESSION_COOKIE_NAME"]).value
+    sid, revision = SESSION_ID_PATTERN.match(cookie).groups()
+    assert revision == "1"
+    assert "analytical" not in cookie
+
+    # Another worker's process has no memory copy; the session is read from the database
+    app.session_interface.store.memory.delete(sid)
+    with client.session_transaction() as session:
+        assert session["answers"] == {"skills": ["analytical"]}
+
+def test_unknown_or_malformed_session_cookie_starts_a_new_session(app, client):
+    name = app.config["SESSION_COOKIE_NAME"]
+    for cookie in ("not-a-session", "A" * 43 + ".1"):
+        client.set_cookie(name, cookie)
+        with client.session_transaction() as session:
+            assert session.new and not session
@@ -0,0 +1,77 @@
+"""Tests for similarity: neighbour rows, shared skills and incremental updates"""
+
+import copy
+import random
+
+import pytest
+
+from benchmarks.synthetic_catalog import generate_career_data
+from career_data import DEFAULT_CAREER_DETAILS
+from catalog import build_catalog, get_catalog
+from similarity import MAX_IDF_DRIFT, SIMILAR_CAREERS_K, SimilarityIndex, get_similarity_index, similar_careers
+
+def test_neighbours_are_other_careers_best_first():
+    for career in get_catalog().names:
+        results = similar_careers(career, limit=SIMILAR_CAREERS_K)
+        names = [result["career"] for result in results]
+        scores = [result["similarity"] for result in results]
+        assert career not in names
+        assert len(names) == len(set(names))
+        assert scores == sorted(scores, reverse=True)
+        assert all(0 < score <= 1 for score in scores)
+
+def test_limit_and_unknown_careers():
+    assert len(similar_careers("Data Scientist", limit=2)) == 2
+    assert similar_careers("Not A Career") is None
+
+def test_shared_skills_use_the_similar_careers_own_wording():
+    catalog = get_catalog()
+    seen_shared = False
+    for career in catalog.names:
+        for result in similar_careers(career, limit=SIMILAR_CAREERS_K):
+            required = catalog.details(result["career"])["required_skills"]
+            assert set(result["shared_skills"]) <= set(required)
+            seen_shared = seen_shared or bool(result["shared_skills"])
+    assert seen_shared
+
+def test_index_is_built_once_per_catalog():
+    catalog = get_catalog()
+    assert get_similarity_index(catalog) is get_similarity_index(catalog)
+
+def reloaded(data, changes, seed=0):
+    """A catalog with the given careers' details replaced by other generated careers' details"""
+    rng = random.Random(seed)
+    replacements = list(generate_career_data(len(data), seed=seed + 1).values())
+    updated = dict(data)
+    for name in rng.sample(sorted(data), changes):
+        updated[name] = rng.choice(replacements)
+    return build_catalog(updated, DEFAULT_CAREER_DETAILS)
+
+def snapshot(index):
+    return index.vectors, index.postings, index.champions, index.neighbours
+
+@pytest.mark.parametrize("size, changes", [(40, 1), (300, 3), (300, 30)])
+def test_incremental_update_equals_a_full_rebuild(size, changes):
+    data = generate_career_data(size, seed=size)
+    previous = SimilarityIndex(build_catalog(data, DEFAULT_CAREER_DETAILS))
+    before = copy.deepcopy(snapshot(previous))
+    catalog = reloaded(data, changes, seed=size)
+
+    updated = SimilarityIndex(catalog, previous=previous)
+    assert updated.drift == changes
+    assert snapshot(updated) == snapshot(SimilarityIndex(catalog, idf=previous.idf))
+    # Copy-on-write: the published index is untouched
+    assert snapshot(previous) == before
+
+def test_full_rebuild_once_idf_drift_is_too_large():
+    data = generate_career_data(100, seed=1)
+    previous = SimilarityIndex(build_catalog(data, DEFAULT_CAREER_DETAILS))
+    catalog = reloaded(data, int(100 * MAX_IDF_DRIFT) + 1, seed=7)
+    updated = SimilarityIndex(catalog, previous=previous)
+    assert updated.drift == 0
+    assert snapshot(updated) == snapshot(SimilarityIndex(catalog))
+
+def test_different_careers_get_a_full_build():
+    previous = SimilarityIndex(build_catalog(generate_career_data(50, seed=1), DEFAULT_CAREER_DETAILS))
+    catalog = build_catalog(generate_career_data(60, seed=1), DEFAULT_CAREER_DETAILS)
+    assert snapshot(SimilarityIndex(catalog, previous=previous)) == snapshot(SimilarityIndex(catalog))
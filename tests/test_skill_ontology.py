@@ -0,0 +1,81 @@
+"""Tests for skill_ontology: synonyms, hierarchy coverage and the answer cache"""
+
+import skill_ontology
+from skill_ontology import SKILL_ONTOLOGY, SkillOntology, has_skill
+
+def make_ontology():
+    # A private ontology, so registered labels do not leak into other tests
+    return SkillOntology(SKILL_ONTOLOGY)
+
+def catalog_with_skills(*skills):
+    from career_data import CAREER_DATA
+    from catalog import build_catalog
+    career = dict(CAREER_DATA["Nurse"], required_skills=list(skills))
+    return build_catalog({"Nurse": career, "Teacher": CAREER_DATA["Teacher"]})
+
+def test_labels_resolve_through_synonyms_and_parentheticals():
+    ontology = make_ontology()
+    programming = ontology.ids["programming"]
+    assert ontology.skill_id("Programming") == programming
+    assert ontology.skill_id("  CODING ") == programming
+    assert ontology.skill_id("Programming (Python, R)") == programming
+
+def test_unknown_label_gets_a_standalone_id_once():
+    ontology = make_ontology()
+    known = len(ontology)
+    skill_id = ontology.skill_id("Beekeeping")
+    assert skill_id == known
+    assert ontology.skill_id("beekeeping") == skill_id
+    assert ontology.label(skill_id) == "Beekeeping"
+
+def test_answer_covers_skills_below_it():
+    ontology = make_ontology()
+    mask = ontology.user_mask(["math"])
+    assert has_skill(mask, ontology.ids["math"])
+    assert has_skill(mask, ontology.ids["algorithms"])
+    assert not has_skill(mask, ontology.ids["programming"])
+
+def test_free_text_answer_covers_skills_containing_it():
+    ontology = make_ontology()
+    mask = ontology.user_mask(["spreadsheet"])
+    assert has_skill(mask, ontology.ids["spreadsheets"])
+    assert ontology.user_mask([""]) == 0
+
+def test_free_text_cache_is_rescanned_after_new_skills():
+    ontology = make_ontology()
+    assert ontology.user_mask(["apiar"]) == 0
+    skill_id = ontology.skill_id("Apiary Management")
+    assert has_skill(ontology.user_mask(["apiar"]), skill_id)
+
+def test_only_free_text_answers_are_cached_and_the_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(skill_ontology, "MAX_CACHED_ANSWERS", 8)
+    ontology = make_ontology()
+    ontology.user_mask(["analytical", "Programming"])
+    assert len(ontology._answer_masks) == 0
+    for number in range(50):
+        ontology.user_mask([f"unknown answer {number}"])
+    assert list(ontology._answer_masks) == [f"unknown answer {number}" for number in range(42, 50)]
+
+def test_roadmap_skill_gaps_skip_skills_the_answers_cover():
+    from recommendation_engine import get_career_roadmap
+    roadmap = get_career_roadmap("Software Developer", "entry", ["technical"], "bachelor", 0)
+    assert not any("programming" in gap.lower() for gap in roadmap["skill_gaps"])
+    assert "Problem Solving" in roadmap["skill_gaps"]
+
+def test_each_catalog_registers_skills_in_its_own_ontology():
+    canonical = len(SKILL_ONTOLOGY)
+    first = catalog_with_skills("Patient Care", "Wound Dressing")
+    second = catalog_with_skills("Patient Care", "Triage Protocols")
+    assert "wound dressing" in first.ontology.ids
+    assert "wound dressing" not in second.ontology.ids
+    assert "triage protocols" in second.ontology.ids
+    # A reload registers only the new catalog's labels on top of the canonical skills
+    registered = {key for record in second for skill_id in record.skill_ids
+                  if (key := second.ontology.key(skill_id)) not in SKILL_ONTOLOGY}
+    assert len(second.ontology) == canonical + len(registered)
+
+def test_skill_matching_uses_the_catalog_ontology():
+    from scoring import skill_matches_career
+    for skills, matches in ((["Wound Dressing"], True), (["Triage Protocols"], False)):
+        catalog = catalog_with_skills(*skills)
+        assert skill_matches_career(catalog.get("Nurse"), "wound", catalog.ontology) == matches
@@ -0,0 +1,60 @@
+"""Tests for what_if: incremental re-ranking must match a full recompute"""
+
+import pytest
+
+from recommendation_engine import get_career_recommendations
+from what_if import apply_change, get_score_state, what_if_recommendations
+
+BASE_ANSWERS = {
+    "interests": ["technology", "science"],
+    "skills": ["analytical", "programming"],
+    "values": ["salary"],
+    "personality": "analytical",
+    "education": "bachelor",
+    "work_environment": ["office"],
+}
+
+CHANGES = [
+    {"field": "skills", "add": "communication"},
+    {"field": "skills", "remove": "programming"},
+    {"field": "interests", "set": ["healthcare"]},
+    {"field": "values", "add": "helping_others"},
+    {"field": "personality", "set": "social"},
+    {"field": "education", "set": "master"},
+    {"field": "work_environment", "set": "remote"},
+]
+
+def ranking(recommendations):
+    return [(recommendation["career"], recommendation["score"]) for recommendation in recommendations]
+
+@pytest.mark.parametrize("changes", [[change] for change in CHANGES] + [CHANGES])
+def test_what_if_matches_a_full_recompute(changes):
+    result = what_if_recommendations(changes=changes, limit=5, **BASE_ANSWERS)
+    answers = result["answers"]
+    expected = get_career_recommendations(answers["interests"], answers["skills"], answers["values"],
+                                          answers["personality"], answers["education"],
+                                          answers["work_environment"], limit=5)
+    assert ranking(result["recommendations"]) == ranking(expected)
+    assert result["recommendations"] == expected
+
+def test_score_changes_are_against_the_unchanged_answers():
+    result = what_if_recommendations(changes=[{"field": "skills", "add": "communication"}], limit=5, **BASE_ANSWERS)
+    base = get_career_recommendations(limit=50, **BASE_ANSWERS)
+    base_scores = dict(ranking(base))
+    for career, score in ranking(result["recommendations"]):
+        assert result["score_changes"][career] == score - base_scores.get(career, 0)
+
+def test_change_that_keeps_the_answers_returns_the_same_state():
+    state = get_score_state(**BASE_ANSWERS)
+    assert apply_change(state, {"field": "skills", "add": "analytical"}) is state
+
+@pytest.mark.parametrize("change", [
+    "skills",
+    {"field": "bogus", "set": "x"},
+    {"field": "personality", "add": "social"},
+    {"field": "skills", "set": [1, 2]},
+    {"field": "skills"},
+])
+def test_malformed_changes_are_rejected(change):
+    with pytest.raises(ValueError):
+        what_if_recommendations(changes=[change], **BASE_ANSWERS)
@@ -0,0 +1,211 @@
+# Transition planner module - cheapest multi-step path between two careers
+#
+# Careers form a graph: every career links, in both directions, to the careers
+# in its related_careers list and to its closest skill neighbours. Moving to
+# another career costs a fixed hop cost plus the square of the number of target
+# skills the current career lacks plus a penalty on the square of the education
+# levels gained, so several small moves can beat one large retraining. A direct
+# switch to the target is always possible, so a multi-step path is only
+# suggested when stepping stones make it cheaper. The graph is laid out once per catalog in compressed
+# adjacency arrays; queries run A* toward the target with an admissible
+# skill/education bound and solved paths are cached per source career.
+
+import heapq
+import logging
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import chain
+
+from catalog import get_catalog
+from scoring import MAX_EDUCATION_LEVEL, education_match
+from transitions import compute_transition
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+HOP_COST = 4                    # Fixed cost of every career change
+EDUCATION_STEP_COST = 3         # Cost per squared education level the next career requires beyond the current one
+SKILL_NEIGHBOURS = 3            # Closest careers by shared skills linked from each career
+MAX_SKILL_POSTINGS = 64         # Skills required by more careers than this are too common to link careers
+PATH_CACHE_SOURCES = 1024       # Source careers whose solved paths are kept
+
+_UNREACHED = 0xFFFFFFFF
+
+def required_education_level(record):
+    """Lowest questionnaire education level that meets a career's requirement, 0 if none is named"""
+    for level in range(1, MAX_EDUCATION_LEVEL + 1):
+        if education_match(record, level):
+            return level
+    return 0
+
+class TransitionGraph:
+    """Career transition graph in compressed adjacency arrays, with paths cached per source"""
+
+    def __init__(self, catalog, skill_neighbours=SKILL_NEIGHBOURS, max_skill_postings=MAX_SKILL_POSTINGS):
+        self.catalog = catalog
+        self.skill_masks = tuple(record.skill_mask for record in catalog)
+        self.education_levels = array("B", (required_education_level(record) for record in catalog))
+
+        neighbours = [set() for _ in range(len(catalog))]
+        for record in catalog:
+            for related in record.details.get("related_careers", ()):
+                other = catalog.get(related)
+                if other is not None and other.id != record.id:
+                    neighbours[record.id].add(other.id)
+                    neighbours[other.id].add(record.id)
+
+        # Link each career to the careers it shares the most distinctive skills with
+        postings = {}
+        for record in catalog:
+            for skill_id in set(record.skill_ids):
+                postings.setdefault(skill_id, []).append(record.id)
+        for record in catalog:
+            shared = {}
+            for skill_id in set(record.skill_ids):
+                careers = postings[skill_id]
+                if len(careers) <= max_skill_postings:
+                    for other_id in careers:
+                        shared[other_id] = shared.get(other_id, 0) + 1
+            shared.pop(record.id, None)
+            for other_id in heapq.nsmallest(skill_neighbours, shared, key=lambda other_id: (-shared[other_id], other_id)):
+                neighbours[record.id].add(other_id)
+                neighbours[other_id].add(record.id)
+
+        # Compressed sparse rows: edges of career i are targets[offsets[i]:offsets[i + 1]]
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        self.weights = array("H")
+        for source_id, targets in enumerate(neighbours):
+            for target_id in sorted(targets):
+                self.targets.append(target_id)
+                self.weights.append(self.edge_cost(source_id, target_id))
+            self.offsets.append(len(self.targets))
+
+        self._paths = OrderedDict()
+        self._lock = threading.Lock()
+        logger.debug(f"Built transition graph with {len(catalog)} careers and {len(self.targets)} edges")
+
+    def edge_cost(self, source_id, target_id):
+        """Cost of moving directly from one career to another"""
+        skill_gap = (self.skill_masks[target_id] & ~self.skill_masks[source_id]).bit_count()
+        education_jump = max(0, self.education_levels[target_id] - self.education_levels[source_id])
+        return HOP_COST + skill_gap ** 2 + EDUCATION_STEP_COST * education_jump ** 2
+
+    def edges(self, career_id):
+        """Yield (target_id, cost) for the outgoing edges of a career"""
+        for position in range(self.offsets[career_id], self.offsets[career_id + 1]):
+            yield self.targets[position], self.weights[position]
+
+    def _lower_bound(self, career_id, target_id):
+        """
+        Admissible estimate of the remaining cost to the target.
+
+        The missing skills and education levels have to be gained over some
+        number of moves k; spread evenly, that costs at least
+        k * HOP_COST + (skills ** 2 + EDUCATION_STEP_COST * levels ** 2) / k,
+        which is never below 2 * sqrt(HOP_COST * (skills ** 2 + ...)).
+        """
+        if career_id == target_id:
+            return 0
+        skill_gap = (self.skill_masks[target_id] & ~self.skill_masks[career_id]).bit_count()
+        education_jump = max(0, self.education_levels[target_id] - self.education_levels[career_id])
+        return 2 * math.sqrt(HOP_COST * (skill_gap ** 2 + EDUCATION_STEP_COST * education_jump ** 2))
+
+    def _search(self, source_id, target_id):
+        """A* from source to target over the graph edges plus a direct switch to the target"""
+        costs = {source_id: 0}
+        predecessors = {source_id: None}
+        queue = [(self._lower_bound(source_id, target_id), 0, source_id)]
+        while queue:
+            _, cost, career_id = heapq.heappop(queue)
+            if career_id == target_id:
+                break
+            if cost > costs[career_id]:
+                continue
+            moves = self.edges(career_id)
+            for next_id, weight in chain(moves, ((target_id, self.edge_cost(career_id, target_id)),)):
+                next_cost = cost + weight
+                if next_cost < costs.get(next_id, _UNREACHED):
+                    costs[next_id] = next_cost
+                    predecessors[next_id] = career_id
+                    heapq.heappush(queue, (next_cost + self._lower_bound(next_id, target_id), next_cost, next_id))
+
+        path = [target_id]
+        while predecessors[path[-1]] is not None:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        return tuple(path), costs[target_id]
+
+    def shortest_path(self, source_id, target_id):
+        """
+        Cheapest chain of career changes from source to target.
+
+        Returns:
+            Tuple (career ids from source to target, total cost)
+        """
+        with self._lock:
+            paths = self._paths.get(source_id)
+            if paths is not None:
+                self._paths.move_to_end(source_id)
+                if target_id in paths:
+                    return paths[target_id]
+        result = self._search(source_id, target_id)
+        with self._lock:
+            self._paths.setdefault(source_id, {})[target_id] = result
+            self._paths.move_to_end(source_id)
+            while len(self._paths) > PATH_CACHE_SOURCES:
+                self._paths.popitem(last=False)
+        return result
+
+def get_transition_graph(catalog=None):
+    """Return the transition graph for a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("transition_graph", TransitionGraph)
+
+def plan_career_transition(current_career, target_career, catalog=None):
+    """
+    Plan the cheapest sequence of career moves from one career to another.
+
+    Args:
+        current_career: Name of the user's current career
+        target_career: Name of the career the user wants to reach
+
+    Returns:
+        Dictionary with the path, its total cost and the transition details of each step
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    source = catalog.get(current_career)
+    target = catalog.get(target_career)
+    plan = {
+        "current_career": current_career,
+        "target_career": target_career,
+        "found": False,
+        "path": [],
+        "total_cost": None,
+        "steps": [],
+    }
+    if source is None or target is None:
+        return plan
+
+    graph = get_transition_graph(catalog)
+    path, total_cost = graph.shortest_path(source.id, target.id)
+
+    plan["found"] = True
+    plan["path"] = [catalog.records[career_id].name for career_id in path]
+    plan["total_cost"] = total_cost
+    for from_id, to_id in zip(path, path[1:]):
+        step_from = catalog.records[from_id]
+        step_to = catalog.records[to_id]
+        transition = compute_transition(step_from, step_to, step_to.details)
+        plan["steps"].append({
+            "from": step_from.name,
+            "to": step_to.name,
+            "cost": graph.edge_cost(from_id, to_id),
+            "level": transition.level,
+            "skill_overlap_percentage": transition.skill_overlap_percentage,
+            "skill_gap": list(transition.skill_gap),
+            "additional_education": list(transition.additional_education),
+        })
+    return plan
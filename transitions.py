@@ -0,0 +1,153 @@
+# Transition module - precomputed pairwise transition data between careers
+#
+# Skill overlap (shared canonical skills) for every ordered pair of careers is
+# computed once per catalog from an inverted skill index, so only pairs that
+# share a skill do any work. Catalogs up to DENSE_MAX_CAREERS keep a dense
+# N x N table of overlap counts for O(1) lookups; larger catalogs keep sparse
+# per-source rows. Difficulty, overlap percentage, skill gap and extra
+# education are derived from the stored count and the careers' skill bitsets
+# on lookup.
+
+import logging
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from catalog import get_catalog
+from skill_ontology import has_skill
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DENSE_MAX_CAREERS = 2048
+
+# Minimum skill overlap percentage for each difficulty level, checked in order
+DIFFICULTY_LEVELS = [
+    (70, "Easy", "The careers have significant skill overlap, making this a natural transition."),
+    (40, "Moderate", "You'll need to develop some new skills, but there's meaningful overlap."),
+    (0, "Challenging", "These careers require substantially different skillsets, requiring significant retraining."),
+]
+
+Transition = namedtuple("Transition", [
+    "level", "description", "skill_overlap_percentage",
+    "skill_gap",               # Lowercase skills of the target career whose canonical skill the source lacks
+    "additional_education",
+])
+
+def difficulty_for(skill_match_pct):
+    """Return (level, description) for a skill overlap percentage"""
+    for minimum_pct, level, description in DIFFICULTY_LEVELS:
+        if skill_match_pct >= minimum_pct:
+            return level, description
+    return DIFFICULTY_LEVELS[-1][1:]
+
+def _skill_gap(target, source_mask):
+    """Lowercase required skills of the target whose canonical skill is not in source_mask"""
+    return tuple(dict.fromkeys(skill for skill, skill_id in zip(target.skills_lower, target.skill_ids)
+                               if not has_skill(source_mask, skill_id)))
+
+def compute_transition(source, target, target_details):
+    """
+    Transition data computed directly from two career records.
+
+    Args:
+        source: CareerRecord of the current career, or None if unknown
+        target: CareerRecord of the target career, or None if unknown
+        target_details: Details mapping of the target career
+
+    Returns:
+        Transition
+    """
+    source_mask = source.skill_mask if source else 0
+    target_mask = target.skill_mask if target else 0
+    target_total = target_mask.bit_count()
+    overlap = (source_mask & target_mask).bit_count()
+    skill_match_pct = (overlap / target_total) * 100 if target_total else 0
+    level, description = difficulty_for(skill_match_pct)
+    additional_education = ()
+    if (target.education_lower if target else "") not in (source.education_lower if source else ""):
+        additional_education = (target_details.get("required_education", ""),)
+    skill_gap = _skill_gap(target, source_mask) if target else ()
+    return Transition(level, description, round(skill_match_pct, 1), skill_gap, additional_education)
+
+class TransitionMatrix:
+    """All-pairs skill overlap between the careers of a catalog"""
+
+    def __init__(self, catalog, dense_max=DENSE_MAX_CAREERS):
+        self.catalog = catalog
+        size = len(catalog)
+
+        # Distinct canonical skills of each career
+        skill_ids = [tuple(dict.fromkeys(record.skill_ids)) for record in catalog]
+        self.skill_ids = tuple(skill_ids)
+
+        # Inverted index: skill id -> careers requiring it
+        postings = {}
+        for career_id, ids in enumerate(skill_ids):
+            for skill_id in ids:
+                postings.setdefault(skill_id, array("I")).append(career_id)
+
+        self.dense = size <= dense_max
+        if self.dense:
+            self._overlaps = array("H", bytes(2 * size * size))
+        else:
+            self._targets = []
+            self._counts = []
+        pairs = 0
+        for source_id, ids in enumerate(skill_ids):
+            counts = {}
+            for skill_id in ids:
+                for target_id in postings[skill_id]:
+                    counts[target_id] = counts.get(target_id, 0) + 1
+            pairs += len(counts)
+            if self.dense:
+                row = source_id * size
+                for target_id, count in counts.items():
+                    self._overlaps[row + target_id] = count
+            else:
+                targets = sorted(counts)
+                self._targets.append(array("I", targets))
+                self._counts.append(array("H", (counts[target_id] for target_id in targets)))
+        logger.debug(f"Built {'dense' if self.dense else 'sparse'} transition matrix for {size} careers, "
+                     f"{pairs} overlapping pairs")
+
+    def overlap(self, source_id, target_id):
+        """Number of distinct skills two careers share"""
+        if self.dense:
+            return self._overlaps[source_id * len(self.skill_ids) + target_id]
+        targets = self._targets[source_id]
+        position = bisect_left(targets, target_id)
+        if position < len(targets) and targets[position] == target_id:
+            return self._counts[source_id][position]
+        return 0
+
+    def transition(self, source_id, target_id):
+        """Transition data for moving from the source career to the target career"""
+        target_skills = self.skill_ids[target_id]
+        overlap = self.overlap(source_id, target_id)
+        skill_match_pct = (overlap / len(target_skills)) * 100 if target_skills else 0
+        level, description = difficulty_for(skill_match_pct)
+
+        source = self.catalog.records[source_id]
+        target = self.catalog.records[target_id]
+        skill_gap = _skill_gap(target, source.skill_mask)
+
+        # Suggest education or certification needs
+        additional_education = ()
+        if target.education_lower not in source.education_lower:
+            additional_education = (target.details.get("required_education", ""),)
+
+        return Transition(level, description, round(skill_match_pct, 1), skill_gap, additional_education)
+
+    def transition_between(self, career1, career2):
+        """Transition data by career name; careers outside the catalog have no skills"""
+        source = self.catalog.get(career1)
+        target = self.catalog.get(career2)
+        if source is not None and target is not None:
+            return self.transition(source.id, target.id)
+        return compute_transition(source, target, self.catalog.details(career2))
+
+def get_transition_matrix(catalog=None):
+    """Return the transition matrix for a catalog, building it on first use"""
+    catalog = catalog if catalog is not None else get_catalog()
+    return catalog.derived("transitions", TransitionMatrix)
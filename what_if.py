@@ -0,0 +1,174 @@
+# What-if module - incremental re-ranking for single-answer changes
+#
+# A ScoreState keeps the per-family score contributions (skills, interests,
+# education, environments, values, personality) behind one set of
+# questionnaire answers. Changing an answer recomputes only that family's
+# contributions and adjusts the totals of the careers they touch; the top-k is
+# then re-selected from the running totals without rescoring the catalog.
+# Base states are cached per canonical answers, so interactive requests from
+# the results page start warm.
+
+import logging
+
+from catalog import get_catalog
+from recommendation_engine import materialize_recommendations
+from result_cache import ResultCache, canonical_answers
+from scoring import get_scoring_index
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Questionnaire answers in canonical_answers() order, and the scoring family each feeds
+ANSWER_FIELDS = ("interests", "skills", "values", "personality", "education", "work_environment")
+ANSWER_FAMILIES = {
+    "interests": "interests",
+    "skills": "skills",
+    "values": "values",
+    "personality": "personality",
+    "education": "education",
+    "work_environment": "environments",
+}
+LIST_ANSWER_FIELDS = ("interests", "skills", "values", "work_environment")
+
+def _encode(index, answers):
+    """Encode canonical answers as a scoring query"""
+    interests, skills, values, personality, education, work_environment = answers
+    return index.encode_profile(list(interests), list(skills), list(values), personality,
+                                education, list(work_environment))
+
+class ScoreState:
+    """Scores of every career for one set of answers, split by feature family"""
+
+    def __init__(self, index, answers, columns=None, totals=None):
+        self.index = index
+        self.answers = answers
+        self.query = _encode(index, answers)
+        if columns is None:
+            columns = index.contributions(self.query)
+            totals = [0] * len(index.features)
+            for column in columns.values():
+                for career_id, points in column.items():
+                    totals[career_id] += points
+        self.columns = columns
+        self.totals = totals
+
+    def answer(self, field):
+        """Current answer for a questionnaire field"""
+        return self.answers[ANSWER_FIELDS.index(field)]
+
+    def changed(self, field, answer):
+        """
+        State for the same answers with one field replaced.
+
+        Only the field's family is rescored; the other families' contributions
+        are shared with this state.
+        """
+        answers = dict(zip(ANSWER_FIELDS, self.answers))
+        answers[field] = answer
+        answers = canonical_answers(*(answers[name] for name in ANSWER_FIELDS))
+        if answers == self.answers:
+            return self
+
+        family = ANSWER_FAMILIES[field]
+        state = ScoreState(self.index, answers, dict(self.columns), list(self.totals))
+        new_column = self.index.contributions(state.query, families=(family,))[family]
+        for career_id, points in self.columns[family].items():
+            state.totals[career_id] -= points
+        for career_id, points in new_column.items():
+            state.totals[career_id] += points
+        state.columns[family] = new_column
+        return state
+
+    def top(self, limit):
+        """List of (career_id, score) for the best careers, best first"""
+        return [(career_id, self.totals[career_id]) for career_id in self.index.top_k(self.totals, limit)]
+
+def apply_change(state, change):
+    """
+    Apply one what-if change to a score state.
+
+    Args:
+        state: ScoreState to start from
+        change: Dictionary with a "field" from ANSWER_FIELDS and one of
+            "add" or "remove" (list fields) or "set" (any field)
+
+    Returns:
+        ScoreState for the changed answers
+
+    Raises:
+        ValueError: If the change is malformed
+    """
+    if not isinstance(change, dict):
+        raise ValueError("Each change must be an object")
+    field = change.get("field")
+    if field not in ANSWER_FIELDS:
+        raise ValueError(f"Unknown field: {field}")
+
+    if "set" in change:
+        answer = change["set"]
+        if field in LIST_ANSWER_FIELDS:
+            answer = [answer] if isinstance(answer, str) else answer
+            if not isinstance(answer, list) or not all(isinstance(item, str) for item in answer):
+                raise ValueError(f"{field} must be set to a list of strings")
+        elif not isinstance(answer, str):
+            raise ValueError(f"{field} must be set to a string")
+        return state.changed(field, answer)
+
+    if field not in LIST_ANSWER_FIELDS:
+        raise ValueError(f"{field} only supports set")
+    current = list(state.answer(field))
+    if isinstance(change.get("add"), str):
+        return state.changed(field, current + [change["add"]])
+    if isinstance(change.get("remove"), str):
+        return state.changed(field, [item for item in current if item != change["remove"]])
+    raise ValueError("Each change needs add, remove or set")
+
+# Base states of recently seen questionnaire answers
+score_state_cache = ResultCache(max_entries=256)
+
+def get_score_state(interests, skills, values, personality, education, work_environment, catalog=None):
+    """Return the score state for a set of answers, building it on a cache miss"""
+    catalog = catalog if catalog is not None else get_catalog()
+    answers = canonical_answers(interests, skills, values, personality, education, work_environment)
+    state = score_state_cache.get(answers, catalog.generation)
+    if state is None:
+        state = ScoreState(get_scoring_index(catalog), answers)
+        score_state_cache.set(answers, catalog.generation, state)
+    return state
+
+def what_if_recommendations(interests, skills, values, personality, education, work_environment, changes,
+                            limit=5, catalog=None):
+    """
+    Recommendations for the given answers after applying what-if changes.
+
+    Args:
+        interests, skills, values, personality, education, work_environment:
+            The answers the changes apply to
+        changes: List of changes, see apply_change()
+        limit: Maximum number of recommendations to return
+
+    Returns:
+        Dictionary with the changed answers, the recommendations for them and
+        each recommended career's score change against the unchanged answers
+
+    Raises:
+        ValueError: If a change is malformed
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    base = get_score_state(interests, skills, values, personality, education, work_environment, catalog=catalog)
+    state = base
+    for change in changes:
+        state = apply_change(state, change)
+
+    answers = dict(zip(ANSWER_FIELDS, state.answers))
+    ranked = state.top(limit)
+    recommendations = materialize_recommendations(
+        catalog, ranked, list(answers["interests"]), list(answers["skills"]), list(answers["values"]),
+        answers["personality"], answers["education"], list(answers["work_environment"]))
+    return {
+        "answers": {field: list(answer) if field in LIST_ANSWER_FIELDS else answer
+                    for field, answer in answers.items()},
+        "recommendations": recommendations,
+        "score_changes": {catalog.records[career_id].name: score - base.totals[career_id]
+                          for career_id, score in ranked},
+    }